@@ -41,7 +41,11 @@ def initialize_firebase() -> firestore.Client:
             cred_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
             if cred_path and os.path.exists(cred_path):
                 cred = credentials.Certificate(cred_path)
-                _app = firebase_admin.initialize_app(cred)
+                # Optional project override so separate test workers get
+                # separate namespaces on one emulator
+                project_id = os.getenv("FIRESTORE_PROJECT_ID")
+                options = {"projectId": project_id} if project_id else None
+                _app = firebase_admin.initialize_app(cred, options)
             else:
                 # No credentials file - will fail
                 # Emulator needs SOME credential to init, even if it doesn't use it
@@ -63,11 +67,16 @@ def get_db() -> firestore.Client:
 
     Imperative Shell - returns initialized database client
 
+    The client is created once (on first call) and cached in ``_db``, so
+    every later call reuses the same credentials and gRPC channel. The cache
+    is a plain module global rather than ``lru_cache`` so tests can swap
+    ``_db`` for a mock.
+
     Returns:
         Firestore client instance
 
     Raises:
-        RuntimeError if Firebase not initialized
+        RuntimeError if emulator credentials are missing on first call
     """
     if _db is None:
         return initialize_firebase()
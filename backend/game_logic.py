@@ -10,6 +10,7 @@ All betting calculations, scoring rules, and game state transitions live here.
 """
 
 import random
+import re
 from typing import Dict, List, Optional
 from models.bet import Bet, BetStatus
 from models.user import User
@@ -91,7 +92,8 @@ def calculate_scores(
 
     Args:
         user_bets: List of all bets placed for this bet
-        users: Map of user_id to User objects
+        users: Map of user_id to User objects (not needed for the payout
+            itself; see calculate_payouts)
         winning_option: The winning option
         bet_cost: Points cost per bet (from bet.points_value)
 
@@ -107,33 +109,50 @@ def calculate_scores(
         >>> calculate_scores(user_bets, users, "Oppenheimer", 100)
         {"user1": 166, "user2": 166, "user3": 166, "user4": 0, "user5": 0}
     """
+    return calculate_payouts(user_bets, winning_option, bet_cost)
+
+
+def calculate_payouts(
+    user_bets: List[UserBet],
+    winning_option: str,
+    bet_cost: int,
+) -> Dict[str, int]:
+    """Calculate points won per bettor from the user bets alone
+
+    Pure function - deterministic based on inputs only
+
+    Payouts depend only on who picked what, not on current balances, so
+    callers that apply them as increments don't need to load users.
+
+    Args:
+        user_bets: List of all bets placed for this bet
+        winning_option: The winning option
+        bet_cost: Points cost per bet (from bet.points_value)
+
+    Returns:
+        Dictionary mapping user_id to points_won (same rules as
+        calculate_scores)
+    """
     if not user_bets:
         return {}
 
-    # Separate winners from losers
-    winners = [ub for ub in user_bets if ub.is_winner(winning_option)]
-    losers = [ub for ub in user_bets if not ub.is_winner(winning_option)]
+    # Classify each bet once; everything below reuses these flags
+    won = [ub.is_winner(winning_option) for ub in user_bets]
+    num_winners = sum(won)
 
-    # Calculate pot
-    total_pot = len(user_bets) * bet_cost
-
-    # Edge case: Everyone picked the same option
-    if not losers or not winners:
+    # Edge case: Everyone picked the same option, or no one picked the winner
+    if num_winners == 0 or num_winners == len(user_bets):
         # Refund everyone (no point changes)
         return {ub.user_id: bet_cost for ub in user_bets}
 
-    # Split pot evenly among winners
-    points_per_winner = total_pot // len(winners)
-
-    # Build result map
-    result = {}
-    for winner in winners:
-        result[winner.user_id] = points_per_winner
-
-    for loser in losers:
-        result[loser.user_id] = 0
+    # Split pot evenly among winners; losers get 0
+    total_pot = len(user_bets) * bet_cost
+    points_per_winner = total_pot // num_winners
 
-    return result
+    return {
+        ub.user_id: points_per_winner if is_win else 0
+        for ub, is_win in zip(user_bets, won)
+    }
 
 
 def validate_bet_eligibility(
@@ -157,10 +176,10 @@ def validate_bet_eligibility(
         - (True, None) if valid
         - (False, "error message") if invalid
 
-    Validation rules:
+    Validation rules (checked in this order, cheapest first):
         1. Bet must be in OPEN status
-        2. User must have enough points
-        3. User cannot have already bet on this bet
+        2. A user who already bet may change their pick (no extra cost)
+        3. Otherwise the user must have enough points
     """
     # Rule 1: Bet must be open
     if not bet.can_accept_bets():
@@ -215,6 +234,15 @@ def distribute_pot(
     return {user_id: points_per_winner for user_id in winners}
 
 
+def _leaderboard_sort_key(user) -> tuple:
+    """Sort key for User/RoomUser leaderboards: points desc, join time asc
+
+    sort() calls this once per element, not per comparison, and datetime
+    comparison runs in C, so the tuple key needs no further precomputing.
+    """
+    return (-user.points, user.joined_at)
+
+
 def calculate_leaderboard(users: Dict[str, User]) -> List[Dict[str, any]]:
     """Calculate leaderboard sorted by points
 
@@ -231,27 +259,21 @@ def calculate_leaderboard(users: Dict[str, User]) -> List[Dict[str, any]]:
         1. Points (descending)
         2. Join time (ascending) - earlier join wins ties
     """
-    # Convert to list and sort
-    user_list = list(users.values())
-
-    # Sort by points (desc), then by joined_at (asc)
-    sorted_users = sorted(
-        user_list,
-        key=lambda u: (-u.points, u.joined_at),
-    )
+    # Copy to a list and sort it in place (no second list from sorted())
+    sorted_users = list(users.values())
+    sorted_users.sort(key=_leaderboard_sort_key)
 
     # Build leaderboard with ranks
-    leaderboard = []
-    for rank, user in enumerate(sorted_users, start=1):
-        leaderboard.append({
+    return [
+        {
             "userId": user.user_id,
             "nickname": user.nickname,
             "points": user.points,
             "rank": rank,
             "isAdmin": user.is_admin,
-        })
-
-    return leaderboard
+        }
+        for rank, user in enumerate(sorted_users, start=1)
+    ]
 
 
 def calculate_room_user_leaderboard(room_users: List[RoomUser]) -> List[Dict[str, any]]:
@@ -265,22 +287,18 @@ def calculate_room_user_leaderboard(room_users: List[RoomUser]) -> List[Dict[str
     Returns:
         Sorted leaderboard data
     """
-    sorted_users = sorted(
-        room_users,
-        key=lambda u: (-u.points, u.joined_at),
-    )
+    sorted_users = sorted(room_users, key=_leaderboard_sort_key)
 
-    leaderboard = []
-    for rank, ru in enumerate(sorted_users, start=1):
-        leaderboard.append({
+    return [
+        {
             "userId": ru.user_id,
             "nickname": ru.nickname,
             "points": ru.points,
             "rank": rank,
             "isHost": ru.is_host,
-        })
-
-    return leaderboard
+        }
+        for rank, ru in enumerate(sorted_users, start=1)
+    ]
 
 
 def aggregate_tournament_leaderboard(
@@ -340,6 +358,11 @@ def aggregate_tournament_leaderboard(
     return leaderboard
 
 
+# Valid legacy 4-char code: uppercase letters and digits without O, I, 1, L,
+# with at least one letter (str.isupper() is False for all-digit strings)
+_LEGACY_ROOM_CODE_RE = re.compile(r"(?=.*[A-Z])[A-HJKMNP-Z02-9]{4}")
+
+
 def validate_room_code(code: str) -> tuple[bool, Optional[str]]:
     """Validate room code format (supports both 4-char legacy and 6-char new format)
 
@@ -354,6 +377,11 @@ def validate_room_code(code: str) -> tuple[bool, Optional[str]]:
     if len(code) == 6:
         return validate_room_code_v2(code)
 
+    # Fast path: a well-formed code is one precompiled regex match. Anything
+    # else falls through to the checks below, which pick the error message.
+    if _LEGACY_ROOM_CODE_RE.fullmatch(code):
+        return True, None
+
     if len(code) != 4:
         return False, "Room code must be 4 or 6 characters"
 
@@ -388,9 +416,6 @@ def validate_nickname(nickname: str) -> tuple[bool, Optional[str]]:
     if len(nickname) > 20:
         return False, "Nickname must be 20 characters or less"
 
-    if len(nickname) < 1:
-        return False, "Nickname must be at least 1 character"
-
     return True, None
 
 
@@ -40,14 +40,35 @@ app = FastAPI(
     version="0.3.0",
 )
 
+
+class AllowlistCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that checks origins against a frozenset.
+
+    Starlette keeps ``allow_origins`` as the sequence it was given and scans
+    it on every request. The allowlist is fixed at startup, so store it as a
+    frozenset for O(1) membership in ``is_allowed_origin``.
+    """
+
+    def __init__(self, app, **kwargs) -> None:
+        super().__init__(app, **kwargs)
+        self.allow_origins = frozenset(self.allow_origins)
+
+
+def _parse_origins(raw: str) -> list[str]:
+    """Split a comma-separated origins value, trimming blanks."""
+    return [origin.strip() for origin in raw.split(",") if origin.strip()]
+
+
 # CORS middleware - restrict to known origins in production
-ALLOWED_ORIGINS = os.environ.get(
-    "CORS_ORIGINS",
-    "http://localhost:5173,http://localhost:3000,https://smallbets.live,https://www.smallbets.live",
-).split(",")
+ALLOWED_ORIGINS = _parse_origins(
+    os.environ.get(
+        "CORS_ORIGINS",
+        "http://localhost:5173,http://localhost:3000,https://smallbets.live,https://www.smallbets.live",
+    )
+)
 
 app.add_middleware(
-    CORSMiddleware,
+    AllowlistCORSMiddleware,
     allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
@@ -3,11 +3,15 @@
 from datetime import datetime, timedelta, timezone
 from typing import Optional, List
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BetStatus(str, Enum):
-    """Bet status enum"""
+    """Bet status enum
+
+    Members are singletons and the status field always holds one (Pydantic
+    coerces raw strings), so hot-path checks compare with ``is``.
+    """
     PENDING = "pending"  # Created but not yet opened
     OPEN = "open"  # Users can place bets
     LOCKED = "locked"  # Betting closed, waiting for resolution
@@ -20,6 +24,8 @@ class Bet(BaseModel):
     Follows FCIS pattern: pure data model with no I/O
     """
 
+    model_config = ConfigDict(frozen=True)
+
     bet_id: str = Field(..., description="Unique bet identifier")
     room_code: str = Field(..., min_length=4, max_length=6)
     question: str = Field(..., min_length=1, description="Betting question")
@@ -71,7 +77,11 @@ class Bet(BaseModel):
 
     @classmethod
     def from_dict(cls, data: dict) -> "Bet":
-        """Deserialize from Firestore"""
+        """Deserialize from Firestore
+
+        Validated like any other input: stored documents may predate the
+        current schema, and bad data should fail here, not far downstream.
+        """
         return cls(
             bet_id=data["betId"],
             room_code=data["roomCode"],
@@ -95,15 +105,15 @@ class Bet(BaseModel):
 
     def can_accept_bets(self) -> bool:
         """Check if bet is accepting user bets"""
-        return self.status == BetStatus.OPEN and not self.betting_locked
+        return self.status is BetStatus.OPEN and not self.betting_locked
 
     def is_resolved(self) -> bool:
         """Check if bet has been resolved"""
-        return self.status == BetStatus.RESOLVED
+        return self.status is BetStatus.RESOLVED
 
     def can_undo(self) -> bool:
         """Check if bet resolution can be undone (within 10s window)"""
-        if self.status != BetStatus.RESOLVED or self.can_undo_until is None:
+        if self.status is not BetStatus.RESOLVED or self.can_undo_until is None:
             return False
         now = datetime.now(timezone.utc)
         deadline = self.can_undo_until
@@ -2,7 +2,7 @@
 
 from datetime import datetime, timedelta
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class MatchDetails(BaseModel):
@@ -48,6 +48,8 @@ class Room(BaseModel):
     - "match": Match room linked to a tournament (manual close, no expiry)
     """
 
+    model_config = ConfigDict(frozen=True)
+
     code: str = Field(..., min_length=4, max_length=6, description="4-6 character room code")
     event_template: str = Field(..., description="Event template ID (grammys-2026, ipl-2026, etc.)")
     event_name: Optional[str] = Field(default=None, description="Custom event name")
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class User(BaseModel):
@@ -11,6 +11,8 @@ class User(BaseModel):
     Follows FCIS pattern: pure data model with no I/O
     """
 
+    model_config = ConfigDict(frozen=True)
+
     user_id: str = Field(..., description="Auto-generated user ID")
     room_code: str = Field(..., min_length=4, max_length=6)
     nickname: str = Field(..., min_length=1, max_length=20, description="Display name")
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class UserBet(BaseModel):
@@ -11,6 +11,8 @@ class UserBet(BaseModel):
     Follows FCIS pattern: pure data model with no I/O
     """
 
+    model_config = ConfigDict(frozen=True)
+
     user_id: str = Field(..., description="User who placed the bet")
     bet_id: str = Field(..., description="Bet being placed on")
     room_code: str = Field(..., min_length=4, max_length=6)
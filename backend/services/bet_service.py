@@ -6,18 +6,48 @@ IMPERATIVE SHELL: This module performs I/O operations
 
 import uuid
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 from google.cloud import firestore
 
 from models.bet import Bet, BetStatus
 from models.user_bet import UserBet
 from models.user import User
-from models.room_user import RoomUser
 import game_logic
 from firebase_config import get_db
 from services import user_service, room_service
 
 
+def _build_new_bet(
+    room_code: str,
+    question: str,
+    options: List[str],
+    points_value: int,
+    resolve_patterns: Optional[List[str]],
+    bet_type: str,
+    created_from: str,
+    template_id: Optional[str],
+    timer_duration: int,
+    initial_status: str,
+) -> Bet:
+    """Build a new Bet with a fresh ID (no I/O)"""
+    status = BetStatus.PENDING if initial_status == "pending" else BetStatus.OPEN
+
+    return Bet(
+        bet_id=str(uuid.uuid4()),
+        room_code=room_code,
+        question=question,
+        options=options,
+        status=status,
+        opened_at=datetime.utcnow() if status == BetStatus.OPEN else None,
+        points_value=points_value,
+        resolve_patterns=resolve_patterns,
+        bet_type=bet_type,
+        created_from=created_from,
+        template_id=template_id,
+        timer_duration=timer_duration,
+    )
+
+
 async def create_bet(
     room_code: str,
     question: str,
@@ -36,27 +66,43 @@ async def create_bet(
         initial_status: "open" to create and open immediately, "pending" to add to bet queue
     """
     db = get_db()
-    bet_id = str(uuid.uuid4())
+    bet = _build_new_bet(
+        room_code, question, options, points_value, resolve_patterns,
+        bet_type, created_from, template_id, timer_duration, initial_status,
+    )
 
-    status = BetStatus.PENDING if initial_status == "pending" else BetStatus.OPEN
+    bet_ref = db.collection("bets").document(bet.bet_id)
+    bet_ref.set(bet.to_dict())
+    return bet
 
-    bet = Bet(
-        bet_id=bet_id,
-        room_code=room_code,
-        question=question,
-        options=options,
-        status=status,
-        opened_at=datetime.utcnow() if status == BetStatus.OPEN else None,
-        points_value=points_value,
-        resolve_patterns=resolve_patterns,
-        bet_type=bet_type,
-        created_from=created_from,
-        template_id=template_id,
-        timer_duration=timer_duration,
+
+async def create_bet_tx(
+    batch,
+    room_code: str,
+    question: str,
+    options: List[str],
+    points_value: int,
+    resolve_patterns: Optional[List[str]] = None,
+    bet_type: str = "in-game",
+    created_from: str = "custom",
+    template_id: Optional[str] = None,
+    timer_duration: int = 0,
+    initial_status: str = "open",
+) -> Bet:
+    """Create a new bet, queueing the write on an outer batch
+
+    No I/O: the write lands when the caller commits ``batch`` (a Firestore
+    WriteBatch or Transaction), so several documents can be seeded in one
+    round-trip.
+    """
+    db = get_db()
+    bet = _build_new_bet(
+        room_code, question, options, points_value, resolve_patterns,
+        bet_type, created_from, template_id, timer_duration, initial_status,
     )
 
-    bet_ref = db.collection("bets").document(bet_id)
-    bet_ref.set(bet.to_dict())
+    bet_ref = db.collection("bets").document(bet.bet_id)
+    batch.set(bet_ref, bet.to_dict())
     return bet
 
 
@@ -128,57 +174,102 @@ async def toggle_betting_locked(bet_id: str, locked: bool) -> Bet:
     return updated_bet
 
 
+def _is_already_resolved(bet: Bet, winning_option: str) -> bool:
+    """Idempotency guard for resolution.
+
+    Returns True if the bet is already resolved with this winner (repeat
+    call is a no-op). Raises ValueError if it was resolved with a
+    different winner.
+    """
+    if not bet.is_resolved():
+        return False
+    if bet.winning_option != winning_option:
+        raise ValueError(
+            f"Bet already resolved with a different winner (current: {bet.winning_option})"
+        )
+    return True
+
+
 async def resolve_bet(bet_id: str, winning_option: str) -> None:
     """Resolve a bet and distribute points using Firestore transaction.
 
     Uses a transaction to ensure atomic multi-document updates.
     Uses RoomUser for point updates if they exist, falls back to legacy User collection.
+    Idempotent: resolving again with the same winner is a no-op.
     """
-    db = get_db()
+    bet = await get_bet(bet_id)
+    if not bet:
+        raise ValueError(f"Bet not found: {bet_id}")
+
+    if _is_already_resolved(bet, winning_option):
+        return
+
+    await _resolve_and_distribute(bet, winning_option)
+
 
+async def lock_and_resolve(bet_id: str, winning_option: str) -> None:
+    """Lock (if still open) and resolve a bet in one transaction.
+
+    Equivalent to lock_bet() followed by resolve_bet(), but the lock is
+    applied in memory and written together with the resolution, saving a
+    read and a write. Idempotent like resolve_bet().
+    """
     bet = await get_bet(bet_id)
     if not bet:
         raise ValueError(f"Bet not found: {bet_id}")
 
+    if _is_already_resolved(bet, winning_option):
+        return
+
+    if bet.status == BetStatus.OPEN:
+        bet = bet.lock_bet()
+
+    await _resolve_and_distribute(bet, winning_option)
+
+
+async def _resolve_and_distribute(bet: Bet, winning_option: str) -> None:
+    """Write the resolved bet and distribute points in one transaction."""
+    db = get_db()
+    bet_id = bet.bet_id
+
     # Resolve bet with 10s undo window
     resolved_bet = bet.resolve_bet(winning_option)
 
     # Get all user bets for this bet
     user_bets = await get_user_bets_for_bet(bet_id)
 
-    # Get all users who bet
-    user_ids = [ub.user_id for ub in user_bets]
-    users = await user_service.get_users_by_ids(user_ids)
-
-    # Calculate scores (pure - delegates to game_logic)
-    scores = game_logic.calculate_scores(user_bets, users, winning_option, bet.points_value)
+    # Calculate scores (pure - delegates to game_logic). Point changes are
+    # applied as server-side increments, so current balances are never read.
+    scores = game_logic.calculate_payouts(user_bets, winning_option, bet.points_value)
 
     # Use Firestore transaction for atomic multi-document updates
     @firestore.transactional
     def resolve_in_transaction(transaction):
         # Phase 1: ALL READS first (Firestore requires reads before writes)
-        room_user_data = {}
-        for user_id in scores:
+        # Only roomUsers existence is needed, and only for users whose
+        # balance changes; updating a missing doc fails.
+        room_user_ids = set()
+        for user_id, points_won in scores.items():
+            if not points_won:
+                continue
             room_user_doc_id = f"{bet.room_code}_{user_id}"
             room_user_ref = db.collection("roomUsers").document(room_user_doc_id)
             room_user_doc = room_user_ref.get(transaction=transaction)
             if room_user_doc.exists:
-                room_user_data[user_id] = room_user_doc.to_dict()
+                room_user_ids.add(user_id)
 
         # Phase 2: ALL WRITES
         for user_id, points_won in scores.items():
-            user = users[user_id]
-            new_points = user.points + points_won
+            # Losers' balances don't change (cost was deducted at placement)
+            if points_won:
+                user_ref = db.collection("users").document(user_id)
+                transaction.update(user_ref, {"points": firestore.Increment(points_won)})
 
-            user_ref = db.collection("users").document(user_id)
-            transaction.update(user_ref, {"points": new_points})
-
-            # Also update roomUsers if exists
-            if user_id in room_user_data:
-                room_user_doc_id = f"{bet.room_code}_{user_id}"
-                room_user_ref = db.collection("roomUsers").document(room_user_doc_id)
-                ru_new_points = room_user_data[user_id]["points"] + points_won
-                transaction.update(room_user_ref, {"points": ru_new_points})
+                # Also update roomUsers if exists
+                if user_id in room_user_ids:
+                    room_user_doc_id = f"{bet.room_code}_{user_id}"
+                    room_user_ref = db.collection("roomUsers").document(room_user_doc_id)
+                    transaction.update(room_user_ref, {"points": firestore.Increment(points_won)})
 
             # Update user bet with points won
             user_bet = next(ub for ub in user_bets if ub.user_id == user_id)
@@ -218,20 +309,17 @@ async def undo_resolve_bet(bet_id: str) -> Bet:
         if ub.points_won is not None:
             # Reverse the points: subtract what was won during resolution.
             # The original bet cost (deducted at placement) stays deducted.
+            # Increments, so balance changes since resolution are kept.
             user = await user_service.get_user(ub.user_id)
-            if user:
-                new_points = user.points - ub.points_won
+            if user and ub.points_won:
                 user_ref = db.collection("users").document(ub.user_id)
-                batch.update(user_ref, {"points": new_points})
+                batch.update(user_ref, {"points": firestore.Increment(-ub.points_won)})
 
                 # Also update roomUsers if exists
                 room_user_doc_id = f"{bet.room_code}_{ub.user_id}"
                 room_user_ref = db.collection("roomUsers").document(room_user_doc_id)
-                room_user_doc = room_user_ref.get()
-                if room_user_doc.exists:
-                    ru_data = room_user_doc.to_dict()
-                    ru_new_points = ru_data["points"] - ub.points_won
-                    batch.update(room_user_ref, {"points": ru_new_points})
+                if room_user_ref.get().exists:
+                    batch.update(room_user_ref, {"points": firestore.Increment(-ub.points_won)})
 
             # Reset user bet points_won
             updated_ub = ub.with_points_won(None)
@@ -251,17 +339,26 @@ async def place_user_bet(
     user_id: str,
     bet_id: str,
     selected_option: str,
+    bet: Optional[Bet] = None,
 ) -> UserBet:
-    """Place a user's bet"""
+    """Place a user's bet
+
+    Args:
+        bet: Already-fetched Bet for ``bet_id``; skips the bet read when a
+            caller places several bets against the same, recently read bet
+    """
     db = get_db()
 
     user = await user_service.get_user(user_id)
     if not user:
         raise ValueError(f"User not found: {user_id}")
 
-    bet = await get_bet(bet_id)
-    if not bet:
-        raise ValueError(f"Bet not found: {bet_id}")
+    if bet is None:
+        bet = await get_bet(bet_id)
+        if not bet:
+            raise ValueError(f"Bet not found: {bet_id}")
+    elif bet.bet_id != bet_id:
+        raise ValueError(f"Preloaded bet {bet.bet_id} does not match bet_id {bet_id}")
 
     existing_bet = await get_user_bet(user_id, bet_id)
 
@@ -294,28 +391,132 @@ async def place_user_bet(
         })
         return user_bet
 
-    # New bet — deduct points
-    updated_user = user.subtract_points(bet.points_value)
-
+    # New bet — deduct points as server-side increments, so a concurrent
+    # balance change (e.g. a resolution payout) isn't overwritten
     batch = db.batch()
     batch.set(user_bet_ref, user_bet.to_dict())
 
     user_ref = db.collection("users").document(user_id)
-    batch.set(user_ref, updated_user.to_dict())
+    batch.update(user_ref, {"points": firestore.Increment(-bet.points_value)})
 
     # Also update roomUsers if exists
     room_user_doc_id = f"{bet.room_code}_{user_id}"
     room_user_ref = db.collection("roomUsers").document(room_user_doc_id)
-    room_user_doc = room_user_ref.get()
-    if room_user_doc.exists:
-        ru = RoomUser.from_dict(room_user_doc.to_dict())
-        updated_ru = ru.subtract_points(bet.points_value)
-        batch.set(room_user_ref, updated_ru.to_dict())
+    if room_user_ref.get().exists:
+        batch.update(room_user_ref, {"points": firestore.Increment(-bet.points_value)})
 
     batch.commit()
     return user_bet
 
 
+# Placements per WriteBatch in place_many_user_bets. Each placement writes
+# up to 3 docs (userBet, user, roomUser), so 150 keeps a batch under 500 ops.
+PLACEMENTS_PER_BATCH = 150
+
+
+def _get_docs(db, collection: str, doc_ids: List[str]) -> Dict[str, dict]:
+    """Multi-document read; returns data of the docs that exist, keyed by ID"""
+    found = {}
+    col = db.collection(collection)
+    chunk_size = user_service.GET_ALL_CHUNK_SIZE
+    for start in range(0, len(doc_ids), chunk_size):
+        refs = [col.document(doc_id) for doc_id in doc_ids[start:start + chunk_size]]
+        for doc in db.get_all(refs):
+            if doc.exists:
+                found[doc.id] = doc.to_dict()
+    return found
+
+
+async def place_many_user_bets(
+    bet_id: str,
+    placements: List[Tuple[str, str]],
+) -> List[UserBet]:
+    """Place bets for several users on one bet with batched reads and writes
+
+    Same rules as place_user_bet(), but users, existing user bets and
+    roomUsers are fetched with multi-document reads, and writes are grouped
+    into WriteBatches of PLACEMENTS_PER_BATCH placements. Every placement is
+    validated before anything is written. Points are deducted with
+    firestore.Increment().
+
+    Note: batches commit separately, so a failed commit can leave earlier
+    chunks applied.
+
+    Args:
+        placements: (user_id, selected_option) pairs, one per user
+    """
+    db = get_db()
+
+    bet = await get_bet(bet_id)
+    if not bet:
+        raise ValueError(f"Bet not found: {bet_id}")
+
+    user_ids = [user_id for user_id, _ in placements]
+    if len(set(user_ids)) != len(user_ids):
+        raise ValueError("Each user can appear only once in placements")
+
+    users = await user_service.get_users_by_ids(user_ids)
+    existing = _get_docs(db, "userBets", [f"{bet_id}_{uid}" for uid in user_ids])
+    room_users = _get_docs(db, "roomUsers", [f"{bet.room_code}_{uid}" for uid in user_ids])
+
+    # Validate everything up front (pure)
+    placed_at = datetime.utcnow()
+    to_write = []
+    for user_id, selected_option in placements:
+        user = users.get(user_id)
+        if not user:
+            raise ValueError(f"User not found: {user_id}")
+
+        existing_data = existing.get(f"{bet_id}_{user_id}")
+        existing_bet = UserBet.from_dict(existing_data) if existing_data else None
+
+        is_valid, error = game_logic.validate_bet_eligibility(
+            user, bet, existing_bet, bet.points_value
+        )
+        if not is_valid:
+            raise ValueError(error)
+
+        if selected_option not in bet.options:
+            raise ValueError(f"Invalid option: {selected_option}")
+
+        user_bet = UserBet(
+            user_id=user_id,
+            bet_id=bet_id,
+            room_code=bet.room_code,
+            selected_option=selected_option,
+            placed_at=placed_at,
+        )
+        to_write.append((user_bet, existing_bet is not None))
+
+    # Write in chunks (I/O)
+    for start in range(0, len(to_write), PLACEMENTS_PER_BATCH):
+        batch = db.batch()
+        for user_bet, is_change in to_write[start:start + PLACEMENTS_PER_BATCH]:
+            user_id = user_bet.user_id
+            user_bet_ref = db.collection("userBets").document(f"{bet_id}_{user_id}")
+
+            # Changing an existing bet — just update the selection
+            if is_change:
+                batch.update(user_bet_ref, {
+                    "selectedOption": user_bet.selected_option,
+                    "placedAt": user_bet.placed_at,
+                })
+                continue
+
+            # New bet — deduct points
+            batch.set(user_bet_ref, user_bet.to_dict())
+            user_ref = db.collection("users").document(user_id)
+            batch.update(user_ref, {"points": firestore.Increment(-bet.points_value)})
+
+            room_user_doc_id = f"{bet.room_code}_{user_id}"
+            if room_user_doc_id in room_users:
+                room_user_ref = db.collection("roomUsers").document(room_user_doc_id)
+                batch.update(room_user_ref, {"points": firestore.Increment(-bet.points_value)})
+        batch.commit()
+
+    return [user_bet for user_bet, _ in to_write]
+
+
 async def get_user_bet(user_id: str, bet_id: str) -> Optional[UserBet]:
     """Get user's bet for a specific bet"""
     db = get_db()
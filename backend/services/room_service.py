@@ -6,6 +6,7 @@ IMPERATIVE SHELL: This module performs I/O operations
 - No business logic in this layer
 """
 
+import asyncio
 import random
 from datetime import datetime, timedelta
 from typing import Optional, List
@@ -21,18 +22,29 @@ from firebase_config import get_db
 # Room code generation alphabet (excluding confusing characters)
 ALPHABET = "ABCDEFGHJKMNPQRSTUVWXYZ23456789"
 
+# Room codes generated (and checked in one read) per generate_room_code call
+ROOM_CODE_CANDIDATES = 10
+
+
+def _get_room_snapshots(db, codes: List[str]) -> dict:
+    """Fetch room docs for candidate codes in one multi-document read"""
+    refs = [db.collection("rooms").document(code) for code in codes]
+    return {doc.id: doc for doc in db.get_all(refs)}
+
 
 async def generate_room_code() -> str:
-    """Generate unique 4-char room code (legacy)"""
-    db = get_db()
-    max_attempts = 10
+    """Generate unique 4-char room code (legacy)
 
-    for _ in range(max_attempts):
-        code = ''.join(random.choices(ALPHABET, k=4))
-        room_ref = db.collection("rooms").document(code)
-        room_doc = room_ref.get()
+    All candidates are checked with a single multi-document read instead
+    of one read per attempt.
+    """
+    db = get_db()
+    candidates = [''.join(random.choices(ALPHABET, k=4)) for _ in range(ROOM_CODE_CANDIDATES)]
+    snapshots = _get_room_snapshots(db, candidates)
 
-        if not room_doc.exists:
+    for code in candidates:
+        room_doc = snapshots.get(code)
+        if room_doc is None or not room_doc.exists:
             return code
 
         room_data = room_doc.to_dict()
@@ -41,7 +53,7 @@ async def generate_room_code() -> str:
             await delete_room(code)
             return code
 
-    raise RuntimeError("Failed to generate unique room code after 10 attempts")
+    raise RuntimeError(f"Failed to generate unique room code after {ROOM_CODE_CANDIDATES} attempts")
 
 
 async def generate_room_code_v2() -> str:
@@ -50,17 +62,15 @@ async def generate_room_code_v2() -> str:
     Format: XXXXXY where Y = checksum (sum of first 5 char indices mod 30)
     """
     db = get_db()
-    max_attempts = 10
-
-    for _ in range(max_attempts):
-        code = game_logic.generate_room_code_v2()
-        room_ref = db.collection("rooms").document(code)
-        room_doc = room_ref.get()
+    candidates = [game_logic.generate_room_code_v2() for _ in range(ROOM_CODE_CANDIDATES)]
+    snapshots = _get_room_snapshots(db, candidates)
 
-        if not room_doc.exists:
+    for code in candidates:
+        room_doc = snapshots.get(code)
+        if room_doc is None or not room_doc.exists:
             return code
 
-    raise RuntimeError("Failed to generate unique room code after 10 attempts")
+    raise RuntimeError(f"Failed to generate unique room code after {ROOM_CODE_CANDIDATES} attempts")
 
 
 async def create_room(event_template: str, event_name: Optional[str], host_id: str) -> Room:
@@ -187,30 +197,52 @@ async def update_room(room: Room) -> None:
 
 
 async def delete_room(code: str) -> None:
-    """Delete room and all associated data"""
-    db = get_db()
-    batch = db.batch()
-
-    room_ref = db.collection("rooms").document(code)
-    batch.delete(room_ref)
-
-    users_ref = db.collection("users").where("roomCode", "==", code)
-    for doc in users_ref.stream():
-        batch.delete(doc.reference)
+    """Delete room and all associated data
 
-    bets_ref = db.collection("bets").where("roomCode", "==", code)
-    for doc in bets_ref.stream():
-        batch.delete(doc.reference)
+    Deletes go through a Firestore BulkWriter, which splits them into
+    batches under the per-request write cap and sends them in parallel.
+    The per-collection lookups run concurrently; both steps use worker
+    threads since the admin client is sync.
 
-    user_bets_ref = db.collection("userBets").where("roomCode", "==", code)
-    for doc in user_bets_ref.stream():
-        batch.delete(doc.reference)
-
-    room_users_ref = db.collection("roomUsers").where("roomCode", "==", code)
-    for doc in room_users_ref.stream():
-        batch.delete(doc.reference)
+    Raises:
+        RuntimeError: If any delete failed. The BulkWriter's default error
+            handler retries silently and close() never raises, so failures
+            are collected (without retrying) and reported here.
+    """
+    db = get_db()
 
-    batch.commit()
+    def room_doc_refs(collection: str) -> list:
+        query = db.collection(collection).where("roomCode", "==", code)
+        return [doc.reference for doc in query.stream()]
+
+    ref_lists = await asyncio.gather(*(
+        asyncio.to_thread(room_doc_refs, collection)
+        for collection in ("users", "bets", "userBets", "roomUsers")
+    ))
+
+    def delete_all() -> list:
+        failures = []
+
+        def on_write_error(failure, _bulk_writer) -> bool:
+            failures.append(failure)
+            return False  # Don't retry
+
+        bulk_writer = db.bulk_writer()
+        bulk_writer.on_write_error(on_write_error)
+        for collection_refs in ref_lists:
+            for ref in collection_refs:
+                bulk_writer.delete(ref)
+        bulk_writer.delete(db.collection("rooms").document(code))
+        # Flushes pending writes and blocks until they complete
+        bulk_writer.close()
+        return failures
+
+    failures = await asyncio.to_thread(delete_all)
+    if failures:
+        raise RuntimeError(
+            f"Failed to delete {len(failures)} document(s) for room {code}: "
+            f"{failures[0].message}"
+        )
 
 
 async def get_room_participants(room_code: str) -> List[User]:
@@ -13,6 +13,10 @@ from models.bet import Bet
 from services import bet_service
 
 
+# Event template JSON files live in <repo>/templates, next to backend/
+TEMPLATES_DIR = Path(__file__).parent.parent.parent / "templates"
+
+
 def load_template(template_id: str) -> Optional[EventTemplate]:
     """Load event template from JSON file
 
@@ -24,10 +28,7 @@ def load_template(template_id: str) -> Optional[EventTemplate]:
     Returns:
         EventTemplate object or None if not found
     """
-    # Get templates directory (relative to backend/)
-    backend_dir = Path(__file__).parent.parent
-    templates_dir = backend_dir.parent / "templates"
-    template_path = templates_dir / f"{template_id}.json"
+    template_path = TEMPLATES_DIR / f"{template_id}.json"
 
     if not template_path.exists():
         return None
@@ -23,6 +23,12 @@ USER_KEY_ALPHABET = "23456789ABCDEFGHJKMNPQRSTVWXYZabcdefghjkmnpqrstvwxyz"
 USER_KEY_LENGTH = 8
 MAX_KEY_RETRIES = 5
 
+# Document refs per get_all call in get_users_by_ids
+GET_ALL_CHUNK_SIZE = 300
+
+# Updates per WriteBatch in bulk_update_points (Firestore caps a batch at 500)
+UPDATE_BATCH_SIZE = 450
+
 
 def generate_user_key() -> str:
     """Generate an 8-character unique user key using base32-crockford alphabet.
@@ -36,18 +42,10 @@ def generate_user_key() -> str:
     return "".join(random.choices(USER_KEY_ALPHABET, k=USER_KEY_LENGTH))
 
 
-async def create_user(room_code: str, nickname: str, is_admin: bool = False) -> User:
-    """Create a new user with a unique user_key
+async def _build_new_user(room_code: str, nickname: str, is_admin: bool) -> User:
+    """Validate the nickname and build a new User with a unique user_key
 
-    Imperative Shell - performs Firestore write
-
-    Args:
-        room_code: Room code user is joining
-        nickname: User's display name
-        is_admin: Whether user is room admin
-
-    Returns:
-        Created User object
+    Imperative Shell - performs Firestore reads (key collision checks), no writes
 
     Raises:
         ValueError: If nickname validation fails or key generation fails
@@ -57,8 +55,6 @@ async def create_user(room_code: str, nickname: str, is_admin: bool = False) ->
     if not is_valid:
         raise ValueError(error)
 
-    db = get_db()
-
     # Generate unique user ID
     user_id = str(uuid.uuid4())
 
@@ -80,7 +76,7 @@ async def create_user(room_code: str, nickname: str, is_admin: bool = False) ->
         raise ValueError("Failed to generate unique user key after retries")
 
     # Create user object (pure)
-    user = User(
+    return User(
         user_id=user_id,
         room_code=room_code,
         nickname=nickname,
@@ -90,13 +86,64 @@ async def create_user(room_code: str, nickname: str, is_admin: bool = False) ->
         user_key=user_key,
     )
 
+
+async def create_user(room_code: str, nickname: str, is_admin: bool = False) -> User:
+    """Create a new user with a unique user_key
+
+    Imperative Shell - performs Firestore write
+
+    Args:
+        room_code: Room code user is joining
+        nickname: User's display name
+        is_admin: Whether user is room admin
+
+    Returns:
+        Created User object
+
+    Raises:
+        ValueError: If nickname validation fails or key generation fails
+    """
+    user = await _build_new_user(room_code, nickname, is_admin)
+
     # Write to Firestore with key included (I/O)
-    user_ref = db.collection("users").document(user_id)
+    db = get_db()
+    user_ref = db.collection("users").document(user.user_id)
     user_ref.set(user.to_dict(include_key=True))
 
     return user
 
 
+async def create_user_tx(batch, room_code: str, nickname: str, is_admin: bool = False) -> User:
+    """Create a new user, queueing the write on an outer batch
+
+    Imperative Shell - performs key collision reads; the write is only
+    queued on ``batch`` and lands when the caller commits it. Lets callers
+    seed several documents in one round-trip.
+
+    Note: the key collision check cannot see users still pending in the
+    same uncommitted batch.
+
+    Args:
+        batch: Firestore WriteBatch (or Transaction) to queue the write on
+        room_code: Room code user is joining
+        nickname: User's display name
+        is_admin: Whether user is room admin
+
+    Returns:
+        Created User object (not yet persisted)
+
+    Raises:
+        ValueError: If nickname validation fails or key generation fails
+    """
+    user = await _build_new_user(room_code, nickname, is_admin)
+
+    db = get_db()
+    user_ref = db.collection("users").document(user.user_id)
+    batch.set(user_ref, user.to_dict(include_key=True))
+
+    return user
+
+
 async def get_user(user_id: str) -> Optional[User]:
     """Get user by ID
 
@@ -186,6 +233,27 @@ async def update_user_points(user_id: str, points: int) -> None:
     user_ref.update({"points": points})
 
 
+async def bulk_update_points(points_by_user: Dict[str, int]) -> None:
+    """Set several users' point balances with batched writes
+
+    Imperative Shell - performs Firestore batch updates, one commit per
+    UPDATE_BATCH_SIZE users
+
+    Args:
+        points_by_user: Map of user_id to new point balance
+    """
+    db = get_db()
+    users_col = db.collection("users")
+    items = list(points_by_user.items())
+
+    # Update Firestore in chunks (I/O)
+    for start in range(0, len(items), UPDATE_BATCH_SIZE):
+        batch = db.batch()
+        for user_id, points in items[start:start + UPDATE_BATCH_SIZE]:
+            batch.update(users_col.document(user_id), {"points": points})
+        batch.commit()
+
+
 async def update_user(user: User) -> None:
     """Update user in Firestore
 
@@ -219,14 +287,14 @@ async def get_users_by_ids(user_ids: List[str]) -> Dict[str, User]:
     db = get_db()
     users_dict = {}
 
-    # Batch read from Firestore (I/O)
-    for user_id in user_ids:
-        user_ref = db.collection("users").document(user_id)
-        user_doc = user_ref.get()
-
-        if user_doc.exists:
-            user = User.from_dict(user_doc.to_dict())
-            users_dict[user_id] = user
+    # Multi-document read from Firestore, one RPC per chunk (I/O).
+    # get_all does not preserve request order, so key by the snapshot ID.
+    users_col = db.collection("users")
+    for start in range(0, len(user_ids), GET_ALL_CHUNK_SIZE):
+        refs = [users_col.document(uid) for uid in user_ids[start:start + GET_ALL_CHUNK_SIZE]]
+        for user_doc in db.get_all(refs):
+            if user_doc.exists:
+                users_dict[user_doc.id] = User.from_dict(user_doc.to_dict())
 
     return users_dict
 
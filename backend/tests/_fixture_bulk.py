@@ -0,0 +1,80 @@
+"""Bulk fixture seeding for emulator-backed tests
+
+Writes User/Bet documents straight to Firestore in chunked WriteBatches,
+skipping the service layer (nickname validation, user_key collision reads).
+Use it only to set up state that a test is not itself exercising.
+"""
+
+import uuid
+from datetime import datetime
+from typing import Iterable, List
+
+import game_logic
+from firebase_config import get_db
+from models.bet import Bet, BetStatus
+from models.user import User
+from services.user_service import generate_user_key
+
+
+# Firestore caps a WriteBatch at 500 writes; seeds are plain set() calls,
+# so each batch can be filled right up to the cap.
+SEED_BATCH_SIZE = 500
+
+
+def _commit_chunked(collection: str, docs: List[tuple]) -> None:
+    """Write (doc_id, data) pairs in batches of at most SEED_BATCH_SIZE"""
+    db = get_db()
+    col = db.collection(collection)
+    for start in range(0, len(docs), SEED_BATCH_SIZE):
+        batch = db.batch()
+        for doc_id, data in docs[start:start + SEED_BATCH_SIZE]:
+            batch.set(col.document(doc_id), data)
+        batch.commit()
+
+
+def seed_users(room_code: str, nicknames: Iterable[str]) -> List[User]:
+    """Write one non-admin user per nickname and return them in order
+
+    IDs are generated locally and the returned Users are the ones written,
+    so nothing is read back. Built with model_construct (no validation).
+    """
+    nicknames = list(nicknames)
+    user_ids = [str(uuid.uuid4()) for _ in nicknames]
+    joined_at = datetime.utcnow()
+    users = [
+        User.model_construct(
+            user_id=user_id,
+            room_code=room_code,
+            nickname=nickname,
+            points=game_logic.INITIAL_POINTS,
+            is_admin=False,
+            joined_at=joined_at,
+            user_key=generate_user_key(),
+        )
+        for user_id, nickname in zip(user_ids, nicknames)
+    ]
+    _commit_chunked("users", [(u.user_id, u.to_dict(include_key=True)) for u in users])
+    return users
+
+
+def seed_bets(room_code: str, specs: Iterable[dict]) -> List[Bet]:
+    """Write one OPEN bet per spec and return them in order
+
+    Each spec holds ``question`` and ``options`` and may set
+    ``points_value`` (default 100).
+    """
+    now = datetime.utcnow()
+    bets = [
+        Bet(
+            bet_id=str(uuid.uuid4()),
+            room_code=room_code,
+            question=spec["question"],
+            options=spec["options"],
+            status=BetStatus.OPEN,
+            opened_at=now,
+            points_value=spec.get("points_value", 100),
+        )
+        for spec in specs
+    ]
+    _commit_chunked("bets", [(b.bet_id, b.to_dict()) for b in bets])
+    return bets
@@ -3,6 +3,7 @@ Pytest configuration and fixtures for SmallBets.live tests
 
 This file provides shared fixtures for:
 - Automatic Firebase mocking for unit tests
+- A shared FastAPI test client for API tests
 - Firebase Emulator lifecycle management (integration tests)
 - Test database cleanup
 - Mock data generation
@@ -11,11 +12,14 @@ This file provides shared fixtures for:
 import os
 import shutil
 import pytest
+import pytest_asyncio
 from unittest.mock import MagicMock
 from typing import Generator
+from datetime import datetime
 import subprocess
 import time
 import socket
+from uuid import uuid4
 
 
 # ---------------------------------------------------------------------------
@@ -23,6 +27,11 @@ import socket
 # ---------------------------------------------------------------------------
 os.environ.setdefault("GOOGLE_CLOUD_PROJECT", "demo-test")
 
+# Each pytest-xdist worker talks to the shared emulator under its own
+# project ID, so workers never see (or wipe) each other's documents.
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+os.environ.setdefault("FIRESTORE_PROJECT_ID", f"demo-test-{_XDIST_WORKER}")
+
 
 # ---------------------------------------------------------------------------
 # Auto-mock Firebase for all tests
@@ -68,6 +77,25 @@ def _mock_firebase(request):
     firebase_config._app = orig_app
 
 
+# ---------------------------------------------------------------------------
+# API test client
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="session")
+def client():
+    """FastAPI test client shared by every API/security test.
+
+    Deliberately not entered as a context manager: the app's only startup
+    hook is initialize_firebase(), which ``_mock_firebase`` already turns
+    into a no-op per test. Running the lifespan once at session setup
+    would happen before that mock is installed and try to reach Firebase.
+    """
+    from fastapi.testclient import TestClient
+    from main import app
+
+    return TestClient(app)
+
+
 # ---------------------------------------------------------------------------
 # Firebase Emulator (integration tests only)
 # ---------------------------------------------------------------------------
@@ -89,6 +117,11 @@ def firebase_emulator() -> Generator[None, None, None]:
     and stops them at the end. All tests share the same emulator instance.
 
     Skips automatically if the ``firebase`` CLI is not installed.
+
+    Under pytest-xdist every worker is its own session, so workers never
+    start or stop the emulator themselves (several would race to start it,
+    and the starter would kill it under the others at its teardown). Start
+    it once before ``pytest -n``; workers only connect to it.
     """
     # Guard: skip if firebase CLI is not available
     if not shutil.which("firebase"):
@@ -107,6 +140,12 @@ def firebase_emulator() -> Generator[None, None, None]:
         yield
         return
 
+    if "PYTEST_XDIST_WORKER" in os.environ:
+        pytest.fail(
+            "Parallel runs need a pre-started emulator: run "
+            "`firebase emulators:start --project demo-test` before `pytest -n`"
+        )
+
     print("Starting Firebase emulators...")
 
     # Start emulators
@@ -136,36 +175,83 @@ def firebase_emulator() -> Generator[None, None, None]:
     emulator_process.wait(timeout=10)
 
 
-@pytest.fixture(scope="function")
+# Firestore caps a WriteBatch at 500 writes
+FIRESTORE_BATCH_LIMIT = 500
+
+
+@pytest.fixture(scope="module")
 def clean_firestore(firebase_emulator):
     """
-    Clean Firestore data before each test.
-
-    This fixture depends on firebase_emulator and runs before each test function.
-    It clears all Firestore data to ensure test isolation.
+    Clean Firestore data once per test module.
+
+    This fixture depends on firebase_emulator and wipes all Firestore data
+    in this worker's FIRESTORE_PROJECT_ID namespace before the first test of
+    each module that uses it. Tests within a module
+    share that store, so they must isolate themselves by the room they
+    create (or by ``unique_prefix``) rather than assume it is empty.
+    Deletes are grouped into WriteBatches so the wipe costs one round-trip
+    per FIRESTORE_BATCH_LIMIT documents instead of one per document.
     """
     # Import here to avoid issues when emulator is not running
-    from firebase_admin import firestore
     from firebase_config import initialize_firebase
 
     db = initialize_firebase()
 
     # Clear all collections (you may want to add more as your schema grows)
-    collections = ['rooms', 'users', 'bets', 'user_bets', 'transcripts']
+    collections = ['rooms', 'users', 'bets', 'userBets', 'roomUsers', 'transcripts']
 
+    batch = db.batch()
+    pending = 0
     for collection_name in collections:
-        collection_ref = db.collection(collection_name)
-        docs = collection_ref.stream()
-        for doc in docs:
-            doc.reference.delete()
+        for doc in db.collection(collection_name).stream():
+            batch.delete(doc.reference)
+            pending += 1
+            if pending >= FIRESTORE_BATCH_LIMIT:
+                batch.commit()
+                batch = db.batch()
+                pending = 0
+    if pending:
+        batch.commit()
 
     yield db
 
 
+@pytest.fixture
+def unique_prefix() -> str:
+    """Per-test ID prefix for documents that must not collide with other tests"""
+    return f"T{uuid4().hex[:6]}"
+
+
+@pytest_asyncio.fixture
+async def isolated_room(firebase_emulator):
+    """
+    A freshly created room on the emulator, without a Firestore wipe.
+
+    For tests that only touch documents scoped to one new room: the unique
+    room code already isolates them, so they skip ``clean_firestore``.
+    """
+    from services import room_service
+
+    return await room_service.create_room(
+        event_template="grammys-2026",
+        event_name="Grammy Awards 2026",
+        host_id="test-host-id",
+    )
+
+
 # ---------------------------------------------------------------------------
 # Test data fixtures
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="session")
+def now() -> datetime:
+    """Fixed timestamp for tests that only need *a* datetime (serialization,
+    ordering). Tests that compare against the real clock (expiry, undo
+    windows, defaults) must keep calling datetime.utcnow().
+    """
+    return datetime(2025, 1, 1, 12, 0, 0)
+
+
 @pytest.fixture
 def sample_room_data():
     """Sample room data for testing"""
@@ -15,24 +15,14 @@ Endpoints tested:
 """
 
 import pytest
-from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, patch
 from datetime import datetime
-from main import app
 from models.room import Room
 from models.user import User
 
 
-@pytest.fixture
-def client():
-    """Test client fixture"""
-    with TestClient(app) as test_client:
-        yield test_client
-
-
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_create_room_success(client):
+def test_create_room_success(client):
     """Test successful room creation"""
     mock_room = Room(
         code="AAAA",
@@ -80,8 +70,7 @@ async def test_create_room_success(client):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_create_room_custom_template(client):
+def test_create_room_custom_template(client):
     """Test room creation with custom template (no bets created)"""
     mock_room = Room(
         code="AAAA",
@@ -120,8 +109,7 @@ async def test_create_room_custom_template(client):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_get_room_success(client):
+def test_get_room_success(client):
     """Test getting room details"""
     mock_room = Room(
         code="AAAA",
@@ -143,8 +131,7 @@ async def test_get_room_success(client):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_get_room_not_found(client):
+def test_get_room_not_found(client):
     """Test getting non-existent room"""
     with patch("services.room_service.get_room", return_value=None):
         response = client.get("/api/rooms/ZZZZ")
@@ -154,8 +141,7 @@ async def test_get_room_not_found(client):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_join_room_success(client):
+def test_join_room_success(client):
     """Test joining a room"""
     mock_room = Room(
         code="AAAA",
@@ -191,8 +177,7 @@ async def test_join_room_success(client):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_get_participants(client):
+def test_get_participants(client):
     """Test getting room participants"""
     mock_room = Room(
         code="AAAA",
@@ -220,8 +205,7 @@ async def test_get_participants(client):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_get_leaderboard(client):
+def test_get_leaderboard(client):
     """Test getting room leaderboard"""
     mock_room = Room(
         code="AAAA",
@@ -249,8 +233,7 @@ async def test_get_leaderboard(client):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_start_room(client):
+def test_start_room(client):
     """Test starting a room (host only)"""
     mock_room = Room(
         code="AAAA",
@@ -275,8 +258,7 @@ async def test_start_room(client):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_finish_room(client):
+def test_finish_room(client):
     """Test finishing a room (host only)"""
     mock_room = Room(
         code="AAAA",
@@ -11,23 +11,14 @@ Endpoints tested:
 """
 
 import pytest
-from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime
 
-from main import app
 from models.room import Room, MatchDetails
 from models.user import User
 from models.bet import Bet, BetStatus
 
 
-@pytest.fixture
-def client():
-    """Test client fixture"""
-    with TestClient(app) as test_client:
-        yield test_client
-
-
 def make_tournament_room(**overrides) -> Room:
     """Helper to create a tournament room"""
     defaults = dict(
@@ -5,22 +5,13 @@ Tests the full flow of transcript ingestion and automation triggering.
 
 import pytest
 from unittest.mock import AsyncMock, patch
-from fastapi.testclient import TestClient
 from datetime import datetime
 
-from main import app
 from models.room import Room
 from models.bet import Bet, BetStatus
 from models.transcript import TranscriptEntry
 
 
-@pytest.fixture
-def client():
-    """Create test client"""
-    with TestClient(app) as test_client:
-        yield test_client
-
-
 @pytest.fixture
 def mock_room():
     """Mock room for testing"""
@@ -149,8 +140,7 @@ class TestTranscriptIngestionEndpoint:
     ):
         """Should still create entry but not trigger automation when disabled"""
         # Disable automation
-        mock_room.automation_enabled = False
-        mock_get_room.return_value = mock_room
+        mock_get_room.return_value = mock_room.model_copy(update={"automation_enabled": False})
 
         mock_entry = TranscriptEntry(
             entry_id="entry123",
@@ -261,8 +251,7 @@ class TestAutomationToggleEndpoint:
         mock_room
     ):
         """Should enable automation when requested by host"""
-        mock_room.automation_enabled = False
-        mock_get_room.return_value = mock_room
+        mock_get_room.return_value = mock_room.model_copy(update={"automation_enabled": False})
 
         response = client.post(
             "/api/rooms/TEST/automation/toggle",
@@ -287,8 +276,7 @@ class TestAutomationToggleEndpoint:
         mock_room
     ):
         """Should disable automation when requested by host"""
-        mock_room.automation_enabled = True
-        mock_get_room.return_value = mock_room
+        mock_get_room.return_value = mock_room.model_copy(update={"automation_enabled": True})
 
         response = client.post(
             "/api/rooms/TEST/automation/toggle",
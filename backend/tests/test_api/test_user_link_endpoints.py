@@ -15,22 +15,14 @@ Tests verify:
 """
 
 import pytest
-from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime
 
-from main import app, session_restore_limiter
+from main import session_restore_limiter
 from models.room import Room
 from models.user import User
 
 
-@pytest.fixture
-def client():
-    """Test client fixture"""
-    with TestClient(app) as test_client:
-        yield test_client
-
-
 @pytest.fixture
 def mock_room():
     return Room(
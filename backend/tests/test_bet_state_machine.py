@@ -323,13 +323,9 @@ async def test_resolve_bet_idempotent_same_winner():
         mock_get_bet.return_value = resolved_bet
         mock_transaction.reset_mock()
 
-        # TODO: Implement idempotency check in bet_service.resolve_bet()
-        # Current implementation will try to resolve again, but it should
-        # detect that bet is already resolved with same winner and return early
-
-        # Expected behavior (not yet implemented):
-        # await bet_service.resolve_bet("test-bet-id", "Option 1")
-        # assert mock_transaction.update.call_count == 0  # No new writes
+        await bet_service.resolve_bet("test-bet-id", "Option 1")
+        assert mock_transaction.update.call_count == 0  # No new writes
+        assert mock_transaction.set.call_count == 0
 
 
 @pytest.mark.unit
@@ -352,13 +348,8 @@ async def test_resolve_bet_rejects_different_winner():
     )
 
     with patch("services.bet_service.get_bet", return_value=resolved_bet):
-        # TODO: Implement this validation in bet_service.resolve_bet()
-        # Should raise error when trying to resolve with different winner
-
-        # Expected behavior (not yet implemented):
-        # with pytest.raises(ValueError, match="already resolved.*different winner"):
-        #     await bet_service.resolve_bet("test-bet-id", "Option 2")
-        pass
+        with pytest.raises(ValueError, match="already resolved.*different winner"):
+            await bet_service.resolve_bet("test-bet-id", "Option 2")
 
 
 # ============================================================================
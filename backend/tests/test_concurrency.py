@@ -11,29 +11,69 @@ These tests use the Firestore emulator and exercise real async behaviour.
 
 import asyncio
 import pytest
+import pytest_asyncio
 from services import bet_service, user_service, room_service
-from models.bet import BetStatus
+from models.bet import Bet, BetStatus
+from models.user import User
+from firebase_config import get_db
 
 
 # ---------------------------------------------------------------------------
-# Helpers
+# Module-scoped setup
 # ---------------------------------------------------------------------------
 
-async def _create_room_and_open_bet(db):
-    """Helper: create a room, a user, and a bet (starts as OPEN)."""
+# Share one event loop across the module so the module-scoped fixture and
+# the tests that use it run on the same loop.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def room_and_bet_factory(firebase_emulator):
+    """Create one room for the whole module and hand out fresh bets on demand.
+
+    The room is created once; every test calls ``seed_bet(*nicknames)`` to
+    get its own OPEN bet (distinct ``bet_id``) plus fresh users, so tests
+    never see each other's user bets and no per-test ``clean_firestore``
+    wipe is needed. Each seed queues the bet and user writes on one
+    WriteBatch, so per-test setup is a single commit.
+    """
     room = await room_service.create_room(
         event_template="custom",
         event_name="Concurrency Test",
         host_id="host-id",
     )
-    user = await user_service.create_user(room.code, "Player1", is_admin=False)
-    bet = await bet_service.create_bet(
-        room_code=room.code,
-        question="Who wins?",
-        options=["Alpha", "Beta"],
-        points_value=100,
-    )
-    return room, user, bet
+
+    async def seed_bet(
+        *nicknames: str,
+        question: str = "Who wins?",
+        options: list[str] | None = None,
+    ) -> tuple[Bet, list[User]]:
+        batch = get_db().batch()
+        users = [
+            await user_service.create_user_tx(batch, room.code, nickname, is_admin=False)
+            for nickname in nicknames
+        ]
+        bet = await bet_service.create_bet_tx(
+            batch,
+            room_code=room.code,
+            question=question,
+            options=options or ["Alpha", "Beta"],
+            points_value=100,
+        )
+        batch.commit()
+        return bet, users
+
+    return room, seed_bet
+
+
+async def _in_thread(coro):
+    """Run a service coroutine on its own worker thread and event loop.
+
+    The service functions block on the sync Firestore client without ever
+    awaiting, so ``asyncio.gather`` alone would run them one after another.
+    Separate threads give the calls real interleaving.
+    """
+    return await asyncio.to_thread(asyncio.run, coro)
 
 
 # ---------------------------------------------------------------------------
@@ -41,60 +81,59 @@ async def _create_room_and_open_bet(db):
 # ---------------------------------------------------------------------------
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_same_user_double_submit_bet(clean_firestore):
-    """Same user double-submits bet – second attempt should be rejected."""
-    room, user, bet = await _create_room_and_open_bet(clean_firestore)
+async def test_same_user_double_submit_bet(room_and_bet_factory):
+    """Same user submits a bet twice – only one bet is stored, charged once.
+
+    The submissions run back to back (a resubmit after the first landed),
+    not as a race: while a bet is open a repeat submission changes the
+    user's selection instead of failing. What must hold is that the user
+    ends up with a single user bet, holding the latest option, and pays
+    the stake once.
+    """
+    _, seed_bet = room_and_bet_factory
+    bet, (user,) = await seed_bet("Player1")
 
-    # First placement should succeed
-    user_bet = await bet_service.place_user_bet(
+    await bet_service.place_user_bet(
         user_id=user.user_id,
         bet_id=bet.bet_id,
         selected_option="Alpha",
     )
-    assert user_bet.selected_option == "Alpha"
+    await bet_service.place_user_bet(
+        user_id=user.user_id,
+        bet_id=bet.bet_id,
+        selected_option="Beta",
+    )
 
-    # Second placement by the same user should raise ValueError
-    with pytest.raises(ValueError, match="already"):
-        await bet_service.place_user_bet(
-            user_id=user.user_id,
-            bet_id=bet.bet_id,
-            selected_option="Beta",
-        )
+    # Exactly one stored user bet, holding the second selection
+    stored_bets = await bet_service.get_user_bets_for_bet(bet.bet_id)
+    assert len(stored_bets) == 1
+    assert stored_bets[0].selected_option == "Beta"
 
-    # Verify the original bet is still intact (not overwritten)
-    stored = await bet_service.get_user_bet(user.user_id, bet.bet_id)
-    assert stored is not None
-    assert stored.selected_option == "Alpha"
+    # Stake deducted once, not once per submission
+    stored_user = await user_service.get_user(user.user_id)
+    assert stored_user.points == user.points - bet.points_value
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_concurrent_bet_placement_by_different_users(clean_firestore):
+async def test_concurrent_bet_placement_by_different_users(room_and_bet_factory):
     """Multiple different users placing bets concurrently should all succeed."""
-    room, _, bet = await _create_room_and_open_bet(clean_firestore)
-
-    # Create several additional users
-    users = []
-    for i in range(5):
-        u = await user_service.create_user(room.code, f"Player{i}", is_admin=False)
-        users.append(u)
-
-    # Place bets concurrently
-    tasks = [
-        bet_service.place_user_bet(
-            user_id=u.user_id,
+    _, seed_bet = room_and_bet_factory
+
+    # Create several users alongside the bet
+    bet, users = await seed_bet(*(f"Player{i}" for i in range(5)))
+
+    # Place bets concurrently on separate threads; any failure propagates
+    # out of the gather, which is exactly "all should succeed".
+    results = await asyncio.gather(*(
+        _in_thread(bet_service.place_user_bet(
+            user_id=user.user_id,
             bet_id=bet.bet_id,
             selected_option="Alpha" if i % 2 == 0 else "Beta",
-        )
-        for i, u in enumerate(users)
-    ]
-
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+        ))
+        for i, user in enumerate(users)
+    ))
 
-    # All placements should have succeeded (no exceptions)
-    for r in results:
-        assert not isinstance(r, Exception), f"Unexpected error: {r}"
+    assert all(r is not None for r in results)
 
     # Verify all user bets stored
     all_bets = await bet_service.get_user_bets_for_bet(bet.bet_id)
@@ -102,28 +141,33 @@ async def test_concurrent_bet_placement_by_different_users(clean_firestore):
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_concurrent_bet_placement_and_resolution(clean_firestore):
+async def test_concurrent_bet_placement_and_resolution(room_and_bet_factory):
     """Bet placement and resolution happening concurrently.
 
     If a user places a bet while the host resolves, the service
     should either accept or reject consistently – no half-written state.
     """
-    room, _, bet = await _create_room_and_open_bet(clean_firestore)
+    _, seed_bet = room_and_bet_factory
 
     # Create two users who will place bets
-    user1 = await user_service.create_user(room.code, "Racer1", is_admin=False)
-    user2 = await user_service.create_user(room.code, "Racer2", is_admin=False)
+    bet, (user1, user2) = await seed_bet("Racer1", "Racer2")
 
-    # User1 places bet first (before lock)
-    await bet_service.place_user_bet(
-        user_id=user1.user_id,
-        bet_id=bet.bet_id,
-        selected_option="Alpha",
+    # User1 places a bet while the host locks it – on separate threads
+    placement, lock_result = await asyncio.gather(
+        _in_thread(bet_service.place_user_bet(
+            user_id=user1.user_id,
+            bet_id=bet.bet_id,
+            selected_option="Alpha",
+        )),
+        _in_thread(bet_service.lock_bet(bet.bet_id)),
+        return_exceptions=True,
     )
+    assert not isinstance(lock_result, Exception), f"Lock failed: {lock_result}"
 
-    # Lock the bet so we can resolve it
-    await bet_service.lock_bet(bet.bet_id)
+    # Placement either landed before the lock or was rejected because of it
+    if isinstance(placement, Exception):
+        assert isinstance(placement, ValueError)
+        assert "locked" in str(placement)
 
     # Now resolve the bet
     await bet_service.resolve_bet(bet.bet_id, "Alpha")
@@ -141,63 +185,67 @@ async def test_concurrent_bet_placement_and_resolution(clean_firestore):
     assert resolved_bet.status == BetStatus.RESOLVED
     assert resolved_bet.winning_option == "Alpha"
 
-    # Verify user1 got points
+    # No half-written state: the stored user bet and user1's balance agree
+    # with whichever way the race went. As the sole bettor, user1 is
+    # refunded on resolution, so the balance ends back at the initial 1000.
+    stored = await bet_service.get_user_bet(user1.user_id, bet.bet_id)
+    if isinstance(placement, Exception):
+        assert stored is None
+    else:
+        assert stored is not None
+        assert stored.points_won == 100
     user1_updated = await user_service.get_user(user1.user_id)
-    assert user1_updated.points != 1000  # Points were adjusted
+    assert user1_updated.points == 1000
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_multiple_resolve_attempts_same_bet(clean_firestore):
+async def test_multiple_resolve_attempts_same_bet(room_and_bet_factory):
     """Multiple resolve attempts on the same bet.
 
     Once a bet is resolved, further attempts should either be idempotent
     (same winner) or rejected (different winner).
     """
-    room, _, bet = await _create_room_and_open_bet(clean_firestore)
+    _, seed_bet = room_and_bet_factory
 
     # Create a user and place a bet
-    user = await user_service.create_user(room.code, "Resolver", is_admin=False)
+    bet, (user,) = await seed_bet("Resolver")
     await bet_service.place_user_bet(
         user_id=user.user_id,
         bet_id=bet.bet_id,
         selected_option="Alpha",
     )
 
-    # Lock and resolve the bet
-    await bet_service.lock_bet(bet.bet_id)
-    await bet_service.resolve_bet(bet.bet_id, "Alpha")
+    # Lock and resolve the bet in one transaction
+    await bet_service.lock_and_resolve(bet.bet_id, "Alpha")
 
-    # Verify resolved
-    resolved_bet = await bet_service.get_bet(bet.bet_id)
-    assert resolved_bet.status == BetStatus.RESOLVED
-    assert resolved_bet.winning_option == "Alpha"
+    # Points after the first resolution are known without a read: the stake
+    # is deducted on placement and, as the sole bettor, refunded on
+    # resolution, so the balance is back to the creation-time snapshot.
+    points_after_first = user.points
 
-    # Capture user points after first resolution
-    user_after_first = await user_service.get_user(user.user_id)
-    points_after_first = user_after_first.points
+    # Second resolve with same winner is an idempotent no-op
+    await bet_service.lock_and_resolve(bet.bet_id, "Alpha")
 
-    # Second resolve with same winner – should not change points further
-    # (may succeed silently or raise; either is acceptable)
-    try:
-        await bet_service.resolve_bet(bet.bet_id, "Alpha")
-    except (ValueError, Exception):
-        pass  # Acceptable to reject duplicate resolve
+    # One read of each document after both resolves, fetched concurrently
+    resolved_bet, user_after_second = await asyncio.gather(
+        _in_thread(bet_service.get_bet(bet.bet_id)),
+        _in_thread(user_service.get_user(user.user_id)),
+    )
+    assert resolved_bet.status == BetStatus.RESOLVED
+    assert resolved_bet.winning_option == "Alpha"
+    assert resolved_bet.locked_at is not None
 
     # Verify points did not change again (idempotent)
-    user_after_second = await user_service.get_user(user.user_id)
     assert user_after_second.points == points_after_first
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_resolve_already_resolved_bet_with_different_winner(clean_firestore):
+async def test_resolve_already_resolved_bet_with_different_winner(room_and_bet_factory):
     """Attempting to resolve an already-resolved bet with a different winner
     should be rejected.
     """
-    room, _, bet = await _create_room_and_open_bet(clean_firestore)
-
-    user = await user_service.create_user(room.code, "Player", is_admin=False)
+    _, seed_bet = room_and_bet_factory
+    bet, (user,) = await seed_bet("Player")
     await bet_service.place_user_bet(
         user_id=user.user_id,
         bet_id=bet.bet_id,
@@ -208,10 +256,8 @@ async def test_resolve_already_resolved_bet_with_different_winner(clean_firestor
     await bet_service.lock_bet(bet.bet_id)
     await bet_service.resolve_bet(bet.bet_id, "Alpha")
 
-    # Attempt to re-resolve with different winner
-    # The bet model's resolve_bet expects the bet to not already be RESOLVED
-    # (status transition validation), so this should raise
-    with pytest.raises((ValueError, Exception)):
+    # Re-resolving with a different winner is rejected by the service
+    with pytest.raises(ValueError, match="different winner"):
         await bet_service.resolve_bet(bet.bet_id, "Beta")
 
     # Winner should still be Alpha
@@ -220,12 +266,10 @@ async def test_resolve_already_resolved_bet_with_different_winner(clean_firestor
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_place_bet_on_locked_bet_rejected(clean_firestore):
+async def test_place_bet_on_locked_bet_rejected(room_and_bet_factory):
     """Placing a bet on a locked bet should be rejected."""
-    room, _, bet = await _create_room_and_open_bet(clean_firestore)
-
-    user = await user_service.create_user(room.code, "LatePlayer", is_admin=False)
+    _, seed_bet = room_and_bet_factory
+    bet, (user,) = await seed_bet("LatePlayer")
 
     # Lock the bet
     await bet_service.lock_bet(bet.bet_id)
@@ -240,21 +284,11 @@ async def test_place_bet_on_locked_bet_rejected(clean_firestore):
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_place_bet_on_resolved_bet_rejected(clean_firestore):
+async def test_place_bet_on_resolved_bet_rejected(room_and_bet_factory):
     """Placing a bet on a resolved bet should be rejected."""
-    room = await room_service.create_room(
-        event_template="custom",
-        event_name="Resolved Test",
-        host_id="host-id",
-    )
-    user1 = await user_service.create_user(room.code, "Player1", is_admin=False)
-    user2 = await user_service.create_user(room.code, "LatePlayer", is_admin=False)
-    bet = await bet_service.create_bet(
-        room_code=room.code,
-        question="Too late?",
-        options=["Yes", "No"],
-        points_value=100,
+    _, seed_bet = room_and_bet_factory
+    bet, (user1, user2) = await seed_bet(
+        "Player1", "LatePlayer", question="Too late?", options=["Yes", "No"],
     )
 
     # Place bet, lock, and resolve
@@ -8,244 +8,276 @@ Tests verify:
 - Environment variable ALLOWED_ORIGINS is respected
 - Proper CORS headers on preflight and actual requests
 
-Test approach: Use FastAPI TestClient to verify CORS behaviour.
+Test approach: Use TestClient (or httpx.AsyncClient over ASGITransport)
+against minimal Starlette apps to verify CORS behaviour.
 The tests examine response headers on preflight (OPTIONS) and
 actual requests to confirm correct Access-Control-* headers.
 """
 
+import asyncio
+import functools
 import os
+import httpx
 import pytest
+import pytest_asyncio
 from unittest.mock import patch
-from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.datastructures import Headers
+from starlette.middleware import Middleware
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from main import AllowlistCORSMiddleware, _parse_origins
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _make_app_with_origins(allowed_origins: list[str]):
-    """Create a fresh FastAPI app with specific CORS origins.
+DEV_ORIGINS = ["http://localhost:5173", "http://localhost:3000"]
+PROD_ORIGINS = ["https://smallbets.live", "https://www.smallbets.live"]
 
-    This simulates what the production app should do: read ALLOWED_ORIGINS
-    from environment and configure CORS middleware accordingly.
-    """
-    from fastapi import FastAPI
-    from fastapi.middleware.cors import CORSMiddleware
 
-    app = FastAPI()
+def _make_cors_middleware(allowed_origins: list[str]) -> AllowlistCORSMiddleware:
+    """Create a standalone production CORS middleware for decision-only assertions.
 
-    app.add_middleware(
-        CORSMiddleware,
+    Whether an origin is allowed is decided by
+    ``CORSMiddleware.is_allowed_origin``, and preflight headers are computed
+    entirely by ``CORSMiddleware.preflight_response``. Tests that only check
+    one of those call it directly instead of sending a request through the
+    whole ASGI stack. No downstream app is needed. Built as the production
+    AllowlistCORSMiddleware so its frozenset lookup is what gets checked.
+    """
+    return AllowlistCORSMiddleware(
+        app=None,
         allow_origins=allowed_origins,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
     )
 
-    @app.get("/api/health")
-    async def health():
-        return {"status": "ok"}
 
-    @app.get("/api/rooms/TEST")
-    async def get_room():
-        return {"code": "TEST", "status": "waiting"}
+async def _health(request):
+    return JSONResponse({"status": "ok"})
 
-    @app.post("/api/rooms")
-    async def create_room():
-        return {"room_code": "ABCD"}
 
-    return app
+async def _get_room(request):
+    return JSONResponse({"code": "TEST", "status": "waiting"})
 
 
-def _make_app_from_env():
-    """Create a FastAPI app that reads ALLOWED_ORIGINS from env.
+async def _create_room(request):
+    return JSONResponse({"room_code": "ABCD"})
 
-    This tests the recommended production pattern:
-    ALLOWED_ORIGINS=https://smallbets.live,https://www.smallbets.live
+
+def _make_app_with_origins(allowed_origins: list[str]):
+    """Create a fresh app with specific CORS origins.
+
+    This simulates what the production app should do: read ALLOWED_ORIGINS
+    from environment and configure CORS middleware accordingly.
+
+    Uses a bare Starlette app: only the production AllowlistCORSMiddleware
+    is under test, so FastAPI's dependency injection and OpenAPI machinery
+    are not needed.
     """
-    from fastapi import FastAPI
-    from fastapi.middleware.cors import CORSMiddleware
+    return Starlette(
+        routes=[
+            Route("/api/health", _health),
+            Route("/api/rooms/TEST", _get_room),
+            Route("/api/rooms", _create_room, methods=["POST"]),
+        ],
+        middleware=[
+            Middleware(
+                AllowlistCORSMiddleware,
+                allow_origins=allowed_origins,
+                allow_credentials=True,
+                allow_methods=["*"],
+                allow_headers=["*"],
+            ),
+        ],
+    )
+
 
-    raw_origins = os.environ.get("ALLOWED_ORIGINS", "")
-    origins = [o.strip() for o in raw_origins.split(",") if o.strip()]
+@functools.lru_cache(maxsize=8)
+def _make_app_cached(origins_key: tuple[str, ...]):
+    return _make_app_with_origins(list(origins_key))
 
-    app = FastAPI()
 
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=origins if origins else ["*"],
+def _make_app_with_origins_memo(allowed_origins: list[str]):
+    """Shared app per distinct allowlist (order-insensitive).
+
+    The apps are read-only once built, so every fixture asking for the same
+    origins gets the same instance instead of constructing a new one.
+    """
+    return _make_app_cached(tuple(sorted(allowed_origins)))
+
+
+async def _health_app(scope, receive, send):
+    """Minimal ASGI app: every request gets a 200 JSON health response."""
+    response = JSONResponse({"status": "ok"})
+    await response(scope, receive, send)
+
+
+def _make_allowlist_app(origins: list[str]):
+    """Create an app allowing exactly ``origins`` (wildcard if empty).
+
+    Pure function of the origin list. Only the CORS decision is under test,
+    so the production AllowlistCORSMiddleware wraps a bare ASGI app instead
+    of a full FastAPI app with a route table.
+    """
+    return AllowlistCORSMiddleware(
+        _health_app,
+        allow_origins=origins if origins else ("*",),
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
     )
 
-    @app.get("/api/health")
-    async def health():
-        return {"status": "ok"}
 
-    return app
+def _make_app_from_env():
+    """Create an app that reads ALLOWED_ORIGINS from env.
+
+    This tests the recommended production pattern:
+    ALLOWED_ORIGINS=https://smallbets.live,https://www.smallbets.live
+    """
+    return _make_allowlist_app(_parse_origins(os.environ.get("ALLOWED_ORIGINS", "")))
 
 
 # ---------------------------------------------------------------------------
 # 4.4.1 Development/Testing origins
 # ---------------------------------------------------------------------------
 
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def dev_client():
+    app = _make_app_with_origins_memo(DEV_ORIGINS)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def dev_cors():
+    return _make_cors_middleware(DEV_ORIGINS)
+
+
 class TestDevCorsConfig:
-    """CORS configuration for development/testing environments."""
-
-    @pytest.fixture
-    def dev_client(self):
-        app = _make_app_with_origins([
-            "http://localhost:5173",
-            "http://localhost:3000",
-        ])
-        return TestClient(app)
-
-    def test_vite_dev_server_origin_allowed(self, dev_client):
-        """Requests from Vite dev server (port 5173) should be allowed."""
-        response = dev_client.get(
-            "/api/health",
-            headers={"Origin": "http://localhost:5173"},
-        )
-        assert response.status_code == 200
-        assert response.headers.get("access-control-allow-origin") == "http://localhost:5173"
+    """CORS configuration for development/testing environments.
 
-    def test_react_dev_server_origin_allowed(self, dev_client):
-        """Requests from CRA dev server (port 3000) should be allowed."""
-        response = dev_client.get(
-            "/api/health",
-            headers={"Origin": "http://localhost:3000"},
-        )
+    Uses httpx.AsyncClient over ASGITransport so requests run in-process on
+    the test's event loop instead of hopping through TestClient's portal
+    thread.
+    """
+
+    @pytest.mark.parametrize("origin, expected", [
+        ("http://localhost:5173", "http://localhost:5173"),  # Vite dev server
+        ("http://localhost:3000", "http://localhost:3000"),  # CRA dev server
+        ("https://evil.example.com", None),  # External origin
+    ])
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_origin_echo(self, dev_client, origin, expected):
+        """Allowed dev origins are echoed back; others get no allow header.
+
+        End-to-end check through the middleware stack. CORS middleware does
+        NOT block a rejected request (that's the browser's job), it just
+        leaves Access-Control-Allow-Origin off.
+        """
+        response = await dev_client.get("/api/health", headers={"Origin": origin})
         assert response.status_code == 200
-        assert response.headers.get("access-control-allow-origin") == "http://localhost:3000"
+        assert response.headers.get("access-control-allow-origin") == expected
 
-    def test_unknown_localhost_port_rejected(self, dev_client):
+    def test_unknown_localhost_port_rejected(self, dev_cors):
         """Requests from unknown localhost port should be rejected."""
-        response = dev_client.get(
-            "/api/health",
-            headers={"Origin": "http://localhost:9999"},
-        )
-        # CORS middleware does NOT block the request (that's browser's job),
-        # but it should NOT include the Access-Control-Allow-Origin header
-        assert response.headers.get("access-control-allow-origin") is None
-
-    def test_external_origin_rejected(self, dev_client):
-        """Requests from external origins should be rejected."""
-        response = dev_client.get(
-            "/api/health",
-            headers={"Origin": "https://evil.example.com"},
-        )
-        assert response.headers.get("access-control-allow-origin") is None
-
-    def test_preflight_request_includes_cors_headers(self, dev_client):
-        """Preflight (OPTIONS) requests should return proper CORS headers."""
-        response = dev_client.options(
-            "/api/rooms",
-            headers={
-                "Origin": "http://localhost:5173",
-                "Access-Control-Request-Method": "POST",
-                "Access-Control-Request-Headers": "Content-Type,X-Host-Id",
-            },
+        assert not dev_cors.is_allowed_origin("http://localhost:9999")
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_preflight_and_actual_request_cors_headers(self, dev_client):
+        """Preflight (OPTIONS) and the actual request should both carry CORS headers.
+
+        The preflight must allow the origin and method; the actual request
+        must set Access-Control-Allow-Credentials for the allowed origin.
+        """
+        preflight, actual = await asyncio.gather(
+            dev_client.options(
+                "/api/rooms",
+                headers={
+                    "Origin": "http://localhost:5173",
+                    "Access-Control-Request-Method": "POST",
+                    "Access-Control-Request-Headers": "Content-Type,X-Host-Id",
+                },
+            ),
+            dev_client.get(
+                "/api/health",
+                headers={"Origin": "http://localhost:5173"},
+            ),
         )
-        assert response.status_code == 200
-        assert response.headers.get("access-control-allow-origin") == "http://localhost:5173"
-        assert "POST" in response.headers.get("access-control-allow-methods", "")
+        assert preflight.status_code == 200
+        assert preflight.headers.get("access-control-allow-origin") == "http://localhost:5173"
+        assert "POST" in preflight.headers.get("access-control-allow-methods", "")
+        assert actual.headers.get("access-control-allow-credentials") == "true"
 
-    def test_preflight_with_rejected_origin(self, dev_client):
+    def test_preflight_with_rejected_origin(self, dev_cors):
         """Preflight from rejected origin should not include allow headers."""
-        response = dev_client.options(
-            "/api/rooms",
-            headers={
-                "Origin": "https://attacker.com",
-                "Access-Control-Request-Method": "POST",
-            },
-        )
+        response = dev_cors.preflight_response(Headers({
+            "origin": "https://attacker.com",
+            "access-control-request-method": "POST",
+        }))
         assert response.headers.get("access-control-allow-origin") is None
 
-    def test_credentials_header_present(self, dev_client):
-        """Access-Control-Allow-Credentials should be true for allowed origins."""
-        response = dev_client.get(
-            "/api/health",
-            headers={"Origin": "http://localhost:5173"},
-        )
-        assert response.headers.get("access-control-allow-credentials") == "true"
-
 
 # ---------------------------------------------------------------------------
 # 4.4.2 Production origins
 # ---------------------------------------------------------------------------
 
-class TestProductionCorsConfig:
-    """CORS configuration for production environment."""
+@pytest.fixture(scope="module")
+def prod_client():
+    app = _make_app_with_origins_memo(PROD_ORIGINS)
+    # Not entered as a context manager: TestClient only runs the ASGI
+    # lifespan handshake inside ``with``, and these apps have no
+    # startup/shutdown hooks.
+    return TestClient(app)
 
-    @pytest.fixture
-    def prod_client(self):
-        app = _make_app_with_origins([
-            "https://smallbets.live",
-            "https://www.smallbets.live",
-        ])
-        return TestClient(app)
 
-    def test_production_domain_allowed(self, prod_client):
-        """Requests from production domain should be allowed."""
-        response = prod_client.get(
-            "/api/health",
-            headers={"Origin": "https://smallbets.live"},
-        )
-        assert response.status_code == 200
-        assert response.headers.get("access-control-allow-origin") == "https://smallbets.live"
+@pytest.fixture(scope="module")
+def prod_cors():
+    return _make_cors_middleware(PROD_ORIGINS)
 
-    def test_www_production_domain_allowed(self, prod_client):
-        """Requests from www subdomain should be allowed."""
-        response = prod_client.get(
-            "/api/health",
-            headers={"Origin": "https://www.smallbets.live"},
-        )
+
+class TestProductionCorsConfig:
+    """CORS configuration for production environment."""
+
+    @pytest.mark.parametrize("origin, expected", [
+        ("https://smallbets.live", "https://smallbets.live"),
+        ("https://www.smallbets.live", "https://www.smallbets.live"),
+        ("http://localhost:5173", None),  # Localhost rejected in production
+    ])
+    def test_origin_echo(self, prod_client, origin, expected):
+        """Production domains are echoed back; localhost gets no allow header.
+
+        End-to-end check through the middleware stack.
+        """
+        response = prod_client.get("/api/health", headers={"Origin": origin})
         assert response.status_code == 200
-        assert response.headers.get("access-control-allow-origin") == "https://www.smallbets.live"
+        assert response.headers.get("access-control-allow-origin") == expected
 
-    def test_http_production_domain_rejected(self, prod_client):
+    def test_http_production_domain_rejected(self, prod_cors):
         """HTTP (non-HTTPS) production domain should be rejected."""
-        response = prod_client.get(
-            "/api/health",
-            headers={"Origin": "http://smallbets.live"},
-        )
-        assert response.headers.get("access-control-allow-origin") is None
+        assert not prod_cors.is_allowed_origin("http://smallbets.live")
 
-    def test_subdomain_not_in_allowlist_rejected(self, prod_client):
+    def test_subdomain_not_in_allowlist_rejected(self, prod_cors):
         """Unknown subdomains should be rejected."""
-        response = prod_client.get(
-            "/api/health",
-            headers={"Origin": "https://api.smallbets.live"},
-        )
-        assert response.headers.get("access-control-allow-origin") is None
+        assert not prod_cors.is_allowed_origin("https://api.smallbets.live")
 
-    def test_localhost_rejected_in_production(self, prod_client):
-        """Localhost should be rejected in production config."""
-        response = prod_client.get(
-            "/api/health",
-            headers={"Origin": "http://localhost:5173"},
-        )
-        assert response.headers.get("access-control-allow-origin") is None
-
-    def test_wildcard_origin_rejected(self, prod_client):
+    def test_wildcard_origin_rejected(self, prod_cors):
         """Wildcard origin should be rejected."""
-        response = prod_client.get(
-            "/api/health",
-            headers={"Origin": "*"},
-        )
-        assert response.headers.get("access-control-allow-origin") is None
+        assert not prod_cors.is_allowed_origin("*")
 
-    def test_production_preflight_with_custom_headers(self, prod_client):
+    def test_production_preflight_with_custom_headers(self, prod_cors):
         """Preflight with custom headers (X-Host-Id, X-User-Id) should work."""
-        response = prod_client.options(
-            "/api/rooms/TEST",
-            headers={
-                "Origin": "https://smallbets.live",
-                "Access-Control-Request-Method": "GET",
-                "Access-Control-Request-Headers": "Content-Type,X-Host-Id,X-User-Id",
-            },
-        )
+        response = prod_cors.preflight_response(Headers({
+            "origin": "https://smallbets.live",
+            "access-control-request-method": "GET",
+            "access-control-request-headers": "Content-Type,X-Host-Id,X-User-Id",
+        }))
         assert response.status_code == 200
         assert response.headers.get("access-control-allow-origin") == "https://smallbets.live"
 
@@ -255,48 +287,30 @@ class TestProductionCorsConfig:
 # ---------------------------------------------------------------------------
 
 class TestAllowedOriginsEnvVar:
-    """CORS configuration via ALLOWED_ORIGINS environment variable."""
+    """CORS configuration via ALLOWED_ORIGINS environment variable.
+
+    Parsing is checked on ``_parse_origins`` directly; only the wiring tests
+    build an app from the environment and send requests through it.
+    """
 
     def test_env_var_parsed_correctly(self):
         """ALLOWED_ORIGINS env var should be split by commas."""
-        with patch.dict(os.environ, {
-            "ALLOWED_ORIGINS": "https://smallbets.live,https://www.smallbets.live"
-        }):
-            app = _make_app_from_env()
-            client = TestClient(app)
-
-            response = client.get(
-                "/api/health",
-                headers={"Origin": "https://smallbets.live"},
-            )
-            assert response.headers.get("access-control-allow-origin") == "https://smallbets.live"
+        assert _parse_origins("https://smallbets.live,https://www.smallbets.live") == [
+            "https://smallbets.live",
+            "https://www.smallbets.live",
+        ]
 
     def test_env_var_with_spaces_parsed_correctly(self):
         """Spaces around origins in env var should be trimmed."""
-        with patch.dict(os.environ, {
-            "ALLOWED_ORIGINS": " https://smallbets.live , https://www.smallbets.live "
-        }):
-            app = _make_app_from_env()
-            client = TestClient(app)
-
-            response = client.get(
-                "/api/health",
-                headers={"Origin": "https://smallbets.live"},
-            )
-            assert response.headers.get("access-control-allow-origin") == "https://smallbets.live"
+        assert _parse_origins(" https://smallbets.live , https://www.smallbets.live ") == [
+            "https://smallbets.live",
+            "https://www.smallbets.live",
+        ]
 
     def test_empty_env_var_falls_back_to_wildcard(self):
         """Empty ALLOWED_ORIGINS should fall back to wildcard (dev mode)."""
-        with patch.dict(os.environ, {"ALLOWED_ORIGINS": ""}):
-            app = _make_app_from_env()
-            client = TestClient(app)
-
-            response = client.get(
-                "/api/health",
-                headers={"Origin": "https://any-domain.com"},
-            )
-            # Wildcard allows all origins
-            assert response.headers.get("access-control-allow-origin") == "*"
+        assert _parse_origins("") == []
+        assert _make_allowlist_app(_parse_origins("")).allow_all_origins
 
     def test_missing_env_var_falls_back_to_wildcard(self):
         """Missing ALLOWED_ORIGINS env var should fall back to wildcard."""
@@ -311,8 +325,19 @@ class TestAllowedOriginsEnvVar:
                 "/api/health",
                 headers={"Origin": "https://any-domain.com"},
             )
+            # Wildcard allows all origins
             assert response.headers.get("access-control-allow-origin") == "*"
 
+    def test_parsed_origins_stored_as_frozenset(self):
+        """The parsed allowlist is kept as a frozenset for O(1) lookups."""
+        raw = " https://smallbets.live , https://www.smallbets.live "
+        middleware = _make_allowlist_app(_parse_origins(raw))
+
+        assert middleware.allow_origins == frozenset({
+            "https://smallbets.live",
+            "https://www.smallbets.live",
+        })
+
     def test_single_origin_in_env_var(self):
         """Single origin (no comma) in ALLOWED_ORIGINS should work."""
         with patch.dict(os.environ, {
@@ -339,6 +364,12 @@ class TestAllowedOriginsEnvVar:
 # 4.4.4 Current app wildcard config (documents existing behaviour)
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="module")
+def wildcard_client():
+    app = _make_app_with_origins_memo(["*"])
+    return TestClient(app)
+
+
 class TestCurrentWildcardConfig:
     """Tests documenting the current wildcard CORS configuration.
 
@@ -346,11 +377,6 @@ class TestCurrentWildcardConfig:
     as documentation that this needs to be fixed for production.
     """
 
-    @pytest.fixture
-    def wildcard_client(self):
-        app = _make_app_with_origins(["*"])
-        return TestClient(app)
-
     def test_wildcard_allows_any_origin(self, wildcard_client):
         """Current wildcard config allows any origin – NOT safe for production."""
         response = wildcard_client.get(
@@ -4,16 +4,50 @@ Tests for data integrity and limits (Phase 5 / Section 4.2)
 Tests verify:
 - Large rooms (>500 users) – batch operation limits
 - Firestore write limits (500 ops/batch)
-- Safe chunked deletion strategy for delete_room()
+- Chunked deletion in delete_room() for rooms past the batch limit
 - Batch point updates during resolution with many participants
 
 These tests use the Firestore emulator.
 """
 
+import asyncio
+
 import pytest
 from services import bet_service, user_service, room_service
 from firebase_config import get_db
 from models.bet import BetStatus
+from _fixture_bulk import seed_bets, seed_users
+
+
+async def _gather_in_threads(coros):
+    """Await service coroutines concurrently, each on a worker thread.
+
+    The services block on the sync Firestore client without awaiting, so a
+    plain gather would run them one by one. asyncio.to_thread uses the
+    default executor, which also caps how many writes are in flight.
+    """
+    return await asyncio.gather(*(asyncio.to_thread(asyncio.run, coro) for coro in coros))
+
+
+async def _bulk_create_users(room_code, n, prefix):
+    """Create n non-admin users named f"{prefix}{i:03d}" concurrently."""
+    return await _gather_in_threads(
+        user_service.create_user(room_code, f"{prefix}{i:03d}", is_admin=False)
+        for i in range(n)
+    )
+
+
+async def _bulk_create_bets(room_code, n, question_prefix, options):
+    """Create n 100-point bets concurrently."""
+    return await _gather_in_threads(
+        bet_service.create_bet(
+            room_code=room_code,
+            question=f"{question_prefix}{i}?",
+            options=options,
+            points_value=100,
+        )
+        for i in range(n)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -34,10 +68,7 @@ async def test_room_with_many_users_creation(clean_firestore):
     )
 
     num_users = 50  # Reasonable for emulator speed; tests the pattern
-    users = []
-    for i in range(num_users):
-        u = await user_service.create_user(room.code, f"User{i:03d}", is_admin=False)
-        users.append(u)
+    seed_users(room.code, [f"User{i:03d}" for i in range(num_users)])
 
     # Verify all users were created
     participants = await room_service.get_room_participants(room.code)
@@ -49,8 +80,7 @@ async def test_room_with_many_users_creation(clean_firestore):
 async def test_delete_room_with_many_documents(clean_firestore):
     """delete_room() should handle rooms with many associated documents.
 
-    Current implementation uses a single batch – this tests whether it works
-    for moderate document counts. For >500 docs, chunked deletion is needed.
+    See test_firestore_batch_limit_awareness for rooms past the batch limit.
     """
     room = await room_service.create_room(
         event_template="custom",
@@ -60,24 +90,14 @@ async def test_delete_room_with_many_documents(clean_firestore):
 
     # Create users
     num_users = 20
-    users = []
-    for i in range(num_users):
-        u = await user_service.create_user(room.code, f"Del{i:03d}", is_admin=False)
-        users.append(u)
+    users = await _bulk_create_users(room.code, num_users, "Del")
 
     # Create bets
     num_bets = 10
-    bets = []
-    for i in range(num_bets):
-        b = await bet_service.create_bet(
-            room_code=room.code,
-            question=f"Question {i}?",
-            options=["A", "B"],
-            points_value=100,
-        )
-        bets.append(b)
+    bets = await _bulk_create_bets(room.code, num_bets, "Question ", ["A", "B"])
 
-    # Bets start as OPEN, have users place bets (creates userBet documents)
+    # Bets start as OPEN, have users place bets (creates userBet documents).
+    # Pass the created bets through so each placement skips the bet read.
     for user in users[:5]:
         for bet in bets[:3]:
             try:
@@ -85,6 +105,7 @@ async def test_delete_room_with_many_documents(clean_firestore):
                     user_id=user.user_id,
                     bet_id=bet.bet_id,
                     selected_option="A",
+                    bet=bet,
                 )
             except ValueError:
                 pass  # May fail if user can't afford bet after previous placements
@@ -107,10 +128,10 @@ async def test_delete_room_with_many_documents(clean_firestore):
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_delete_room_nonexistent_room(clean_firestore):
+async def test_delete_room_nonexistent_room(clean_firestore, unique_prefix):
     """delete_room() should not fail on a room that doesn't exist."""
     # Should not raise – just a no-op
-    await room_service.delete_room("ZZZZ")
+    await room_service.delete_room(f"{unique_prefix}ZZ")
 
 
 @pytest.mark.integration
@@ -128,10 +149,7 @@ async def test_batch_point_updates_during_resolution(clean_firestore):
 
     # Create multiple users
     num_users = 10
-    users = []
-    for i in range(num_users):
-        u = await user_service.create_user(room.code, f"Batch{i:02d}", is_admin=False)
-        users.append(u)
+    users = seed_users(room.code, [f"Batch{i:03d}" for i in range(num_users)])
 
     # Create bet (starts as OPEN)
     bet = await bet_service.create_bet(
@@ -142,27 +160,21 @@ async def test_batch_point_updates_during_resolution(clean_firestore):
     )
 
     # Half pick "Winner", half pick "Loser"
-    for i, user in enumerate(users):
-        option = "Winner" if i < num_users // 2 else "Loser"
-        await bet_service.place_user_bet(
-            user_id=user.user_id,
-            bet_id=bet.bet_id,
-            selected_option=option,
-        )
+    await bet_service.place_many_user_bets(bet.bet_id, [
+        (user.user_id, "Winner" if i < num_users // 2 else "Loser")
+        for i, user in enumerate(users)
+    ])
 
     # Lock and resolve
     await bet_service.lock_bet(bet.bet_id)
     await bet_service.resolve_bet(bet.bet_id, "Winner")
 
     # Verify all points were adjusted
-    winners = []
-    losers = []
-    for i, user in enumerate(users):
-        updated = await user_service.get_user(user.user_id)
-        if i < num_users // 2:
-            winners.append(updated)
-        else:
-            losers.append(updated)
+    # One multi-doc read; every assertion below works off this snapshot
+    updated = await user_service.get_users_by_ids([u.user_id for u in users])
+    all_users = [updated[u.user_id] for u in users]
+    winners = all_users[:num_users // 2]
+    losers = all_users[num_users // 2:]
 
     # Winners: 1000 - 100 (bet cost) + winnings > 900
     for w in winners:
@@ -174,44 +186,37 @@ async def test_batch_point_updates_during_resolution(clean_firestore):
 
     # Total points should be conserved:
     # num_users * 1000 initial points (no points created or destroyed)
-    total = sum(u.points for u in winners) + sum(u.points for u in losers)
+    total = sum(u.points for u in all_users)
     assert total == num_users * 1000, f"Expected {num_users * 1000}, got {total}"
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_firestore_batch_limit_awareness(clean_firestore):
-    """Verify that the current delete_room implementation works within
-    Firestore batch limits (500 operations per batch).
+    """Verify that delete_room works past Firestore batch limits
+    (500 operations per batch).
 
-    This test creates a room with enough documents to be close to but
-    within the 500-op batch limit.
+    This test creates a room with more documents than fit in one batch, so
+    delete_room's BulkWriter has to split its deletes across several requests.
     """
-    db = clean_firestore
     room = await room_service.create_room(
         event_template="custom",
         event_name="Batch Limit Test",
         host_id="host-id",
     )
 
-    # Create enough documents to approach but not exceed batch limits
-    # 1 room + N users + M bets + K userBets < 500
-    num_users = 30
+    # Create enough documents to exceed a single batch
+    # 1 room + N users + M bets > 500
+    num_users = 600
     num_bets = 15
 
-    for i in range(num_users):
-        await user_service.create_user(room.code, f"Lim{i:03d}", is_admin=False)
-
-    for i in range(num_bets):
-        await bet_service.create_bet(
-            room_code=room.code,
-            question=f"Limit Q{i}?",
-            options=["X", "Y"],
-            points_value=100,
-        )
+    seed_users(room.code, [f"Lim{i:03d}" for i in range(num_users)])
+    seed_bets(
+        room.code,
+        [{"question": f"Limit Q{i}?", "options": ["X", "Y"]} for i in range(num_bets)],
+    )
 
-    # Total docs: 1 (room) + 30 (users) + 15 (bets) = 46 – well within 500
-    # Delete should succeed without issues
+    # Total docs: 1 (room) + 600 (users) + 15 (bets) = 616 – more than one batch
     await room_service.delete_room(room.code)
 
     # Verify everything is cleaned up
@@ -272,15 +277,14 @@ async def test_leaderboard_with_many_users(clean_firestore):
         host_id="host-id",
     )
 
-    # Create users with varying points
-    for i in range(20):
-        user = await user_service.create_user(room.code, f"LB{i:02d}", is_admin=False)
-        # Give different point values by updating
-        if i % 3 == 0:
-            await user_service.update_user_points(user.user_id, 1500)
-        elif i % 3 == 1:
-            await user_service.update_user_points(user.user_id, 500)
-        # else: leave at 1000
+    users = seed_users(room.code, [f"LB{i:02d}" for i in range(20)])
+
+    # Give different point values in one batch (i % 3 == 2 stays at 1000)
+    await user_service.bulk_update_points({
+        user.user_id: 1500 if i % 3 == 0 else 500
+        for i, user in enumerate(users)
+        if i % 3 != 2
+    })
 
     leaderboard = await user_service.calculate_and_get_leaderboard(room.code)
 
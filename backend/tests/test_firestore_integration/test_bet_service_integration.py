@@ -11,20 +11,15 @@ Tests marked with @pytest.mark.integration for selective execution.
 """
 
 import pytest
-from services import bet_service, user_service, room_service
+from services import bet_service, user_service
 from models.bet import BetStatus
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_create_and_get_bet(clean_firestore):
+async def test_create_and_get_bet(isolated_room):
     """Test creating and retrieving a bet"""
-    # Create room first
-    room = await room_service.create_room(
-        event_template="grammys-2026",
-        event_name="Grammy Awards 2026",
-        host_id="test-host-id",
-    )
+    room = isolated_room
 
     # Create bet
     bet = await bet_service.create_bet(
@@ -48,14 +43,9 @@ async def test_create_and_get_bet(clean_firestore):
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_bet_lifecycle(clean_firestore):
+async def test_bet_lifecycle(isolated_room):
     """Test full bet lifecycle: OPEN → LOCKED → RESOLVED"""
-    # Create room
-    room = await room_service.create_room(
-        event_template="grammys-2026",
-        event_name="Grammy Awards 2026",
-        host_id="test-host-id",
-    )
+    room = isolated_room
 
     # Create bet (starts as OPEN)
     bet = await bet_service.create_bet(
@@ -82,14 +72,9 @@ async def test_bet_lifecycle(clean_firestore):
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_place_user_bet(clean_firestore):
+async def test_place_user_bet(isolated_room):
     """Test placing a user bet"""
-    # Create room
-    room = await room_service.create_room(
-        event_template="grammys-2026",
-        event_name="Grammy Awards 2026",
-        host_id="test-host-id",
-    )
+    room = isolated_room
 
     # Create user
     user = await user_service.create_user(room.code, "TestUser", is_admin=False)
@@ -120,14 +105,9 @@ async def test_place_user_bet(clean_firestore):
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_get_bets_in_room(clean_firestore):
+async def test_get_bets_in_room(isolated_room):
     """Test getting all bets in a room"""
-    # Create room
-    room = await room_service.create_room(
-        event_template="grammys-2026",
-        event_name="Grammy Awards 2026",
-        host_id="test-host-id",
-    )
+    room = isolated_room
 
     # Create multiple bets
     bet1 = await bet_service.create_bet(
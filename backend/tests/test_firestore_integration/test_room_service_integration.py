@@ -18,7 +18,7 @@ from models.room import Room
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_create_and_get_room(clean_firestore):
+async def test_create_and_get_room(firebase_emulator):
     """Test creating and retrieving a room"""
     # Create room
     room = await room_service.create_room(
@@ -43,14 +43,9 @@ async def test_create_and_get_room(clean_firestore):
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_update_room(clean_firestore):
+async def test_update_room(isolated_room):
     """Test updating a room"""
-    # Create room
-    room = await room_service.create_room(
-        event_template="grammys-2026",
-        event_name="Grammy Awards 2026",
-        host_id="test-host-id",
-    )
+    room = isolated_room
 
     # Update room status
     await room_service.set_room_status(room.code, "active")
@@ -63,14 +58,9 @@ async def test_update_room(clean_firestore):
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_get_room_participants(clean_firestore):
+async def test_get_room_participants(isolated_room):
     """Test getting room participants"""
-    # Create room
-    room = await room_service.create_room(
-        event_template="grammys-2026",
-        event_name="Grammy Awards 2026",
-        host_id="test-host-id",
-    )
+    room = isolated_room
 
     # Create users in room
     from services import user_service
@@ -86,15 +76,15 @@ async def test_get_room_participants(clean_firestore):
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_room_not_found(clean_firestore):
+async def test_room_not_found(firebase_emulator, unique_prefix):
     """Test getting non-existent room returns None"""
-    room = await room_service.get_room("ZZZZ")
+    room = await room_service.get_room(f"{unique_prefix}ZZ")
     assert room is None
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_room_code_uniqueness(clean_firestore):
+async def test_room_code_uniqueness(firebase_emulator):
     """Test that generated room codes are unique"""
     codes = set()
 
@@ -15,9 +15,10 @@ Tests marked with @pytest.mark.unit for selective execution.
 """
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import timedelta
 from game_logic import (
     calculate_scores,
+    calculate_payouts,
     validate_bet_eligibility,
     calculate_pot_total,
     distribute_pot,
@@ -36,137 +37,50 @@ from models.user_bet import UserBet
 # ============================================================================
 
 
-@pytest.mark.unit
-def test_calculate_scores_normal_case():
-    """Test normal case: 5 users, 3 winners, 2 losers"""
-    user_bets = [
-        UserBet(user_id="u1", bet_id="b1", room_code="AAAA", selected_option="A"),
-        UserBet(user_id="u2", bet_id="b1", room_code="AAAA", selected_option="A"),
-        UserBet(user_id="u3", bet_id="b1", room_code="AAAA", selected_option="A"),
-        UserBet(user_id="u4", bet_id="b1", room_code="AAAA", selected_option="B"),
-        UserBet(user_id="u5", bet_id="b1", room_code="AAAA", selected_option="B"),
-    ]
+@pytest.fixture(scope="module")
+def five_users():
+    """Users u1..u5 in room AAAA, each with 1000 points
 
-    users = {
-        "u1": User(user_id="u1", room_code="AAAA", nickname="U1", points=1000),
-        "u2": User(user_id="u2", room_code="AAAA", nickname="U2", points=1000),
-        "u3": User(user_id="u3", room_code="AAAA", nickname="U3", points=1000),
-        "u4": User(user_id="u4", room_code="AAAA", nickname="U4", points=1000),
-        "u5": User(user_id="u5", room_code="AAAA", nickname="U5", points=1000),
+    Known-good data, so built with model_construct (no validation).
+    """
+    return {
+        f"u{i}": User.model_construct(user_id=f"u{i}", room_code="AAAA", nickname=f"U{i}", points=1000)
+        for i in range(1, 6)
     }
 
-    scores = calculate_scores(user_bets, users, "A", 100)
-
-    # Pot = 5 * 100 = 500
-    # 3 winners split 500 = 166 each (integer division)
-    # 2 losers get 0
-    assert scores["u1"] == 166
-    assert scores["u2"] == 166
-    assert scores["u3"] == 166
-    assert scores["u4"] == 0
-    assert scores["u5"] == 0
-
 
-@pytest.mark.unit
-def test_calculate_scores_all_pick_same_option():
-    """Test edge case: everyone picks the same option (should refund)"""
-    user_bets = [
-        UserBet(user_id="u1", bet_id="b1", room_code="AAAA", selected_option="A"),
-        UserBet(user_id="u2", bet_id="b1", room_code="AAAA", selected_option="A"),
-        UserBet(user_id="u3", bet_id="b1", room_code="AAAA", selected_option="A"),
+def _user_bets(picks):
+    """One UserBet per pick, for users u1, u2, ... in order (unvalidated)"""
+    return [
+        UserBet.model_construct(user_id=f"u{i}", bet_id="b1", room_code="AAAA", selected_option=option)
+        for i, option in enumerate(picks, start=1)
     ]
 
-    users = {
-        "u1": User(user_id="u1", room_code="AAAA", nickname="U1", points=1000),
-        "u2": User(user_id="u2", room_code="AAAA", nickname="U2", points=1000),
-        "u3": User(user_id="u3", room_code="AAAA", nickname="U3", points=1000),
-    }
-
-    scores = calculate_scores(user_bets, users, "A", 100)
-
-    # Everyone picked correctly, no losers → refund everyone
-    assert scores["u1"] == 100
-    assert scores["u2"] == 100
-    assert scores["u3"] == 100
-
 
 @pytest.mark.unit
-def test_calculate_scores_no_winners():
-    """Test edge case: no one picked the winning option (should refund)"""
-    user_bets = [
-        UserBet(user_id="u1", bet_id="b1", room_code="AAAA", selected_option="A"),
-        UserBet(user_id="u2", bet_id="b1", room_code="AAAA", selected_option="A"),
-        UserBet(user_id="u3", bet_id="b1", room_code="AAAA", selected_option="B"),
-    ]
-
-    users = {
-        "u1": User(user_id="u1", room_code="AAAA", nickname="U1", points=1000),
-        "u2": User(user_id="u2", room_code="AAAA", nickname="U2", points=1000),
-        "u3": User(user_id="u3", room_code="AAAA", nickname="U3", points=1000),
-    }
-
-    # Winning option is C (no one picked it)
-    scores = calculate_scores(user_bets, users, "C", 100)
-
-    # No winners → refund everyone
-    assert scores["u1"] == 100
-    assert scores["u2"] == 100
-    assert scores["u3"] == 100
-
-
-@pytest.mark.unit
-def test_calculate_scores_single_winner():
-    """Test case: only 1 winner takes entire pot"""
-    user_bets = [
-        UserBet(user_id="u1", bet_id="b1", room_code="AAAA", selected_option="A"),
-        UserBet(user_id="u2", bet_id="b1", room_code="AAAA", selected_option="B"),
-        UserBet(user_id="u3", bet_id="b1", room_code="AAAA", selected_option="B"),
-        UserBet(user_id="u4", bet_id="b1", room_code="AAAA", selected_option="B"),
-    ]
-
-    users = {
-        "u1": User(user_id="u1", room_code="AAAA", nickname="U1", points=1000),
-        "u2": User(user_id="u2", room_code="AAAA", nickname="U2", points=1000),
-        "u3": User(user_id="u3", room_code="AAAA", nickname="U3", points=1000),
-        "u4": User(user_id="u4", room_code="AAAA", nickname="U4", points=1000),
-    }
-
-    scores = calculate_scores(user_bets, users, "A", 100)
-
-    # Pot = 4 * 100 = 400
-    # 1 winner takes all
-    assert scores["u1"] == 400
-    assert scores["u2"] == 0
-    assert scores["u3"] == 0
-    assert scores["u4"] == 0
-
-
-@pytest.mark.unit
-def test_calculate_scores_empty_user_bets():
-    """Test edge case: no user bets"""
-    scores = calculate_scores([], {}, "A", 100)
-    assert scores == {}
-
-
-@pytest.mark.unit
-def test_calculate_scores_different_bet_costs():
-    """Test with different bet costs (points_value)"""
-    user_bets = [
-        UserBet(user_id="u1", bet_id="b1", room_code="AAAA", selected_option="A"),
-        UserBet(user_id="u2", bet_id="b1", room_code="AAAA", selected_option="B"),
-    ]
-
-    users = {
-        "u1": User(user_id="u1", room_code="AAAA", nickname="U1", points=1000),
-        "u2": User(user_id="u2", room_code="AAAA", nickname="U2", points=1000),
-    }
-
-    # Bet cost is 250 points
-    scores = calculate_scores(user_bets, users, "A", 250)
-
-    # Pot = 2 * 250 = 500, winner takes all
-    assert scores["u1"] == 500
-    assert scores["u2"] == 0
+@pytest.mark.parametrize("picks,winning,cost,expected", [
+    # Pot = 5 * 100 = 500; 3 winners split it 166 each (integer division)
+    pytest.param(["A", "A", "A", "B", "B"], "A", 100,
+                 {"u1": 166, "u2": 166, "u3": 166, "u4": 0, "u5": 0}, id="normal_case"),
+    # Everyone picked correctly, no losers → refund everyone
+    pytest.param(["A", "A", "A"], "A", 100,
+                 {"u1": 100, "u2": 100, "u3": 100}, id="all_pick_same_option"),
+    # No one picked the winning option → refund everyone
+    pytest.param(["A", "A", "B"], "C", 100,
+                 {"u1": 100, "u2": 100, "u3": 100}, id="no_winners"),
+    # Pot = 4 * 100 = 400; 1 winner takes all
+    pytest.param(["A", "B", "B", "B"], "A", 100,
+                 {"u1": 400, "u2": 0, "u3": 0, "u4": 0}, id="single_winner"),
+    pytest.param([], "A", 100, {}, id="empty_user_bets"),
+    # Pot = 2 * 250 = 500; winner takes all
+    pytest.param(["A", "B"], "A", 250, {"u1": 500, "u2": 0}, id="different_bet_costs"),
+])
+def test_calculate_scores(five_users, picks, winning, cost, expected):
+    """Test winner/loser payouts and refund edge cases"""
+    scores = calculate_scores(_user_bets(picks), five_users, winning, cost)
+    assert scores == expected
+    # Same payouts without the users map
+    assert calculate_payouts(_user_bets(picks), winning, cost) == expected
 
 
 # ============================================================================
@@ -175,138 +89,40 @@ def test_calculate_scores_different_bet_costs():
 
 
 @pytest.mark.unit
-def test_validate_bet_eligibility_valid():
-    """Test valid bet eligibility"""
-    user = User(user_id="u1", room_code="AAAA", nickname="U1", points=1000)
+@pytest.mark.parametrize("bet_status,user_points,has_existing_bet,expected_valid,error_substr", [
+    pytest.param(BetStatus.OPEN, 1000, False, True, None, id="valid"),
+    pytest.param(BetStatus.PENDING, 1000, False, False, "not open", id="bet_not_open"),
+    pytest.param(BetStatus.OPEN, 50, False, False, "insufficient points", id="insufficient_points"),
+    # User can change bet while bet is still open
+    pytest.param(BetStatus.OPEN, 1000, True, True, None, id="change_bet_while_open"),
+    pytest.param(BetStatus.LOCKED, 1000, True, False, "not open", id="cannot_change_locked_bet"),
+    pytest.param(BetStatus.LOCKED, 1000, False, False, "not open", id="locked_bet"),
+    pytest.param(BetStatus.RESOLVED, 1000, False, False, None, id="resolved_bet"),
+])
+def test_validate_bet_eligibility(bet_status, user_points, has_existing_bet, expected_valid, error_substr):
+    """Test all bet placement validation rules"""
+    user = User(user_id="u1", room_code="AAAA", nickname="U1", points=user_points)
     bet = Bet(
         bet_id="b1",
         room_code="AAAA",
         question="Q?",
         options=["A", "B"],
-        status=BetStatus.OPEN,
+        status=bet_status,
+        winning_option="A" if bet_status == BetStatus.RESOLVED else None,
         points_value=100,
     )
-
-    is_valid, error = validate_bet_eligibility(user, bet, None, 100)
-
-    assert is_valid is True
-    assert error is None
-
-
-@pytest.mark.unit
-def test_validate_bet_eligibility_bet_not_open():
-    """Test bet not in OPEN status"""
-    user = User(user_id="u1", room_code="AAAA", nickname="U1", points=1000)
-    bet = Bet(
-        bet_id="b1",
-        room_code="AAAA",
-        question="Q?",
-        options=["A", "B"],
-        status=BetStatus.PENDING,  # Not open!
-        points_value=100,
+    existing_bet = (
+        UserBet(user_id="u1", bet_id="b1", room_code="AAAA", selected_option="A")
+        if has_existing_bet else None
     )
 
-    is_valid, error = validate_bet_eligibility(user, bet, None, 100)
-
-    assert is_valid is False
-    assert "not open" in error.lower()
-
-
-@pytest.mark.unit
-def test_validate_bet_eligibility_insufficient_points():
-    """Test user doesn't have enough points"""
-    user = User(user_id="u1", room_code="AAAA", nickname="U1", points=50)  # Not enough!
-    bet = Bet(
-        bet_id="b1",
-        room_code="AAAA",
-        question="Q?",
-        options=["A", "B"],
-        status=BetStatus.OPEN,
-        points_value=100,
-    )
-
-    is_valid, error = validate_bet_eligibility(user, bet, None, 100)
-
-    assert is_valid is False
-    assert "insufficient points" in error.lower()
-
-
-@pytest.mark.unit
-def test_validate_bet_eligibility_change_bet_while_open():
-    """Test user can change bet while bet is still open"""
-    user = User(user_id="u1", room_code="AAAA", nickname="U1", points=1000)
-    bet = Bet(
-        bet_id="b1",
-        room_code="AAAA",
-        question="Q?",
-        options=["A", "B"],
-        status=BetStatus.OPEN,
-        points_value=100,
-    )
-    existing_bet = UserBet(user_id="u1", bet_id="b1", room_code="AAAA", selected_option="A")
-
     is_valid, error = validate_bet_eligibility(user, bet, existing_bet, 100)
 
-    assert is_valid is True
-    assert error is None
-
-
-@pytest.mark.unit
-def test_validate_bet_eligibility_cannot_change_locked_bet():
-    """Test user cannot change bet when bet is locked"""
-    user = User(user_id="u1", room_code="AAAA", nickname="U1", points=1000)
-    bet = Bet(
-        bet_id="b1",
-        room_code="AAAA",
-        question="Q?",
-        options=["A", "B"],
-        status=BetStatus.LOCKED,
-        points_value=100,
-    )
-    existing_bet = UserBet(user_id="u1", bet_id="b1", room_code="AAAA", selected_option="A")
-
-    is_valid, error = validate_bet_eligibility(user, bet, existing_bet, 100)
-
-    assert is_valid is False
-    assert "not open" in error.lower()
-
-
-@pytest.mark.unit
-def test_validate_bet_eligibility_locked_bet():
-    """Test bet in LOCKED status"""
-    user = User(user_id="u1", room_code="AAAA", nickname="U1", points=1000)
-    bet = Bet(
-        bet_id="b1",
-        room_code="AAAA",
-        question="Q?",
-        options=["A", "B"],
-        status=BetStatus.LOCKED,
-        points_value=100,
-    )
-
-    is_valid, error = validate_bet_eligibility(user, bet, None, 100)
-
-    assert is_valid is False
-    assert "not open" in error.lower()
-
-
-@pytest.mark.unit
-def test_validate_bet_eligibility_resolved_bet():
-    """Test bet in RESOLVED status"""
-    user = User(user_id="u1", room_code="AAAA", nickname="U1", points=1000)
-    bet = Bet(
-        bet_id="b1",
-        room_code="AAAA",
-        question="Q?",
-        options=["A", "B"],
-        status=BetStatus.RESOLVED,
-        winning_option="A",
-        points_value=100,
-    )
-
-    is_valid, error = validate_bet_eligibility(user, bet, None, 100)
-
-    assert is_valid is False
+    assert is_valid is expected_valid
+    if expected_valid:
+        assert error is None
+    if error_substr is not None:
+        assert error_substr in error.lower()
 
 
 # ============================================================================
@@ -324,33 +140,17 @@ def test_calculate_pot_total():
 
 
 @pytest.mark.unit
-def test_distribute_pot_single_winner():
-    """Test pot distribution with single winner"""
-    result = distribute_pot(["u1"], 500)
-    assert result == {"u1": 500}
-
-
-@pytest.mark.unit
-def test_distribute_pot_multiple_winners():
-    """Test pot distribution with multiple winners"""
-    result = distribute_pot(["u1", "u2", "u3"], 600)
+@pytest.mark.parametrize("winners,pot,expected", [
+    pytest.param(["u1"], 500, {"u1": 500}, id="single_winner"),
     # 600 / 3 = 200 each
-    assert result == {"u1": 200, "u2": 200, "u3": 200}
-
-
-@pytest.mark.unit
-def test_distribute_pot_no_winners():
-    """Test pot distribution with no winners"""
-    result = distribute_pot([], 500)
-    assert result == {}
-
-
-@pytest.mark.unit
-def test_distribute_pot_integer_division():
-    """Test pot distribution uses integer division (no fractional points)"""
-    result = distribute_pot(["u1", "u2", "u3"], 500)
-    # 500 / 3 = 166.66... → 166 each (integer division)
-    assert result == {"u1": 166, "u2": 166, "u3": 166}
+    pytest.param(["u1", "u2", "u3"], 600, {"u1": 200, "u2": 200, "u3": 200}, id="multiple_winners"),
+    pytest.param([], 500, {}, id="no_winners"),
+    # 500 / 3 = 166.66... → 166 each (no fractional points)
+    pytest.param(["u1", "u2", "u3"], 500, {"u1": 166, "u2": 166, "u3": 166}, id="integer_division"),
+])
+def test_distribute_pot(winners, pot, expected):
+    """Test pot distribution among winners"""
+    assert distribute_pot(winners, pot) == expected
 
 
 # ============================================================================
@@ -359,9 +159,8 @@ def test_distribute_pot_integer_division():
 
 
 @pytest.mark.unit
-def test_calculate_leaderboard_sorted_by_points():
+def test_calculate_leaderboard_sorted_by_points(now):
     """Test leaderboard sorted by points (descending)"""
-    now = datetime.utcnow()
     users = {
         "u1": User(user_id="u1", room_code="AAAA", nickname="Alice", points=1200, joined_at=now),
         "u2": User(user_id="u2", room_code="AAAA", nickname="Bob", points=1500, joined_at=now),
@@ -380,9 +179,8 @@ def test_calculate_leaderboard_sorted_by_points():
 
 
 @pytest.mark.unit
-def test_calculate_leaderboard_tie_breaking_by_join_time():
+def test_calculate_leaderboard_tie_breaking_by_join_time(now):
     """Test leaderboard tie-breaking by join time (earlier wins)"""
-    now = datetime.utcnow()
     earlier = now - timedelta(minutes=5)
     later = now + timedelta(minutes=5)
 
@@ -401,9 +199,8 @@ def test_calculate_leaderboard_tie_breaking_by_join_time():
 
 
 @pytest.mark.unit
-def test_calculate_leaderboard_includes_is_admin():
+def test_calculate_leaderboard_includes_is_admin(now):
     """Test leaderboard includes isAdmin field"""
-    now = datetime.utcnow()
     users = {
         "u1": User(user_id="u1", room_code="AAAA", nickname="Host", points=1000, is_admin=True, joined_at=now),
         "u2": User(user_id="u2", room_code="AAAA", nickname="Guest", points=900, is_admin=False, joined_at=now),
@@ -423,9 +220,8 @@ def test_calculate_leaderboard_empty():
 
 
 @pytest.mark.unit
-def test_calculate_leaderboard_single_user():
+def test_calculate_leaderboard_single_user(now):
     """Test leaderboard with single user"""
-    now = datetime.utcnow()
     users = {
         "u1": User(user_id="u1", room_code="AAAA", nickname="Solo", points=1000, joined_at=now),
     }
@@ -443,68 +239,51 @@ def test_calculate_leaderboard_single_user():
 
 
 @pytest.mark.unit
-def test_validate_room_code_valid():
+@pytest.mark.parametrize("code", ["AAAA", "ZZZZ", "A2B3"])
+def test_validate_room_code_valid(code):
     """Test valid room codes"""
-    is_valid, error = validate_room_code("AAAA")
-    assert is_valid is True
-    assert error is None
-
-    is_valid, error = validate_room_code("ZZZZ")
-    assert is_valid is True
-
-    is_valid, error = validate_room_code("A2B3")
-    assert is_valid is True
+    assert validate_room_code(code) == (True, None)
 
 
 @pytest.mark.unit
-def test_validate_room_code_wrong_length():
+@pytest.mark.parametrize("code", ["AAA", "AAAAA"])  # Too short, 5 chars invalid
+def test_validate_room_code_wrong_length(code):
     """Test room code wrong length"""
-    is_valid, error = validate_room_code("AAA")  # Too short
-    assert is_valid is False
-    assert "4 or 6" in error
-
-    is_valid, error = validate_room_code("AAAAA")  # 5 chars invalid
+    is_valid, error = validate_room_code(code)
     assert is_valid is False
     assert "4 or 6" in error
 
 
 @pytest.mark.unit
-def test_validate_room_code_not_alphanumeric():
+@pytest.mark.parametrize("code", ["AA-A", "AA A"])
+def test_validate_room_code_not_alphanumeric(code):
     """Test room code with non-alphanumeric characters"""
-    is_valid, error = validate_room_code("AA-A")
+    is_valid, error = validate_room_code(code)
     assert is_valid is False
     assert "letters and numbers" in error
 
-    is_valid, error = validate_room_code("AA A")  # Space
-    assert is_valid is False
-
 
 @pytest.mark.unit
-def test_validate_room_code_not_uppercase():
+@pytest.mark.parametrize("code", ["aaaa", "AaAa"])
+def test_validate_room_code_not_uppercase(code):
     """Test room code not uppercase"""
-    is_valid, error = validate_room_code("aaaa")
+    is_valid, error = validate_room_code(code)
     assert is_valid is False
     assert "uppercase" in error
 
-    is_valid, error = validate_room_code("AaAa")
-    assert is_valid is False
-
 
 @pytest.mark.unit
-def test_validate_room_code_confusing_characters():
+@pytest.mark.parametrize("code,msg", [
+    ("OOOO", "confusing"),  # O (letter O)
+    ("IIII", "confusing"),  # I (letter I)
+    ("1111", "uppercase"),  # 1 (digit one) - no letters, so the uppercase check fires first
+    ("LLLL", "confusing"),  # L (letter L)
+])
+def test_validate_room_code_confusing_characters(code, msg):
     """Test room code with confusing characters (O, I, 1, L)"""
-    is_valid, error = validate_room_code("OOOO")  # O (letter O)
-    assert is_valid is False
-    assert "confusing" in error.lower()
-
-    is_valid, error = validate_room_code("IIII")  # I (letter I)
-    assert is_valid is False
-
-    is_valid, error = validate_room_code("1111")  # 1 (digit one)
-    assert is_valid is False
-
-    is_valid, error = validate_room_code("LLLL")  # L (letter L)
+    is_valid, error = validate_room_code(code)
     assert is_valid is False
+    assert msg in error.lower()
 
 
 # ============================================================================
@@ -513,51 +292,24 @@ def test_validate_room_code_confusing_characters():
 
 
 @pytest.mark.unit
-def test_validate_nickname_valid():
+@pytest.mark.parametrize("nickname", ["Alice", "Bob123", "X", "A" * 20])  # 1 and 20 chars are ok
+def test_validate_nickname_valid(nickname):
     """Test valid nicknames"""
-    is_valid, error = validate_nickname("Alice")
-    assert is_valid is True
-    assert error is None
-
-    is_valid, error = validate_nickname("Bob123")
-    assert is_valid is True
-
-    is_valid, error = validate_nickname("X")  # 1 char is ok
-    assert is_valid is True
+    assert validate_nickname(nickname) == (True, None)
 
 
 @pytest.mark.unit
-def test_validate_nickname_empty():
-    """Test empty nickname"""
-    is_valid, error = validate_nickname("")
+@pytest.mark.parametrize("nickname", ["", "   ", "\t\n", None])
+def test_validate_nickname_empty(nickname):
+    """Test empty, whitespace-only and None nicknames"""
+    is_valid, error = validate_nickname(nickname)
     assert is_valid is False
     assert "empty" in error.lower()
 
 
-@pytest.mark.unit
-def test_validate_nickname_whitespace_only():
-    """Test whitespace-only nickname"""
-    is_valid, error = validate_nickname("   ")
-    assert is_valid is False
-    assert "empty" in error.lower()
-
-    is_valid, error = validate_nickname("\t\n")
-    assert is_valid is False
-
-
 @pytest.mark.unit
 def test_validate_nickname_too_long():
     """Test nickname too long"""
     is_valid, error = validate_nickname("A" * 21)  # 21 chars
     assert is_valid is False
     assert "20 characters" in error
-
-    is_valid, error = validate_nickname("A" * 20)  # Exactly 20 is ok
-    assert is_valid is True
-
-
-@pytest.mark.unit
-def test_validate_nickname_none():
-    """Test None nickname"""
-    is_valid, error = validate_nickname(None)
-    assert is_valid is False
@@ -0,0 +1,74 @@
+"""
+Microbenchmarks for hot pure functions in game_logic.py
+
+Tracks per-call time of the functions on the bet resolution and placement
+paths so regressions show up in CI:
+- calculate_scores() over a 100-bettor bet
+- distribute_pot() / calculate_pot_total()
+- validate_nickname() / validate_room_code()
+
+Requires pytest-benchmark (skipped otherwise). Run with:
+    pytest tests/test_game_logic_benchmarks.py --benchmark-only
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from game_logic import (
+    calculate_scores,
+    calculate_pot_total,
+    distribute_pot,
+    validate_nickname,
+    validate_room_code,
+)
+from models.user import User
+from models.user_bet import UserBet
+
+
+@pytest.fixture(scope="module")
+def hundred_users_and_bets():
+    """100 users and their bets; 60 pick "A", 40 pick "B" (unvalidated)"""
+    users = {
+        f"u{i}": User.model_construct(user_id=f"u{i}", room_code="AAAA", nickname=f"U{i}", points=1000)
+        for i in range(100)
+    }
+    user_bets = [
+        UserBet.model_construct(
+            user_id=f"u{i}", bet_id="b1", room_code="AAAA", selected_option="A" if i < 60 else "B"
+        )
+        for i in range(100)
+    ]
+    return users, user_bets
+
+
+@pytest.mark.benchmark(group="calculate_scores")
+def test_bench_calculate_scores_100(benchmark, hundred_users_and_bets):
+    users, user_bets = hundred_users_and_bets
+    scores = benchmark(calculate_scores, user_bets, users, "A", 100)
+    # Pot = 100 * 100 = 10000; 60 winners split it 166 each
+    assert scores["u0"] == 166
+
+
+@pytest.mark.benchmark(group="pot")
+def test_bench_distribute_pot_100(benchmark):
+    winners = [f"u{i}" for i in range(100)]
+    result = benchmark(distribute_pot, winners, 10000)
+    assert result["u0"] == 100
+
+
+@pytest.mark.benchmark(group="pot")
+def test_bench_calculate_pot_total(benchmark):
+    assert benchmark(calculate_pot_total, 100, 100) == 10000
+
+
+@pytest.mark.benchmark(group="validation")
+def test_bench_validate_nickname(benchmark):
+    is_valid, _ = benchmark(validate_nickname, "Alice")
+    assert is_valid is True
+
+
+@pytest.mark.benchmark(group="validation")
+def test_bench_validate_room_code(benchmark):
+    is_valid, _ = benchmark(validate_room_code, "ABCD")
+    assert is_valid is True
@@ -15,16 +15,25 @@ from pydantic import ValidationError
 from models.bet import Bet, BetStatus
 
 
+# Happy-path tests build bets with model_construct to skip validation;
+# the validation tests below keep the real constructor.
+BET_DEFAULTS = dict(
+    bet_id="test-id",
+    room_code="AAAA",
+    question="Q?",
+    options=["A", "B"],
+    points_value=100,
+)
+
+
+def _bet(**kw):
+    return Bet.model_construct(**{**BET_DEFAULTS, **kw})
+
+
 @pytest.mark.unit
 def test_bet_creation_valid():
     """Test creating a valid bet"""
-    bet = Bet(
-        bet_id="test-id",
-        room_code="AAAA",
-        question="Test question?",
-        options=["Option 1", "Option 2"],
-        points_value=100,
-    )
+    bet = Bet(**BET_DEFAULTS)
 
     assert bet.bet_id == "test-id"
     assert bet.room_code == "AAAA"
@@ -33,173 +42,50 @@ def test_bet_creation_valid():
 
 
 @pytest.mark.unit
-def test_bet_room_code_validation():
+@pytest.mark.parametrize("room_code", [
+    "AAAA",  # 4-char (legacy event rooms)
+    "AAAAAA",  # 6-char (tournament/match rooms)
+])
+def test_bet_room_code_validation(room_code):
     """Test room code validation (must be 4-6 chars)"""
-    # Valid 4-char room code (legacy event rooms)
-    bet = Bet(
-        bet_id="test-id",
-        room_code="AAAA",
-        question="Q?",
-        options=["A", "B"],
-        points_value=100,
-    )
-    assert bet.room_code == "AAAA"
-
-    # Valid 6-char room code (tournament/match rooms)
-    bet = Bet(
-        bet_id="test-id",
-        room_code="AAAAAA",
-        question="Q?",
-        options=["A", "B"],
-        points_value=100,
-    )
-    assert bet.room_code == "AAAAAA"
-
-    # Invalid: too short
-    with pytest.raises(ValidationError):
-        Bet(
-            bet_id="test-id",
-            room_code="AAA",  # Only 3 chars
-            question="Q?",
-            options=["A", "B"],
-            points_value=100,
-        )
-
-    # Invalid: too long
-    with pytest.raises(ValidationError):
-        Bet(
-            bet_id="test-id",
-            room_code="AAAAAAA",  # 7 chars
-            question="Q?",
-            options=["A", "B"],
-            points_value=100,
-        )
-
-
-@pytest.mark.unit
-def test_bet_question_validation():
-    """Test question validation (must not be empty)"""
-    # Valid question
-    bet = Bet(
-        bet_id="test-id",
-        room_code="AAAA",
-        question="Q?",
-        options=["A", "B"],
-        points_value=100,
-    )
-    assert bet.question == "Q?"
-
-    # Invalid: empty question
-    with pytest.raises(ValidationError):
-        Bet(
-            bet_id="test-id",
-            room_code="AAAA",
-            question="",  # Empty
-            options=["A", "B"],
-            points_value=100,
-        )
+    bet = Bet(**{**BET_DEFAULTS, "room_code": room_code})
+    assert bet.room_code == room_code
 
 
 @pytest.mark.unit
-def test_bet_options_validation():
-    """Test options validation (must have at least 2)"""
-    # Valid: 2 options
-    bet = Bet(
-        bet_id="test-id",
-        room_code="AAAA",
-        question="Q?",
-        options=["A", "B"],
-        points_value=100,
-    )
-    assert len(bet.options) == 2
-
-    # Valid: 3+ options
-    bet = Bet(
-        bet_id="test-id",
-        room_code="AAAA",
-        question="Q?",
-        options=["A", "B", "C", "D"],
-        points_value=100,
-    )
-    assert len(bet.options) == 4
-
-    # Invalid: only 1 option
-    with pytest.raises(ValidationError):
-        Bet(
-            bet_id="test-id",
-            room_code="AAAA",
-            question="Q?",
-            options=["A"],  # Only 1
-            points_value=100,
-        )
+@pytest.mark.parametrize("patch", [
+    {"options": ["A", "B"]},  # 2 options
+    {"options": ["A", "B", "C", "D"]},  # 3+ options
+    {"points_value": 10},  # Minimum
+    {"points_value": 1000},  # Maximum
+])
+def test_bet_field_bounds_valid(patch):
+    """Test options (at least 2) and points_value (10-1000) bounds accept valid values"""
+    bet = Bet(**{**BET_DEFAULTS, **patch})
+    for field, value in patch.items():
+        assert getattr(bet, field) == value
 
 
 @pytest.mark.unit
-def test_bet_points_value_validation():
-    """Test points_value validation (must be between 10 and 1000)"""
-    # Valid: 100 points
-    bet = Bet(
-        bet_id="test-id",
-        room_code="AAAA",
-        question="Q?",
-        options=["A", "B"],
-        points_value=100,
-    )
-    assert bet.points_value == 100
-
-    # Valid: minimum (10)
-    bet = Bet(
-        bet_id="test-id",
-        room_code="AAAA",
-        question="Q?",
-        options=["A", "B"],
-        points_value=10,
-    )
-    assert bet.points_value == 10
-
-    # Valid: maximum (1000)
-    bet = Bet(
-        bet_id="test-id",
-        room_code="AAAA",
-        question="Q?",
-        options=["A", "B"],
-        points_value=1000,
-    )
-    assert bet.points_value == 1000
-
-    # Invalid: too low
-    with pytest.raises(ValidationError):
-        Bet(
-            bet_id="test-id",
-            room_code="AAAA",
-            question="Q?",
-            options=["A", "B"],
-            points_value=5,  # Less than 10
-        )
-
-    # Invalid: too high
+@pytest.mark.parametrize("patch", [
+    {"room_code": "AAA"},  # Too short
+    {"room_code": "AAAAAAA"},  # Too long (7 chars)
+    {"question": ""},  # Empty question
+    {"options": ["A"]},  # Only 1 option
+    {"points_value": 5},  # Less than 10
+    {"points_value": 1500},  # More than 1000
+])
+def test_bet_validation_errors(patch):
+    """Test invalid field values are rejected"""
     with pytest.raises(ValidationError):
-        Bet(
-            bet_id="test-id",
-            room_code="AAAA",
-            question="Q?",
-            options=["A", "B"],
-            points_value=1500,  # More than 1000
-        )
+        Bet(**{**BET_DEFAULTS, **patch})
 
 
 @pytest.mark.unit
 def test_bet_can_accept_bets():
     """Test can_accept_bets() method"""
     # PENDING: cannot accept bets
-    bet = Bet(
-        bet_id="test-id",
-        room_code="AAAA",
-        question="Q?",
-        options=["A", "B"],
-        status=BetStatus.PENDING,
-        points_value=100,
-    )
+    bet = _bet(status=BetStatus.PENDING)
     assert bet.can_accept_bets() is False
 
     # OPEN: can accept bets
@@ -218,14 +104,7 @@ def test_bet_can_accept_bets():
 @pytest.mark.unit
 def test_bet_is_resolved():
     """Test is_resolved() method"""
-    bet = Bet(
-        bet_id="test-id",
-        room_code="AAAA",
-        question="Q?",
-        options=["A", "B"],
-        status=BetStatus.PENDING,
-        points_value=100,
-    )
+    bet = _bet(status=BetStatus.PENDING)
 
     # Not resolved in PENDING, OPEN, or LOCKED states
     assert bet.is_resolved() is False
@@ -242,20 +121,14 @@ def test_bet_is_resolved():
 
 
 @pytest.mark.unit
-def test_bet_to_dict():
+def test_bet_to_dict(now):
     """Test to_dict() serialization"""
-    now = datetime.utcnow()
-    bet = Bet(
-        bet_id="test-id",
-        room_code="AAAA",
-        question="Q?",
-        options=["A", "B"],
+    bet = _bet(
         status=BetStatus.RESOLVED,
         opened_at=now,
         locked_at=now,
         resolved_at=now,
         winning_option="A",
-        points_value=100,
     )
 
     data = bet.to_dict()
@@ -273,9 +146,8 @@ def test_bet_to_dict():
 
 
 @pytest.mark.unit
-def test_bet_from_dict():
+def test_bet_from_dict(now):
     """Test from_dict() deserialization"""
-    now = datetime.utcnow()
     data = {
         "betId": "test-id",
         "roomCode": "AAAA",
@@ -295,7 +167,7 @@ def test_bet_from_dict():
     assert bet.room_code == "AAAA"
     assert bet.question == "Q?"
     assert bet.options == ["A", "B"]
-    assert bet.status == BetStatus.RESOLVED
+    assert bet.status is BetStatus.RESOLVED
     assert bet.opened_at == now
     assert bet.locked_at == now
     assert bet.resolved_at == now
@@ -320,13 +192,25 @@ def test_bet_from_dict_backwards_compatibility():
     assert bet.points_value == 100
 
 
+@pytest.mark.unit
+def test_bet_from_dict_rejects_invalid_stored_data():
+    """Test from_dict() fails fast on a malformed document (e.g. written by older code)"""
+    data = {
+        "betId": "test-id",
+        "roomCode": "AAAA",
+        "question": "Q?",
+        "options": None,
+        "status": "open",
+    }
+
+    with pytest.raises(ValidationError):
+        Bet.from_dict(data)
+
+
 @pytest.mark.unit
 def test_bet_roundtrip_serialization():
     """Test to_dict() and from_dict() roundtrip"""
-    original = Bet(
-        bet_id="test-id",
-        room_code="AAAA",
-        question="Q?",
+    original = _bet(
         options=["A", "B", "C"],
         status=BetStatus.OPEN,
         opened_at=datetime.utcnow(),
@@ -16,15 +16,26 @@ from pydantic import ValidationError
 from models.room import Room
 
 
+# Happy-path tests build rooms with model_construct to skip validation;
+# creation/validation tests keep the real constructor.
+ROOM_DEFAULTS = dict(
+    code="AAAA",
+    event_template="grammys-2026",
+    host_id="host-user-id",
+)
+
+
+def _room(**kw):
+    return Room.model_construct(**{**ROOM_DEFAULTS, **kw})
+
+
 @pytest.mark.unit
 def test_room_creation_valid():
     """Test creating a valid room"""
     room = Room(
-        code="AAAA",
-        event_template="grammys-2026",
+        **ROOM_DEFAULTS,
         event_name="Grammy Awards 2026",
         status="waiting",
-        host_id="host-user-id",
         automation_enabled=True,
     )
 
@@ -39,11 +50,7 @@ def test_room_creation_valid():
 @pytest.mark.unit
 def test_room_default_values():
     """Test default values for room"""
-    room = Room(
-        code="AAAA",
-        event_template="grammys-2026",
-        host_id="host-user-id",
-    )
+    room = Room(**ROOM_DEFAULTS)
 
     # Should default to "waiting"
     assert room.status == "waiting"
@@ -56,70 +63,30 @@ def test_room_default_values():
 
 
 @pytest.mark.unit
-def test_room_code_validation():
+@pytest.mark.parametrize("code", [
+    "AAAA",  # 4-char (legacy event rooms)
+    "AAAAAA",  # 6-char (tournament/match rooms)
+])
+def test_room_code_validation(code):
     """Test room code validation (must be 4-6 chars)"""
-    # Valid 4-char (legacy event rooms)
-    room = Room(
-        code="AAAA",
-        event_template="grammys-2026",
-        host_id="host-user-id",
-    )
-    assert room.code == "AAAA"
-
-    # Valid 6-char (tournament/match rooms)
-    room = Room(
-        code="AAAAAA",
-        event_template="grammys-2026",
-        host_id="host-user-id",
-    )
-    assert room.code == "AAAAAA"
+    room = Room(**{**ROOM_DEFAULTS, "code": code})
+    assert room.code == code
 
-    # Invalid: too short
-    with pytest.raises(ValidationError):
-        Room(
-            code="AAA",
-            event_template="grammys-2026",
-            host_id="host-user-id",
-        )
 
-    # Invalid: too long
+@pytest.mark.unit
+@pytest.mark.parametrize("code", ["AAA", "AAAAAAA"])  # 3 chars, 7 chars
+def test_room_code_invalid(code):
+    """Test room code outside 4-6 chars is rejected"""
     with pytest.raises(ValidationError):
-        Room(
-            code="AAAAAAA",  # 7 chars
-            event_template="grammys-2026",
-            host_id="host-user-id",
-        )
+        Room(**{**ROOM_DEFAULTS, "code": code})
 
 
 @pytest.mark.unit
-def test_room_status_values():
+@pytest.mark.parametrize("status", ["waiting", "active", "finished"])
+def test_room_status_values(status):
     """Test valid room status values"""
-    # Waiting
-    room = Room(
-        code="AAAA",
-        event_template="grammys-2026",
-        host_id="host-user-id",
-        status="waiting",
-    )
-    assert room.status == "waiting"
-
-    # Active
-    room = Room(
-        code="AAAA",
-        event_template="grammys-2026",
-        host_id="host-user-id",
-        status="active",
-    )
-    assert room.status == "active"
-
-    # Finished
-    room = Room(
-        code="AAAA",
-        event_template="grammys-2026",
-        host_id="host-user-id",
-        status="finished",
-    )
-    assert room.status == "finished"
+    room = Room(**{**ROOM_DEFAULTS, "status": status})
+    assert room.status == status
 
 
 @pytest.mark.unit
@@ -128,19 +95,13 @@ def test_room_is_expired():
     now = datetime.utcnow()
 
     # Not expired (expires in future)
-    room = Room(
-        code="AAAA",
-        event_template="grammys-2026",
-        host_id="host-user-id",
+    room = _room(
         expires_at=now + timedelta(hours=1),
     )
     assert room.is_expired() is False
 
     # Expired (expires in past)
-    room = Room(
-        code="AAAA",
-        event_template="grammys-2026",
-        host_id="host-user-id",
+    room = _room(
         expires_at=now - timedelta(hours=1),
     )
     assert room.is_expired() is True
@@ -152,40 +113,28 @@ def test_room_can_accept_bets():
     now = datetime.utcnow()
 
     # Active and not expired -> can accept bets
-    room = Room(
-        code="AAAA",
-        event_template="grammys-2026",
-        host_id="host-user-id",
+    room = _room(
         status="active",
         expires_at=now + timedelta(hours=1),
     )
     assert room.can_accept_bets() is True
 
     # Waiting status -> cannot accept bets
-    room = Room(
-        code="AAAA",
-        event_template="grammys-2026",
-        host_id="host-user-id",
+    room = _room(
         status="waiting",
         expires_at=now + timedelta(hours=1),
     )
     assert room.can_accept_bets() is False
 
     # Finished status -> cannot accept bets
-    room = Room(
-        code="AAAA",
-        event_template="grammys-2026",
-        host_id="host-user-id",
+    room = _room(
         status="finished",
         expires_at=now + timedelta(hours=1),
     )
     assert room.can_accept_bets() is False
 
     # Active but expired -> cannot accept bets
-    room = Room(
-        code="AAAA",
-        event_template="grammys-2026",
-        host_id="host-user-id",
+    room = _room(
         status="active",
         expires_at=now - timedelta(hours=1),
     )
@@ -193,17 +142,13 @@ def test_room_can_accept_bets():
 
 
 @pytest.mark.unit
-def test_room_to_dict():
+def test_room_to_dict(now):
     """Test to_dict() serialization"""
-    now = datetime.utcnow()
     expires = now + timedelta(hours=24)
 
-    room = Room(
-        code="AAAA",
-        event_template="grammys-2026",
+    room = _room(
         event_name="Grammy Awards 2026",
         status="active",
-        host_id="host-user-id",
         automation_enabled=True,
         created_at=now,
         expires_at=expires,
@@ -222,9 +167,8 @@ def test_room_to_dict():
 
 
 @pytest.mark.unit
-def test_room_from_dict():
+def test_room_from_dict(now):
     """Test from_dict() deserialization"""
-    now = datetime.utcnow()
     expires = now + timedelta(hours=24)
 
     data = {
@@ -251,9 +195,8 @@ def test_room_from_dict():
 
 
 @pytest.mark.unit
-def test_room_from_dict_defaults():
+def test_room_from_dict_defaults(now):
     """Test from_dict() with missing optional fields"""
-    now = datetime.utcnow()
     expires = now + timedelta(hours=24)
 
     data = {
@@ -276,12 +219,9 @@ def test_room_from_dict_defaults():
 @pytest.mark.unit
 def test_room_roundtrip_serialization():
     """Test to_dict() and from_dict() roundtrip"""
-    original = Room(
-        code="AAAA",
-        event_template="grammys-2026",
+    original = _room(
         event_name="Grammy Awards 2026",
         status="active",
-        host_id="host-user-id",
         automation_enabled=False,
     )
 
@@ -301,11 +241,7 @@ def test_room_roundtrip_serialization():
 def test_room_expires_at_default():
     """Test expires_at default is 24 hours from now"""
     before = datetime.utcnow()
-    room = Room(
-        code="AAAA",
-        event_template="grammys-2026",
-        host_id="host-user-id",
-    )
+    room = Room(**ROOM_DEFAULTS)
     after = datetime.utcnow()
 
     # expires_at should be approximately 24 hours from now
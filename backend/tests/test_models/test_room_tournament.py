@@ -1,7 +1,7 @@
 """Tests for Room model tournament fields"""
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import timedelta
 from models.room import Room, MatchDetails
 
 
@@ -202,9 +202,8 @@ def test_match_details_date_stored():
 
 
 @pytest.mark.unit
-def test_room_from_dict_tournament_fields():
+def test_room_from_dict_tournament_fields(now):
     """Test deserialization handles tournament fields"""
-    now = datetime.utcnow()
     data = {
         "code": "FGHJ32",
         "eventTemplate": "ipl-2026",
@@ -232,9 +231,8 @@ def test_room_from_dict_tournament_fields():
 
 
 @pytest.mark.unit
-def test_room_from_dict_with_title():
+def test_room_from_dict_with_title(now):
     """Test deserialization handles match details with title"""
-    now = datetime.utcnow()
     data = {
         "code": "FGHJ32",
         "eventTemplate": "ipl-2026",
@@ -261,9 +259,8 @@ def test_room_from_dict_with_title():
 
 
 @pytest.mark.unit
-def test_room_from_dict_legacy_no_tournament_fields():
+def test_room_from_dict_legacy_no_tournament_fields(now):
     """Test deserialization of legacy data without tournament fields"""
-    now = datetime.utcnow()
     data = {
         "code": "AAAA",
         "eventTemplate": "grammys-2026",
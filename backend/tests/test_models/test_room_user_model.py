@@ -1,7 +1,6 @@
 """Tests for RoomUser model"""
 
 import pytest
-from datetime import datetime
 from pydantic import ValidationError
 from models.room_user import RoomUser
 
@@ -37,9 +36,8 @@ def test_room_user_default_points():
 
 
 @pytest.mark.unit
-def test_room_user_to_dict():
+def test_room_user_to_dict(now):
     """Test RoomUser serialization"""
-    now = datetime.utcnow()
     ru = RoomUser(
         id="ABCDE2_user1",
         room_code="ABCDE2",
@@ -60,9 +58,8 @@ def test_room_user_to_dict():
 
 
 @pytest.mark.unit
-def test_room_user_from_dict():
+def test_room_user_from_dict(now):
     """Test RoomUser deserialization"""
-    now = datetime.utcnow()
     data = {
         "id": "ABCDE2_user1",
         "roomCode": "ABCDE2",
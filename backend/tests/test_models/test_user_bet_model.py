@@ -9,20 +9,28 @@ Tests verify:
 """
 
 import pytest
-from datetime import datetime
 from pydantic import ValidationError
 from models.user_bet import UserBet
 
 
+# Happy-path tests build user bets with model_construct to skip validation;
+# creation/validation tests keep the real constructor.
+USER_BET_DEFAULTS = dict(
+    user_id="user1",
+    bet_id="bet1",
+    room_code="AAAA",
+    selected_option="Option A",
+)
+
+
+def _user_bet(**kw):
+    return UserBet.model_construct(**{**USER_BET_DEFAULTS, **kw})
+
+
 @pytest.mark.unit
 def test_user_bet_creation_valid():
     """Test creating a valid user bet"""
-    user_bet = UserBet(
-        user_id="user1",
-        bet_id="bet1",
-        room_code="AAAA",
-        selected_option="Option A",
-    )
+    user_bet = UserBet(**USER_BET_DEFAULTS)
 
     assert user_bet.user_id == "user1"
     assert user_bet.bet_id == "bet1"
@@ -32,54 +40,28 @@ def test_user_bet_creation_valid():
 
 
 @pytest.mark.unit
-def test_user_bet_room_code_validation():
-    """Test room code validation (must be 4 chars)"""
-    # Valid
-    user_bet = UserBet(
-        user_id="user1",
-        bet_id="bet1",
-        room_code="AAAA",
-        selected_option="Option A",
-    )
-    assert user_bet.room_code == "AAAA"
+@pytest.mark.parametrize("room_code", [
+    "AAAA",
+    "AAAAAA",  # 6-char room code (tournament/match rooms)
+])
+def test_user_bet_room_code_validation(room_code):
+    """Test room code validation (must be 4-6 chars)"""
+    user_bet = UserBet(**{**USER_BET_DEFAULTS, "room_code": room_code})
+    assert user_bet.room_code == room_code
 
-    # Invalid: too short
-    with pytest.raises(ValidationError):
-        UserBet(
-            user_id="user1",
-            bet_id="bet1",
-            room_code="AAA",
-            selected_option="Option A",
-        )
-
-    # Valid: 6-char room code (tournament/match rooms)
-    user_bet = UserBet(
-        user_id="user1",
-        bet_id="bet1",
-        room_code="AAAAAA",
-        selected_option="Option A",
-    )
-    assert user_bet.room_code == "AAAAAA"
 
-    # Invalid: too long
+@pytest.mark.unit
+@pytest.mark.parametrize("room_code", ["AAA", "AAAAAAA"])  # 3 chars, 7 chars
+def test_user_bet_room_code_invalid(room_code):
+    """Test room code outside 4-6 chars is rejected"""
     with pytest.raises(ValidationError):
-        UserBet(
-            user_id="user1",
-            bet_id="bet1",
-            room_code="AAAAAAA",  # 7 chars
-            selected_option="Option A",
-        )
+        UserBet(**{**USER_BET_DEFAULTS, "room_code": room_code})
 
 
 @pytest.mark.unit
 def test_user_bet_is_winner():
     """Test is_winner() method"""
-    user_bet = UserBet(
-        user_id="user1",
-        bet_id="bet1",
-        room_code="AAAA",
-        selected_option="Option A",
-    )
+    user_bet = _user_bet()
 
     # Winner
     assert user_bet.is_winner("Option A") is True
@@ -92,12 +74,7 @@ def test_user_bet_is_winner():
 @pytest.mark.unit
 def test_user_bet_is_winner_case_sensitive():
     """Test is_winner() is case sensitive"""
-    user_bet = UserBet(
-        user_id="user1",
-        bet_id="bet1",
-        room_code="AAAA",
-        selected_option="Option A",
-    )
+    user_bet = _user_bet()
 
     # Case sensitive match
     assert user_bet.is_winner("Option A") is True
@@ -108,12 +85,7 @@ def test_user_bet_is_winner_case_sensitive():
 @pytest.mark.unit
 def test_user_bet_with_points_won():
     """Test with_points_won() method (immutable)"""
-    user_bet = UserBet(
-        user_id="user1",
-        bet_id="bet1",
-        room_code="AAAA",
-        selected_option="Option A",
-    )
+    user_bet = _user_bet()
 
     # Set points won
     updated_bet = user_bet.with_points_won(500)
@@ -123,18 +95,13 @@ def test_user_bet_with_points_won():
     # New instance updated
     assert updated_bet.points_won == 500
     # Different instance
-    assert id(user_bet) != id(updated_bet)
+    assert user_bet is not updated_bet
 
 
 @pytest.mark.unit
 def test_user_bet_with_points_won_zero():
     """Test with_points_won() with zero points (loser)"""
-    user_bet = UserBet(
-        user_id="user1",
-        bet_id="bet1",
-        room_code="AAAA",
-        selected_option="Option A",
-    )
+    user_bet = _user_bet()
 
     # Loser gets 0 points
     updated_bet = user_bet.with_points_won(0)
@@ -143,14 +110,9 @@ def test_user_bet_with_points_won_zero():
 
 
 @pytest.mark.unit
-def test_user_bet_to_dict():
+def test_user_bet_to_dict(now):
     """Test to_dict() serialization"""
-    now = datetime.utcnow()
-    user_bet = UserBet(
-        user_id="user1",
-        bet_id="bet1",
-        room_code="AAAA",
-        selected_option="Option A",
+    user_bet = _user_bet(
         placed_at=now,
         points_won=500,
     )
@@ -166,14 +128,9 @@ def test_user_bet_to_dict():
 
 
 @pytest.mark.unit
-def test_user_bet_to_dict_no_points_won():
+def test_user_bet_to_dict_no_points_won(now):
     """Test to_dict() with no points_won (before resolution)"""
-    now = datetime.utcnow()
-    user_bet = UserBet(
-        user_id="user1",
-        bet_id="bet1",
-        room_code="AAAA",
-        selected_option="Option A",
+    user_bet = _user_bet(
         placed_at=now,
     )
 
@@ -183,9 +140,8 @@ def test_user_bet_to_dict_no_points_won():
 
 
 @pytest.mark.unit
-def test_user_bet_from_dict():
+def test_user_bet_from_dict(now):
     """Test from_dict() deserialization"""
-    now = datetime.utcnow()
     data = {
         "userId": "user1",
         "betId": "bet1",
@@ -206,9 +162,8 @@ def test_user_bet_from_dict():
 
 
 @pytest.mark.unit
-def test_user_bet_from_dict_no_points_won():
+def test_user_bet_from_dict_no_points_won(now):
     """Test from_dict() with missing points_won"""
-    now = datetime.utcnow()
     data = {
         "userId": "user1",
         "betId": "bet1",
@@ -225,11 +180,7 @@ def test_user_bet_from_dict_no_points_won():
 @pytest.mark.unit
 def test_user_bet_roundtrip_serialization():
     """Test to_dict() and from_dict() roundtrip"""
-    original = UserBet(
-        user_id="user1",
-        bet_id="bet1",
-        room_code="AAAA",
-        selected_option="Option A",
+    original = _user_bet(
         points_won=250,
     )
 
@@ -242,3 +193,12 @@ def test_user_bet_roundtrip_serialization():
     assert restored.room_code == original.room_code
     assert restored.selected_option == original.selected_option
     assert restored.points_won == original.points_won
+
+
+@pytest.mark.unit
+def test_user_bet_is_frozen():
+    """Test attribute assignment is rejected (use with_points_won instead)"""
+    user_bet = _user_bet()
+
+    with pytest.raises(ValidationError):
+        user_bet.points_won = 100
@@ -10,11 +10,23 @@ Tests verify:
 """
 
 import pytest
-from datetime import datetime
 from pydantic import ValidationError
 from models.user import User
 
 
+# Happy-path tests build users with model_construct to skip validation;
+# creation/validation tests keep the real constructor.
+USER_DEFAULTS = dict(
+    user_id="test-user",
+    room_code="AAAA",
+    nickname="TestUser",
+)
+
+
+def _user(**kw):
+    return User.model_construct(**{**USER_DEFAULTS, **kw})
+
+
 @pytest.mark.unit
 def test_user_creation_valid():
     """Test creating a valid user"""
@@ -125,12 +137,7 @@ def test_user_nickname_validation():
 @pytest.mark.unit
 def test_user_can_afford_bet():
     """Test can_afford_bet() method"""
-    user = User(
-        user_id="test-user",
-        room_code="AAAA",
-        nickname="TestUser",
-        points=500,
-    )
+    user = _user(points=500)
 
     # Can afford
     assert user.can_afford_bet(100) is True
@@ -144,12 +151,7 @@ def test_user_can_afford_bet():
 @pytest.mark.unit
 def test_user_can_afford_bet_edge_cases():
     """Test can_afford_bet() edge cases"""
-    user = User(
-        user_id="test-user",
-        room_code="AAAA",
-        nickname="TestUser",
-        points=0,
-    )
+    user = _user(points=0)
 
     # Zero points
     assert user.can_afford_bet(0) is True
@@ -159,12 +161,7 @@ def test_user_can_afford_bet_edge_cases():
 @pytest.mark.unit
 def test_user_add_points():
     """Test add_points() method (immutable)"""
-    user = User(
-        user_id="test-user",
-        room_code="AAAA",
-        nickname="TestUser",
-        points=1000,
-    )
+    user = _user(points=1000)
 
     # Add points
     updated_user = user.add_points(500)
@@ -174,18 +171,13 @@ def test_user_add_points():
     # New instance updated
     assert updated_user.points == 1500
     # Different instance
-    assert id(user) != id(updated_user)
+    assert user is not updated_user
 
 
 @pytest.mark.unit
 def test_user_subtract_points():
     """Test subtract_points() method (immutable)"""
-    user = User(
-        user_id="test-user",
-        room_code="AAAA",
-        nickname="TestUser",
-        points=1000,
-    )
+    user = _user(points=1000)
 
     # Subtract points
     updated_user = user.subtract_points(300)
@@ -195,18 +187,13 @@ def test_user_subtract_points():
     # New instance updated
     assert updated_user.points == 700
     # Different instance
-    assert id(user) != id(updated_user)
+    assert user is not updated_user
 
 
 @pytest.mark.unit
 def test_user_subtract_points_minimum_zero():
     """Test subtract_points() enforces minimum of 0"""
-    user = User(
-        user_id="test-user",
-        room_code="AAAA",
-        nickname="TestUser",
-        points=100,
-    )
+    user = _user(points=100)
 
     # Subtracting more than available should clamp to 0
     updated_user = user.subtract_points(200)
@@ -215,13 +202,9 @@ def test_user_subtract_points_minimum_zero():
 
 
 @pytest.mark.unit
-def test_user_to_dict():
+def test_user_to_dict(now):
     """Test to_dict() serialization"""
-    now = datetime.utcnow()
-    user = User(
-        user_id="test-user",
-        room_code="AAAA",
-        nickname="TestUser",
+    user = _user(
         points=1234,
         is_admin=True,
         joined_at=now,
@@ -238,9 +221,8 @@ def test_user_to_dict():
 
 
 @pytest.mark.unit
-def test_user_from_dict():
+def test_user_from_dict(now):
     """Test from_dict() deserialization"""
-    now = datetime.utcnow()
     data = {
         "userId": "test-user",
         "roomCode": "AAAA",
@@ -261,14 +243,14 @@ def test_user_from_dict():
 
 
 @pytest.mark.unit
-def test_user_from_dict_defaults():
+def test_user_from_dict_defaults(now):
     """Test from_dict() with missing optional fields"""
     data = {
         "userId": "test-user",
         "roomCode": "AAAA",
         "nickname": "TestUser",
         "points": 1000,
-        "joinedAt": datetime.utcnow(),
+        "joinedAt": now,
     }
 
     user = User.from_dict(data)
@@ -280,15 +262,10 @@ def test_user_from_dict_defaults():
 @pytest.mark.unit
 def test_user_roundtrip_serialization():
     """Test to_dict() and from_dict() roundtrip"""
-    original = User(
-        user_id="test-user",
-        room_code="AAAA",
-        nickname="TestUser",
-        points=1500,
-        is_admin=True,
-    )
+    original = _user(points=1500, is_admin=True)
 
-    # Serialize and deserialize
+    # Serialize and deserialize. Dict-only on purpose: Firestore stores the
+    # to_dict() output natively, so there is no JSON step to cover here.
     data = original.to_dict()
     restored = User.from_dict(data)
 
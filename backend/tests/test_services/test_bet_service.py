@@ -2,11 +2,14 @@
 Tests for bet_service with mocked Firestore
 
 Tests verify business logic orchestration without real Firestore.
+Input models are built with model_construct: their validation is covered
+in tests/test_models, not here.
 
 Tests marked with @pytest.mark.unit for selective execution.
 """
 
 import pytest
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 from google.cloud import firestore
 from google.cloud.firestore_v1.transforms import Increment as FirestoreIncrement
@@ -44,11 +47,34 @@ async def test_create_bet():
         mock_doc_ref.set.assert_called_once()
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_create_bet_tx_queues_write_on_batch():
+    """Test bet creation onto an outer batch (no direct write)"""
+    mock_db = MagicMock()
+    mock_doc_ref = MagicMock()
+    mock_db.collection.return_value.document.return_value = mock_doc_ref
+    batch = MagicMock()
+
+    with patch("services.bet_service.get_db", return_value=mock_db):
+        bet = await bet_service.create_bet_tx(
+            batch,
+            room_code="AAAA",
+            question="Test Question?",
+            options=["Option A", "Option B"],
+            points_value=100,
+        )
+
+        assert bet.status == BetStatus.OPEN
+        mock_doc_ref.set.assert_not_called()
+        batch.set.assert_called_once_with(mock_doc_ref, bet.to_dict())
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_lock_bet():
     """Test locking a bet"""
-    open_bet = Bet(
+    open_bet = Bet.model_construct(
         bet_id="test-bet",
         room_code="AAAA",
         question="Test?",
@@ -67,18 +93,10 @@ async def test_lock_bet():
         mock_update.assert_called_once()
 
 
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_place_user_bet_insufficient_points():
-    """Test placing bet with insufficient points"""
-    user = User(
-        user_id="user1",
-        room_code="AAAA",
-        nickname="User1",
-        points=50,  # Not enough!
-    )
-
-    bet = Bet(
+@pytest.fixture(scope="module")
+def open_bet():
+    """An OPEN 100-point bet in room AAAA (unvalidated)"""
+    return Bet.model_construct(
         bet_id="bet1",
         room_code="AAAA",
         question="Test?",
@@ -87,30 +105,65 @@ async def test_place_user_bet_insufficient_points():
         points_value=100,
     )
 
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("user_points,selected_option,error", [
+    (50, "A", "Insufficient points"),  # Not enough points for a 100-point bet
+    (1000, "C", "Invalid option"),  # Not one of the bet's options
+], ids=["insufficient_points", "invalid_option"])
+async def test_place_user_bet_rejects(open_bet, user_points, selected_option, error):
+    """Test placing bet with insufficient points or an invalid option"""
+    user = User.model_construct(user_id="user1", room_code="AAAA", nickname="User1", points=user_points)
+
     with patch("services.user_service.get_user", return_value=user), \
-         patch("services.bet_service.get_bet", return_value=bet), \
+         patch("services.bet_service.get_bet", return_value=open_bet), \
          patch("services.bet_service.get_user_bet", return_value=None):
 
-        with pytest.raises(ValueError, match="Insufficient points"):
+        with pytest.raises(ValueError, match=error):
             await bet_service.place_user_bet(
                 user_id="user1",
                 bet_id="bet1",
-                selected_option="A",
+                selected_option=selected_option,
             )
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_place_user_bet_deducts_with_increment(open_bet):
+    """A new bet deducts its cost with Increment instead of writing a stale balance"""
+    user = User.model_construct(user_id="user1", room_code="AAAA", nickname="User1", points=1000)
+
+    mock_db = MagicMock()
+    mock_batch = MagicMock()
+    mock_db.batch.return_value = mock_batch
+    # roomUsers doc exists, so it is decremented too
+    mock_db.collection.return_value.document.return_value.get.return_value.exists = True
+
+    with patch("services.user_service.get_user", return_value=user), \
+         patch("services.bet_service.get_bet", return_value=open_bet), \
+         patch("services.bet_service.get_user_bet", return_value=None), \
+         patch("services.bet_service.get_db", return_value=mock_db):
+
+        await bet_service.place_user_bet("user1", "bet1", "A")
+
+    point_updates = [c.args[1]["points"] for c in mock_batch.update.call_args_list]
+    assert point_updates == [firestore.Increment(-100), firestore.Increment(-100)]
+    mock_batch.commit.assert_called_once()
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_place_user_bet_change_existing():
     """Test changing an existing bet while still open (no extra point deduction)"""
-    user = User(
+    user = User.model_construct(
         user_id="user1",
         room_code="AAAA",
         nickname="User1",
         points=900,  # already deducted 100 for original bet
     )
 
-    bet = Bet(
+    bet = Bet.model_construct(
         bet_id="bet1",
         room_code="AAAA",
         question="Test?",
@@ -119,7 +172,7 @@ async def test_place_user_bet_change_existing():
         points_value=100,
     )
 
-    existing_bet = UserBet(
+    existing_bet = UserBet.model_construct(
         user_id="user1",
         bet_id="bet1",
         room_code="AAAA",
@@ -148,16 +201,40 @@ async def test_place_user_bet_change_existing():
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_place_user_bet_invalid_option():
-    """Test placing bet with invalid option"""
-    user = User(
-        user_id="user1",
+async def test_place_user_bet_with_preloaded_bet_skips_bet_read():
+    """A preloaded Bet is used as-is instead of re-reading the bet document"""
+    user = User.model_construct(user_id="user1", room_code="AAAA", nickname="User1", points=1000)
+    bet = Bet.model_construct(
+        bet_id="bet1",
         room_code="AAAA",
-        nickname="User1",
-        points=1000,
+        question="Test?",
+        options=["A", "B"],
+        status=BetStatus.OPEN,
+        points_value=100,
     )
 
-    bet = Bet(
+    mock_db = MagicMock()
+    mock_db.collection.return_value.document.return_value.get.return_value.exists = False
+
+    with patch("services.user_service.get_user", return_value=user), \
+         patch("services.bet_service.get_bet", new_callable=AsyncMock) as mock_get_bet, \
+         patch("services.bet_service.get_user_bet", return_value=None), \
+         patch("services.bet_service.get_db", return_value=mock_db):
+
+        result = await bet_service.place_user_bet("user1", "bet1", "A", bet=bet)
+
+        assert result.selected_option == "A"
+        mock_get_bet.assert_not_called()
+
+        with pytest.raises(ValueError, match="does not match"):
+            await bet_service.place_user_bet("user1", "other-bet", "A", bet=bet)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_place_many_user_bets_batches_placements():
+    """place_many_user_bets writes all placements in one batch using Increment"""
+    bet = Bet.model_construct(
         bet_id="bet1",
         room_code="AAAA",
         question="Test?",
@@ -165,24 +242,67 @@ async def test_place_user_bet_invalid_option():
         status=BetStatus.OPEN,
         points_value=100,
     )
+    users = {
+        "u1": User.model_construct(user_id="u1", room_code="AAAA", nickname="U1", points=1000),
+        "u2": User.model_construct(user_id="u2", room_code="AAAA", nickname="U2", points=1000),
+    }
 
-    with patch("services.user_service.get_user", return_value=user), \
+    mock_db = MagicMock()
+    mock_batch = MagicMock()
+    mock_db.batch.return_value = mock_batch
+    # No existing user bets and no roomUsers docs
+    mock_db.get_all.return_value = []
+
+    with patch("services.bet_service.get_db", return_value=mock_db), \
          patch("services.bet_service.get_bet", return_value=bet), \
-         patch("services.bet_service.get_user_bet", return_value=None):
+         patch("services.user_service.get_users_by_ids", return_value=users):
 
-        with pytest.raises(ValueError, match="Invalid option"):
-            await bet_service.place_user_bet(
-                user_id="user1",
-                bet_id="bet1",
-                selected_option="C",  # Invalid!
-            )
+        placed = await bet_service.place_many_user_bets("bet1", [("u1", "A"), ("u2", "B")])
+
+    assert [ub.selected_option for ub in placed] == ["A", "B"]
+    assert mock_batch.set.call_count == 2
+    point_updates = [c.args[1]["points"] for c in mock_batch.update.call_args_list]
+    assert len(point_updates) == 2
+    for inc in point_updates:
+        assert isinstance(inc, FirestoreIncrement)
+    mock_batch.commit.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_place_many_user_bets_validates_before_writing():
+    """One invalid placement aborts the whole call before any write"""
+    bet = Bet.model_construct(
+        bet_id="bet1",
+        room_code="AAAA",
+        question="Test?",
+        options=["A", "B"],
+        status=BetStatus.OPEN,
+        points_value=100,
+    )
+    users = {
+        "u1": User.model_construct(user_id="u1", room_code="AAAA", nickname="U1", points=1000),
+        "u2": User.model_construct(user_id="u2", room_code="AAAA", nickname="U2", points=50),
+    }
+
+    mock_db = MagicMock()
+    mock_db.get_all.return_value = []
+
+    with patch("services.bet_service.get_db", return_value=mock_db), \
+         patch("services.bet_service.get_bet", return_value=bet), \
+         patch("services.user_service.get_users_by_ids", return_value=users):
+
+        with pytest.raises(ValueError, match="Insufficient points"):
+            await bet_service.place_many_user_bets("bet1", [("u1", "A"), ("u2", "B")])
+
+    mock_db.batch.assert_not_called()
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_resolve_bet_does_not_double_deduct_points():
     """Resolve bet should not subtract bet cost again (already deducted at placement)."""
-    bet = Bet(
+    bet = Bet.model_construct(
         bet_id="bet1",
         room_code="AAAA",
         question="Test?",
@@ -192,14 +312,14 @@ async def test_resolve_bet_does_not_double_deduct_points():
     )
 
     user_bets = [
-        UserBet(user_id="u1", bet_id="bet1", room_code="AAAA", selected_option="A"),
-        UserBet(user_id="u2", bet_id="bet1", room_code="AAAA", selected_option="B"),
+        UserBet.model_construct(user_id="u1", bet_id="bet1", room_code="AAAA", selected_option="A"),
+        UserBet.model_construct(user_id="u2", bet_id="bet1", room_code="AAAA", selected_option="B"),
     ]
 
     # Users already paid 100 points at placement (1000 -> 900)
     users = {
-        "u1": User(user_id="u1", room_code="AAAA", nickname="U1", points=900),
-        "u2": User(user_id="u2", room_code="AAAA", nickname="U2", points=900),
+        "u1": User.model_construct(user_id="u1", room_code="AAAA", nickname="U1", points=900),
+        "u2": User.model_construct(user_id="u2", room_code="AAAA", nickname="U2", points=900),
     }
 
     mock_db = MagicMock()
@@ -240,16 +360,96 @@ async def test_resolve_bet_does_not_double_deduct_points():
         await bet_service.resolve_bet("bet1", "A")
 
     # Expect winner to get pot (200) added to already-deducted balance
-    # Loser should remain at 900 (no extra deduction)
-    updated_points = sorted(call.args[1]["points"] for call in mock_transaction.update.call_args_list)
-    assert updated_points == [900, 1100]
+    # Loser should remain at 900 (no extra deduction, so no update at all)
+    updated_points = [call.args[1]["points"] for call in mock_transaction.update.call_args_list]
+    assert updated_points == [firestore.Increment(200)]
+    # Only the winner's roomUsers doc is read; the loser's balance doesn't change
+    mock_room_users_col.document.assert_called_once_with("AAAA_u1")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_undo_resolve_bet_reverses_payouts_with_increment():
+    """Undo subtracts each payout with Increment; losers' balances are untouched"""
+    bet = Bet.model_construct(
+        bet_id="bet1",
+        room_code="AAAA",
+        question="Test?",
+        options=["A", "B"],
+        status=BetStatus.RESOLVED,
+        winning_option="A",
+        points_value=100,
+        can_undo_until=datetime.utcnow() + timedelta(seconds=10),
+    )
+    user_bets = [
+        UserBet.model_construct(user_id="u1", bet_id="bet1", room_code="AAAA", selected_option="A", points_won=200),
+        UserBet.model_construct(user_id="u2", bet_id="bet1", room_code="AAAA", selected_option="B", points_won=0),
+    ]
+    user = User.model_construct(user_id="u1", room_code="AAAA", nickname="U1", points=1100)
+
+    mock_db = MagicMock()
+    mock_batch = MagicMock()
+    mock_db.batch.return_value = mock_batch
+    mock_db.collection.return_value.document.return_value.get.return_value.exists = True
+
+    with patch("services.bet_service.get_db", return_value=mock_db), \
+         patch("services.bet_service.get_bet", return_value=bet), \
+         patch("services.bet_service.get_user_bets_for_bet", return_value=user_bets), \
+         patch("services.user_service.get_user", return_value=user):
+
+        undone = await bet_service.undo_resolve_bet("bet1")
+
+    assert undone.status is BetStatus.LOCKED
+    point_updates = [c.args[1]["points"] for c in mock_batch.update.call_args_list]
+    assert point_updates == [firestore.Increment(-200), firestore.Increment(-200)]
+    mock_batch.commit.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_lock_and_resolve_writes_lock_and_resolution_together():
+    """lock_and_resolve on an open bet writes one resolved doc that keeps lockedAt."""
+    bet = Bet.model_construct(
+        bet_id="bet1",
+        room_code="AAAA",
+        question="Test?",
+        options=["A", "B"],
+        status=BetStatus.OPEN,
+        points_value=100,
+    )
+
+    mock_db = MagicMock()
+    mock_transaction = MagicMock()
+    mock_db.transaction.return_value = mock_transaction
+
+    def passthrough_transactional(func):
+        def wrapper(transaction, *args, **kwargs):
+            return func(transaction, *args, **kwargs)
+        return wrapper
+
+    with patch("services.bet_service.get_db", return_value=mock_db), \
+         patch("services.bet_service.get_bet", return_value=bet), \
+         patch("services.bet_service.update_bet", new_callable=AsyncMock) as mock_update, \
+         patch("services.bet_service.get_user_bets_for_bet", return_value=[]), \
+         patch("services.user_service.get_users_by_ids", return_value={}), \
+         patch("google.cloud.firestore.transactional", passthrough_transactional):
+
+        await bet_service.lock_and_resolve("bet1", "A")
+
+    # No separate lock write; the single bet write carries both transitions
+    mock_update.assert_not_called()
+    mock_transaction.set.assert_called_once()
+    written = mock_transaction.set.call_args.args[1]
+    assert written["status"] == "resolved"
+    assert written["winningOption"] == "A"
+    assert written["lockedAt"] is not None
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_delete_open_bet_no_votes():
     """Test deleting an open bet with no user bets"""
-    bet = Bet(
+    bet = Bet.model_construct(
         bet_id="bet1",
         room_code="AAAA",
         question="Test?",
@@ -281,7 +481,7 @@ async def test_delete_open_bet_no_votes():
 @pytest.mark.asyncio
 async def test_delete_open_bet_refunds_points():
     """Test deleting an open bet refunds points atomically using Increment"""
-    bet = Bet(
+    bet = Bet.model_construct(
         bet_id="bet1",
         room_code="AAAA",
         question="Test?",
@@ -291,8 +491,8 @@ async def test_delete_open_bet_refunds_points():
     )
 
     user_bets = [
-        UserBet(user_id="u1", bet_id="bet1", room_code="AAAA", selected_option="A"),
-        UserBet(user_id="u2", bet_id="bet1", room_code="AAAA", selected_option="B"),
+        UserBet.model_construct(user_id="u1", bet_id="bet1", room_code="AAAA", selected_option="A"),
+        UserBet.model_construct(user_id="u2", bet_id="bet1", room_code="AAAA", selected_option="B"),
     ]
 
     mock_db = MagicMock()
@@ -339,7 +539,7 @@ async def test_delete_open_bet_refunds_points():
 @pytest.mark.asyncio
 async def test_delete_locked_bet_fails():
     """Test that locked bets cannot be deleted"""
-    bet = Bet(
+    bet = Bet.model_construct(
         bet_id="bet1",
         room_code="AAAA",
         question="Test?",
@@ -357,7 +557,7 @@ async def test_delete_locked_bet_fails():
 @pytest.mark.asyncio
 async def test_delete_resolved_bet_fails():
     """Test that resolved bets cannot be deleted"""
-    bet = Bet(
+    bet = Bet.model_construct(
         bet_id="bet1",
         room_code="AAAA",
         question="Test?",
@@ -384,7 +584,7 @@ async def test_delete_nonexistent_bet_fails():
 @pytest.mark.asyncio
 async def test_edit_open_bet_updates_question():
     """Test editing an open bet's question resets votes and refunds points atomically"""
-    bet = Bet(
+    bet = Bet.model_construct(
         bet_id="bet1",
         room_code="AAAA",
         question="Old question?",
@@ -395,7 +595,7 @@ async def test_edit_open_bet_updates_question():
     )
 
     user_bets = [
-        UserBet(user_id="u1", bet_id="bet1", room_code="AAAA", selected_option="A"),
+        UserBet.model_construct(user_id="u1", bet_id="bet1", room_code="AAAA", selected_option="A"),
     ]
 
     mock_db = MagicMock()
@@ -443,7 +643,7 @@ async def test_edit_open_bet_updates_question():
 @pytest.mark.asyncio
 async def test_edit_open_bet_updates_options():
     """Test editing an open bet's options"""
-    bet = Bet(
+    bet = Bet.model_construct(
         bet_id="bet1",
         room_code="AAAA",
         question="Test?",
@@ -475,7 +675,7 @@ async def test_edit_open_bet_updates_options():
 @pytest.mark.asyncio
 async def test_edit_locked_bet_fails():
     """Test that locked bets cannot be edited"""
-    bet = Bet(
+    bet = Bet.model_construct(
         bet_id="bet1",
         room_code="AAAA",
         question="Test?",
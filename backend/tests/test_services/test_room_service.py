@@ -19,14 +19,30 @@ from models.room import Room
 # generate_room_code() tests
 # ============================================================================
 
+def _mock_db_with_rooms(existing_count: int, expires_at=None) -> MagicMock:
+    """Mock db whose get_all reports the first ``existing_count`` codes as taken"""
+    mock_db = MagicMock()
+    mock_db.collection.return_value.document.side_effect = lambda code: MagicMock(id=code)
+
+    def get_all(refs):
+        snaps = []
+        for i, ref in enumerate(refs):
+            snap = MagicMock()
+            snap.id = ref.id
+            snap.exists = i < existing_count
+            snap.to_dict.return_value = {"expiresAt": expires_at}
+            snaps.append(snap)
+        return snaps
+
+    mock_db.get_all.side_effect = get_all
+    return mock_db
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_generate_room_code_returns_4_chars():
     """Legacy room code should be 4 characters"""
-    mock_db = MagicMock()
-    mock_doc = MagicMock()
-    mock_doc.exists = False
-    mock_db.collection.return_value.document.return_value.get.return_value = mock_doc
+    mock_db = _mock_db_with_rooms(existing_count=0)
 
     with patch("services.room_service.get_db", return_value=mock_db):
         code = await room_service.generate_room_code()
@@ -36,40 +52,29 @@ async def test_generate_room_code_returns_4_chars():
     valid = set("ABCDEFGHJKMNPQRSTUVWXYZ23456789")
     for ch in code:
         assert ch in valid, f"Invalid character in room code: {ch}"
+    # All candidates checked in one read
+    mock_db.get_all.assert_called_once()
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_generate_room_code_retries_on_collision():
-    """Should retry when room code already exists"""
-    mock_db = MagicMock()
-    existing_doc = MagicMock()
-    existing_doc.exists = True
-    existing_doc.to_dict.return_value = {"expiresAt": None}
-
-    free_doc = MagicMock()
-    free_doc.exists = False
-
-    mock_db.collection.return_value.document.return_value.get.side_effect = [
-        existing_doc, free_doc
-    ]
+    """Should skip candidates whose room code already exists"""
+    mock_db = _mock_db_with_rooms(existing_count=1)
 
-    with patch("services.room_service.get_db", return_value=mock_db):
+    with patch("services.room_service.get_db", return_value=mock_db), \
+         patch("services.room_service.random.choices", side_effect=[list("AAAA")] + [list("BBBB")] * 9):
         code = await room_service.generate_room_code()
 
-    assert len(code) == 4
+    assert code == "BBBB"
+    mock_db.get_all.assert_called_once()
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_generate_room_code_fails_after_max_attempts():
-    """Should raise RuntimeError after exhausting retries"""
-    mock_db = MagicMock()
-    existing_doc = MagicMock()
-    existing_doc.exists = True
-    existing_doc.to_dict.return_value = {"expiresAt": None}
-
-    mock_db.collection.return_value.document.return_value.get.return_value = existing_doc
+    """Should raise RuntimeError when every candidate is taken"""
+    mock_db = _mock_db_with_rooms(existing_count=room_service.ROOM_CODE_CANDIDATES)
 
     with patch("services.room_service.get_db", return_value=mock_db):
         with pytest.raises(RuntimeError, match="Failed to generate unique room code"):
@@ -80,10 +85,7 @@ async def test_generate_room_code_fails_after_max_attempts():
 @pytest.mark.asyncio
 async def test_generate_room_code_v2_returns_6_chars():
     """V2 room code should be 6 characters with checksum"""
-    mock_db = MagicMock()
-    mock_doc = MagicMock()
-    mock_doc.exists = False
-    mock_db.collection.return_value.document.return_value.get.return_value = mock_doc
+    mock_db = _mock_db_with_rooms(existing_count=0)
 
     with patch("services.room_service.get_db", return_value=mock_db):
         code = await room_service.generate_room_code_v2()
@@ -321,8 +323,8 @@ async def test_get_room_not_found():
 async def test_delete_room_cascades():
     """Should delete room and all associated collections"""
     mock_db = MagicMock()
-    mock_batch = MagicMock()
-    mock_db.batch.return_value = mock_batch
+    mock_bulk_writer = MagicMock()
+    mock_db.bulk_writer.return_value = mock_bulk_writer
 
     # Mock stream results for each collection
     mock_user_doc = MagicMock()
@@ -351,8 +353,42 @@ async def test_delete_room_cascades():
         await room_service.delete_room("TEST")
 
     # 1 room + 1 user + 1 bet + 1 user_bet + 1 room_user = 5 deletes
-    assert mock_batch.delete.call_count == 5
-    mock_batch.commit.assert_called_once()
+    assert mock_bulk_writer.delete.call_count == 5
+    deleted = {c.args[0] for c in mock_bulk_writer.delete.call_args_list}
+    assert {
+        mock_user_doc.reference,
+        mock_bet_doc.reference,
+        mock_user_bet_doc.reference,
+        mock_room_user_doc.reference,
+    } <= deleted
+    # close() flushes and waits for every delete
+    mock_bulk_writer.close.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_delete_room_raises_on_write_failure():
+    """Should raise once the BulkWriter reports a failed delete, without retrying"""
+    mock_db = MagicMock()
+    mock_bulk_writer = MagicMock()
+    mock_db.bulk_writer.return_value = mock_bulk_writer
+    mock_db.collection.return_value.where.return_value.stream.return_value = []
+
+    failure = MagicMock(message="PERMISSION_DENIED")
+    retried = []
+
+    def close():
+        # Simulate the writer reporting a failure while flushing
+        on_write_error = mock_bulk_writer.on_write_error.call_args.args[0]
+        retried.append(on_write_error(failure, mock_bulk_writer))
+
+    mock_bulk_writer.close.side_effect = close
+
+    with patch("services.room_service.get_db", return_value=mock_db):
+        with pytest.raises(RuntimeError, match="PERMISSION_DENIED"):
+            await room_service.delete_room("TEST")
+
+    assert retried == [False]
 
 
 # ============================================================================
@@ -5,9 +5,12 @@ Tests verify:
 - generate_user_key() format and character set
 - create_user() generates user_key on creation
 - create_user() handles collision retries
+- create_user_tx() queues the write on the caller's batch
 - ensure_user_has_key() backfills missing keys
 - ensure_user_has_key() is idempotent for users with keys
 - get_user_by_key() returns user or None
+- get_users_by_ids() reads through chunked get_all calls
+- bulk_update_points() writes through chunked batches
 """
 
 import re
@@ -18,8 +21,13 @@ from datetime import datetime
 from services.user_service import (
     generate_user_key,
     create_user,
+    create_user_tx,
     ensure_user_has_key,
     get_user_by_key,
+    get_users_by_ids,
+    bulk_update_points,
+    GET_ALL_CHUNK_SIZE,
+    UPDATE_BATCH_SIZE,
     USER_KEY_ALPHABET,
     USER_KEY_LENGTH,
 )
@@ -157,6 +165,28 @@ async def test_create_user_fails_after_max_retries():
             )
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_create_user_tx_queues_write_on_batch():
+    """create_user_tx() should queue the user write on the batch, not write directly"""
+    mock_db = MagicMock()
+    mock_doc_ref = MagicMock()
+    mock_db.collection.return_value.document.return_value = mock_doc_ref
+    batch = MagicMock()
+
+    with patch("services.user_service.get_db", return_value=mock_db), \
+         patch("services.user_service.get_user_by_key", new_callable=AsyncMock, return_value=None):
+
+        user = await create_user_tx(batch, room_code="AAAA", nickname="Alice")
+
+        mock_doc_ref.set.assert_not_called()
+        batch.set.assert_called_once()
+        ref, written_data = batch.set.call_args[0]
+        assert ref is mock_doc_ref
+        assert written_data["userId"] == user.user_id
+        assert written_data["userKey"] == user.user_key
+
+
 # ============================================================================
 # ensure_user_has_key() tests
 # ============================================================================
@@ -280,3 +310,73 @@ async def test_get_user_by_key_not_found():
         result = await get_user_by_key("AAAA", "nonexist")
 
         assert result is None
+
+
+# ============================================================================
+# get_users_by_ids() tests
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_users_by_ids_chunks_get_all_and_skips_missing():
+    """get_users_by_ids() should issue one get_all per chunk and drop missing docs"""
+    num_ids = GET_ALL_CHUNK_SIZE + 5
+    user_ids = [f"user-{i}" for i in range(num_ids)]
+
+    def fake_get_all(refs):
+        snaps = []
+        for ref in refs:
+            snap = MagicMock()
+            snap.id = ref.id
+            snap.exists = ref.id != "user-0"
+            snap.to_dict.return_value = {
+                "userId": ref.id,
+                "roomCode": "AAAA",
+                "nickname": ref.id,
+                "points": 1000,
+                "isAdmin": False,
+                "joinedAt": datetime.utcnow(),
+            }
+            snaps.append(snap)
+        return reversed(snaps)
+
+    mock_db = MagicMock()
+    mock_db.collection.return_value.document.side_effect = lambda uid: MagicMock(id=uid)
+    mock_db.get_all.side_effect = fake_get_all
+
+    with patch("services.user_service.get_db", return_value=mock_db):
+        result = await get_users_by_ids(user_ids)
+
+    assert mock_db.get_all.call_count == 2
+    assert len(mock_db.get_all.call_args_list[0][0][0]) == GET_ALL_CHUNK_SIZE
+    assert "user-0" not in result
+    assert len(result) == num_ids - 1
+    assert result["user-7"].user_id == "user-7"
+
+
+# ============================================================================
+# bulk_update_points() tests
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_bulk_update_points_chunks_batches():
+    """bulk_update_points() should commit one batch per UPDATE_BATCH_SIZE users"""
+    mock_db = MagicMock()
+    batches = []
+
+    def new_batch():
+        batch = MagicMock()
+        batches.append(batch)
+        return batch
+
+    mock_db.batch.side_effect = new_batch
+    points_by_user = {f"user-{i}": 500 for i in range(UPDATE_BATCH_SIZE + 1)}
+
+    with patch("services.user_service.get_db", return_value=mock_db):
+        await bulk_update_points(points_by_user)
+
+    assert [b.update.call_count for b in batches] == [UPDATE_BATCH_SIZE, 1]
+    for batch in batches:
+        batch.commit.assert_called_once()
+    assert batches[1].update.call_args.args[1] == {"points": 500}
@@ -12,14 +12,14 @@ Tests marked with @pytest.mark.unit for selective execution.
 
 import pytest
 from pathlib import Path
-from unittest.mock import AsyncMock, patch, MagicMock, mock_open
+from unittest.mock import AsyncMock, patch, MagicMock
 import json
 from services.template_service import load_template, create_bets_from_template
 from models.event_template import EventTemplate, MatchTemplate
 from models.bet import Bet, BetStatus
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_template_data():
     """Sample template data matching actual template structure"""
     return {
@@ -53,7 +53,23 @@ def sample_template_data():
     }
 
 
+@pytest.fixture(scope="module")
+def templates_dir(tmp_path_factory, sample_template_data):
+    """Template directory written once per module: one valid, one malformed file"""
+    path = tmp_path_factory.mktemp("templates")
+    (path / "test-event.json").write_text(json.dumps(sample_template_data))
+    (path / "invalid-template.json").write_text("invalid json {")
+    return path
+
+
 @pytest.fixture
+def patched_templates_dir(monkeypatch, templates_dir):
+    """Point load_template at templates_dir"""
+    monkeypatch.setattr("services.template_service.TEMPLATES_DIR", templates_dir)
+    return templates_dir
+
+
+@pytest.fixture(scope="module")
 def mock_event_template():
     """Mock EventTemplate object"""
     return EventTemplate(
@@ -82,37 +98,28 @@ def mock_event_template():
 
 
 @pytest.mark.unit
-def test_load_template_success(sample_template_data):
+def test_load_template_success(patched_templates_dir):
     """Test successful template loading from JSON file"""
-    mock_file_content = json.dumps(sample_template_data)
-
-    with patch("pathlib.Path.exists", return_value=True), \
-         patch("builtins.open", mock_open(read_data=mock_file_content)):
+    template = load_template("test-event")
 
-        template = load_template("test-event")
-
-        assert template is not None
-        assert template.template_id == "test-event"
-        assert template.name == "Test Event 2026"
-        assert len(template.bets) == 2
+    assert template is not None
+    assert template.template_id == "test-event"
+    assert template.name == "Test Event 2026"
+    assert len(template.bets) == 2
 
 
 @pytest.mark.unit
-def test_load_template_not_found():
+def test_load_template_not_found(patched_templates_dir):
     """Test loading non-existent template returns None"""
-    with patch("pathlib.Path.exists", return_value=False):
-        template = load_template("non-existent-template")
-        assert template is None
+    template = load_template("non-existent-template")
+    assert template is None
 
 
 @pytest.mark.unit
-def test_load_template_invalid_json():
+def test_load_template_invalid_json(patched_templates_dir):
     """Test loading template with invalid JSON handles error"""
-    with patch("pathlib.Path.exists", return_value=True), \
-         patch("builtins.open", mock_open(read_data="invalid json {")):
-
-        with pytest.raises(json.JSONDecodeError):
-            load_template("invalid-template")
+    with pytest.raises(json.JSONDecodeError):
+        load_template("invalid-template")
 
 
 # ============================================================================
@@ -122,6 +122,35 @@ class TestMatchTriggerPatterns:
         assert confidence == 1.0
         assert pattern == "album of the year"  # Most specific match
 
+    def test_longest_pattern_wins_even_if_shorter_matches_earlier(self):
+        patterns = ["winner", "album of the year"]
+        text = "The winner of album of the year"
+
+        matched, confidence, pattern = match_trigger_patterns(text, patterns)
+
+        assert matched is True
+        assert pattern == "album of the year"
+
+    def test_pattern_with_backreference(self):
+        patterns = [r"(\w+) \1", "nothing here"]
+        text = "encore encore"
+
+        matched, confidence, pattern = match_trigger_patterns(text, patterns)
+
+        assert matched is True
+        assert confidence == 1.0
+        assert pattern == r"(\w+) \1"
+
+    def test_invalid_regex_falls_back_to_fuzzy(self):
+        patterns = ["album (of the year"]  # Unbalanced paren
+        text = "album of the year"
+
+        matched, confidence, pattern = match_trigger_patterns(text, patterns)
+
+        assert matched is True
+        assert confidence == 1.0
+        assert pattern == "album (of the year"
+
 
 class TestExtractWinnerFromText:
     """Test winner extraction from announcement text"""
@@ -229,6 +258,18 @@ class TestExtractWinnerWithPatterns:
         # (or might match with low confidence)
         assert winner is None or confidence < 0.85
 
+    def test_repeated_call_sees_updated_options(self):
+        text = "And the winner is Beyoncé!"
+        options = ["Taylor Swift", "Billie Eilish"]
+        resolve_patterns = ["and the winner is"]
+
+        winner, _, _ = extract_winner_with_patterns(text, options, resolve_patterns)
+        assert winner is None
+
+        options.append("Beyoncé")
+        winner, _, _ = extract_winner_with_patterns(text, options, resolve_patterns)
+        assert winner == "Beyoncé"
+
 
 class TestShouldOpenBet:
     """Test bet opening trigger logic"""
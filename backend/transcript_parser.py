@@ -8,6 +8,7 @@ FUNCTIONAL CORE: Pure functions for transcript analysis
 """
 
 import re
+from functools import lru_cache
 from typing import Optional, List, Tuple
 from difflib import SequenceMatcher
 import math
@@ -27,11 +28,87 @@ _NUMERIC_RANGE_RE = re.compile(
     re.IGNORECASE
 )
 
+# Pre-compiled regexes for parse_range_option (run per option, per transcript line)
+_UNIT_SUFFIX_RE = re.compile(r'\s*(?:runs?|pts|points|goals?|wickets?)\s*$', re.IGNORECASE)
+_RANGE_BOUNDED_RE = re.compile(r'^(\d+)\s*[-–]\s*(\d+)$')
+_RANGE_PLUS_RE = re.compile(r'^(\d+)\s*\+$')
+_RANGE_UNDER_RE = re.compile(r'^(?:under|below|less than|<)\s*(\d+)$', re.IGNORECASE)
+_RANGE_OVER_RE = re.compile(r'^(?:over|above|more than|>)\s*(\d+)$', re.IGNORECASE)
+
+# Pre-compiled score patterns (number near result words), tried in order
+_SCORE_PATTERNS_RE = (
+    re.compile(r'(\d+)\s*(?:runs?|pts|points|goals?|wickets?)'),
+    re.compile(r'(?:scored?|made|got|hit)\s+(\d+)'),
+    re.compile(r'(?:for|at|on)\s+(\d+)\s*(?:runs?)?'),
+)
+_NUMBER_RE = re.compile(r'\b(\d+)\b')
+
+# Punctuation stripped by normalize_text (str.translate deletion table)
+_PUNCT_TABLE = str.maketrans('', '', '.,!?;:\'"()')
+
+
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> Optional[re.Pattern]:
+    """Compile a trigger pattern once (case-insensitive)
+
+    Returns None for invalid regex so callers fall back to fuzzy matching.
+    """
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _patterns_by_length(patterns: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Patterns sorted longest (most specific) first, cached per pattern list"""
+    return tuple(sorted(patterns, key=len, reverse=True))
+
+
+@lru_cache(maxsize=256)
+def _normalized_patterns(sorted_patterns: Tuple[str, ...]) -> Tuple[str, ...]:
+    """normalize_text of each pattern, aligned with (and cached per) the tuple"""
+    return tuple(normalize_text(pattern) for pattern in sorted_patterns)
 
+
+@lru_cache(maxsize=256)
+def _combined_trigger_regex(sorted_patterns: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """All valid trigger patterns as one regex, tried in priority order
+
+    Each pattern becomes a lookahead branch followed by an empty named group
+    ``p<index>``. Matched at position 0, alternation tries branches left to
+    right, so ``lastgroup`` names the first (longest) pattern found anywhere
+    in the text - the same answer as searching the patterns one by one.
+
+    Returns None when the patterns can't be combined safely (a pattern with
+    its own groups would have its backreferences renumbered); callers then
+    search pattern by pattern.
+    """
+    branches = []
+    for i, pattern in enumerate(sorted_patterns):
+        compiled = _compile_pattern(pattern)
+        if compiled is None:
+            continue  # Invalid regex: fuzzy match only
+        if compiled.groups:
+            return None
+        branches.append(rf"(?=[\s\S]*?(?:{pattern}))(?P<p{i}>)")
+
+    if not branches:
+        return None
+
+    try:
+        return re.compile("|".join(branches), re.IGNORECASE)
+    except re.error:
+        # e.g. an inline global flag that is only legal at the pattern start
+        return None
+
+
+@lru_cache(maxsize=4096)
 def normalize_text(text: str) -> str:
     """Normalize text for matching
 
-    Pure function - string transformation only
+    Pure function - string transformation only (cached: patterns and
+    options are re-normalized for every transcript line)
 
     Args:
         text: Raw text to normalize
@@ -46,7 +123,7 @@ def normalize_text(text: str) -> str:
     text = ' '.join(text.split())
 
     # Remove common punctuation
-    text = re.sub(r'[.,!?;:\'"()]', '', text)
+    text = text.translate(_PUNCT_TABLE)
 
     return text.strip()
 
@@ -63,25 +140,59 @@ def fuzzy_match_score(text: str, pattern: str) -> float:
     Returns:
         Similarity score between 0.0 and 1.0
     """
-    text_normalized = normalize_text(text)
-    pattern_normalized = normalize_text(pattern)
+    return _fuzzy_match_normalized(normalize_text(text), normalize_text(pattern))
+
+
+@lru_cache(maxsize=4096)
+def _word_set(text_normalized: str) -> frozenset:
+    """Words of a normalized string, cached: the same transcript line is
+    checked against every pattern and option part"""
+    return frozenset(text_normalized.split())
+
+
+def _fuzzy_match_normalized(
+    text_normalized: str,
+    pattern_normalized: str,
+    floor: Optional[float] = None
+) -> float:
+    """fuzzy_match_score for inputs that already went through normalize_text
 
+    With ``floor`` set (the caller's best score so far), a pattern whose
+    upper-bound score cannot beat it skips the full SequenceMatcher ratio;
+    the bound returned in that case is <= floor, so callers using
+    ``score > best_score`` pick the same winner.
+    """
     # Exact match
     if pattern_normalized in text_normalized:
         return 1.0
 
-    # Calculate sequence similarity
-    similarity = SequenceMatcher(None, text_normalized, pattern_normalized).ratio()
-
     # Boost score if all pattern words are in text
-    pattern_words = set(pattern_normalized.split())
-    text_words = set(text_normalized.split())
+    boost = 0.3 if _word_set(pattern_normalized) <= _word_set(text_normalized) else 0.0
+
+    matcher = SequenceMatcher(None, text_normalized, pattern_normalized)
+
+    # ratio() <= quick_ratio() <= real_quick_ratio(), both far cheaper
+    if floor is not None:
+        for bound in (matcher.real_quick_ratio, matcher.quick_ratio):
+            upper = min(1.0, bound() + boost)
+            if upper <= floor:
+                return upper
+
+    # Calculate sequence similarity (boosted if all words present)
+    return min(1.0, matcher.ratio() + boost)
 
-    if pattern_words.issubset(text_words):
-        # All words present, boost similarity
-        similarity = min(1.0, similarity + 0.3)
 
-    return similarity
+@lru_cache(maxsize=1024)
+def _normalized_option_parts(option: str) -> Tuple[str, ...]:
+    """Normalized parts of an option that are matched against transcripts
+
+    Extracts just the key parts of the option (either side of " - "),
+    e.g. "Cowboy Carter - Beyoncé" -> ("cowboy carter", "beyoncé"),
+    but doesn't split numeric ranges like "41-60".
+    """
+    if _NUMERIC_RANGE_RE.match(option.strip()):
+        return (normalize_text(option),)
+    return tuple(normalize_text(part) for part in option.split('-'))
 
 
 def is_numeric_range_options(options: List[str]) -> bool:
@@ -117,27 +228,25 @@ def parse_range_option(option: str) -> Tuple[Optional[float], Optional[float]]:
     option = option.strip()
 
     # Remove unit suffixes
-    option = re.sub(
-        r'\s*(?:runs?|pts|points|goals?|wickets?)\s*$', '', option, flags=re.IGNORECASE
-    ).strip()
+    option = _UNIT_SUFFIX_RE.sub('', option).strip()
 
     # Pattern: "41-60" or "41–60"
-    match = re.match(r'^(\d+)\s*[-–]\s*(\d+)$', option)
+    match = _RANGE_BOUNDED_RE.match(option)
     if match:
         return float(match.group(1)), float(match.group(2))
 
     # Pattern: "61+"
-    match = re.match(r'^(\d+)\s*\+$', option)
+    match = _RANGE_PLUS_RE.match(option)
     if match:
         return float(match.group(1)), math.inf
 
     # Pattern: "Under 20", "Less than 20", "< 20", "Below 20"
-    match = re.match(r'^(?:under|below|less than|<)\s*(\d+)$', option, re.IGNORECASE)
+    match = _RANGE_UNDER_RE.match(option)
     if match:
         return 0.0, float(match.group(1)) - 1
 
     # Pattern: "Over 100", "More than 100", "> 100", "Above 100"
-    match = re.match(r'^(?:over|above|more than|>)\s*(\d+)$', option, re.IGNORECASE)
+    match = _RANGE_OVER_RE.match(option)
     if match:
         return float(match.group(1)) + 1, math.inf
 
@@ -161,19 +270,13 @@ def extract_score_number_from_text(text: str) -> Optional[float]:
     text_lower = text.lower()
 
     # Patterns for score numbers (number near result words)
-    score_patterns = [
-        r'(\d+)\s*(?:runs?|pts|points|goals?|wickets?)',
-        r'(?:scored?|made|got|hit)\s+(\d+)',
-        r'(?:for|at|on)\s+(\d+)\s*(?:runs?)?',
-    ]
-
-    for pattern in score_patterns:
-        match = re.search(pattern, text_lower)
+    for pattern in _SCORE_PATTERNS_RE:
+        match = pattern.search(text_lower)
         if match:
             return float(match.group(1))
 
     # Fallback: return the largest number in the text (heuristic)
-    all_numbers = [float(n) for n in re.findall(r'\b(\d+)\b', text_lower)]
+    all_numbers = [float(n) for n in _NUMBER_RE.findall(text_lower)]
     if all_numbers:
         return max(all_numbers)
 
@@ -272,24 +375,30 @@ def match_trigger_patterns(
     text_normalized = normalize_text(text)
 
     # Sort patterns by length (descending) to prioritize more specific patterns
-    sorted_patterns = sorted(patterns, key=len, reverse=True)
+    sorted_patterns = _patterns_by_length(tuple(patterns))
+
+    # Try every regex in one pass first
+    combined = _combined_trigger_regex(sorted_patterns)
+    if combined is not None:
+        match = combined.match(text_normalized)
+        if match:
+            # Branches are in length order, so this is the most specific match
+            return True, 1.0, sorted_patterns[int(match.lastgroup[1:])]
 
     best_score = 0.0
     best_pattern = None
 
-    for pattern in sorted_patterns:
-        # Try regex match first
-        try:
-            if re.search(pattern, text_normalized, re.IGNORECASE):
-                # Found exact regex match - return immediately
-                # Since patterns are sorted by length, this is the most specific match
-                return True, 1.0, pattern
-        except re.error:
-            # Invalid regex, fall back to fuzzy match
-            pass
+    for pattern, pattern_normalized in zip(sorted_patterns, _normalized_patterns(sorted_patterns)):
+        # Regex per pattern only if they couldn't be combined above
+        # (None means invalid regex: fuzzy match only)
+        compiled = None if combined is not None else _compile_pattern(pattern)
+        if compiled is not None and compiled.search(text_normalized):
+            # Found exact regex match - return immediately
+            # Since patterns are sorted by length, this is the most specific match
+            return True, 1.0, pattern
 
         # Fuzzy match as fallback
-        score = fuzzy_match_score(text, pattern)
+        score = _fuzzy_match_normalized(text_normalized, pattern_normalized, best_score)
         if score > best_score:
             best_score = score
             best_pattern = pattern
@@ -362,26 +471,23 @@ def extract_winner_from_text(
                 return winner, 1.0
 
     # Strategy 2: Fuzzy text matching
+    text_normalized = normalize_text(text)
     best_option = None
     best_score = 0.0
 
     for option in options:
-        # Extract just the key part of option (before " - ")
-        # e.g., "Cowboy Carter - Beyoncé" -> ["Cowboy Carter", "Beyoncé"]
-        # But don't split numeric ranges like "41-60"
-        if _NUMERIC_RANGE_RE.match(option.strip()):
-            option_parts = [option]
-        else:
-            option_parts = [part.strip() for part in option.split('-')]
-
         # Check each part for a match
-        for part in option_parts:
-            score = fuzzy_match_score(text, part)
+        for part in _normalized_option_parts(option):
+            score = _fuzzy_match_normalized(text_normalized, part, best_score)
 
             if score > best_score:
                 best_score = score
                 best_option = option
 
+        if best_score >= 1.0:
+            # Exact substring match - no later option can score higher
+            break
+
     if best_score >= threshold:
         return best_option, best_score
 
@@ -410,6 +516,23 @@ def extract_winner_with_patterns(
         - confidence: Match confidence (0.0 - 1.0)
         - is_resolution_text: True if text matches resolution patterns
     """
+    return _extract_winner_with_patterns(
+        text, tuple(options), tuple(resolve_patterns), threshold
+    )
+
+
+@lru_cache(maxsize=512)
+def _extract_winner_with_patterns(
+    text: str,
+    options: Tuple[str, ...],
+    resolve_patterns: Tuple[str, ...],
+    threshold: float
+) -> Tuple[Optional[str], float, bool]:
+    """extract_winner_with_patterns, memoized on its (hashable) arguments
+
+    Live transcription repeats the same line (interim then final result)
+    for every open bet, so identical calls are common.
+    """
     # Check if this is a resolution announcement
     is_resolution, pattern_confidence, _ = match_trigger_patterns(
         text, resolve_patterns, threshold=0.6